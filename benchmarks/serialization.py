@@ -0,0 +1,122 @@
+"""Per-endpoint response encoding: response_model validation + stdlib json against DTOResponse.
+
+Builds representative DTOs in memory (no database needed) and runs them
+through exactly what FastAPI does for each route, `serialize_response` with
+the route's response field followed by `JSONResponse`, and through
+`DTOResponse`. Also checks that both produce the same JSON document.
+
+    python -m benchmarks.serialization [--items 100] [--repeat 200]
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+
+from src.application.style.dto import ResponseStyleDTO
+from src.application.tag.dto import ResponseTagDTO, ResponsePopularTagsDTO, ResponseWorkoutTagDTO
+from src.application.workout.dto import WorkoutCardResponseDTO, WorkoutResponseDTO, WorkoutSearchResponseDTO
+from src.domain.entities.pagination import PaginatedResponseDTO
+from src.domain.value_objects.workout import LevelsEnum
+from src.presentation.api.endpoints import tag, workout
+from src.presentation.api.responses import DTOResponse
+
+DESCRIPTION = 'Step, turn and hold the pose. ' * 20
+
+
+def _tags(i: int) -> list:
+    return [ResponseWorkoutTagDTO(id=i * 3 + k, name=f'tag-{i * 3 + k}') for k in range(3)]
+
+
+def _workout_fields(i: int) -> dict:
+    return dict(
+        id=i, name=f'workout-{i}', calories=100 + i, duration=10 + i % 50, level=LevelsEnum.BEGINNER,
+        thumbnail_image=f'/media/thumb-{i}.png', author_name=f'author-{i % 97}', views_count=i * 13,
+        style_id=1 + i % 10, tags=_tags(i)
+    )
+
+
+def _style(i: int) -> ResponseStyleDTO:
+    return ResponseStyleDTO(id=1 + i % 10, name=f'style-{1 + i % 10}', image_url='/media/style.png')
+
+
+def _card(i: int) -> WorkoutCardResponseDTO:
+    return WorkoutCardResponseDTO(style=_style(i), **_workout_fields(i))
+
+
+def _detail(i: int) -> WorkoutResponseDTO:
+    return WorkoutResponseDTO(description=DESCRIPTION, dance_video=f'/media/video-{i}.mp4', **_workout_fields(i))
+
+
+def _search_hit(i: int) -> WorkoutSearchResponseDTO:
+    return WorkoutSearchResponseDTO(
+        description=DESCRIPTION, dance_video=f'/media/video-{i}.mp4', style=_style(i),
+        rank=1 / (i + 1), name_highlight=f'<mark>workout</mark>-{i}',
+        description_highlight='Step, <mark>turn</mark> and hold', **_workout_fields(i)
+    )
+
+
+def _tag(i: int) -> ResponseTagDTO:
+    return ResponseTagDTO(id=i, name=f'tag-{i}', usages=1000 - i)
+
+
+def samples(items: int) -> dict:
+    def page(factory, cls=PaginatedResponseDTO, **extra):
+        return cls(items=[factory(i) for i in range(items)], total_count=10_000, page=1, page_size=items, **extra)
+
+    return {
+        '/workouts/list/paginated': page(_card),
+        '/workouts/trending': page(_card),
+        '/workouts/search': page(_search_hit),
+        '/workouts/{workout_id}': _detail(1),
+        '/tags/autocomplete': [_tag(i) for i in range(min(items, 50))],
+        '/tags/search': [_tag(i) for i in range(min(items, 100))],
+        '/tags/{tag_id}': _tag(1),
+        '/tags/list/paginated': page(_tag),
+        '/tags/list/popular': page(_tag, ResponsePopularTagsDTO, version='a1b2c3'),
+    }
+
+
+def _route(path: str):
+    routes = workout.router.routes + tag.router.routes
+    return next(route for route in routes if route.path == path and 'GET' in route.methods)
+
+
+async def _validated(field, content) -> bytes:
+    return JSONResponse(await serialize_response(field=field, response_content=content)).body
+
+
+def _median_us(fn, repeat: int) -> float:
+    samples_ = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples_.append((time.perf_counter() - started) * 1_000_000)
+    return statistics.median(samples_)
+
+
+def main(items: int, repeat: int) -> None:
+    loop = asyncio.new_event_loop()
+    print(f"items per page={items} repeat={repeat} (median µs per response)")
+    print(f"{'endpoint':<28}{'validate+json':>15}{'DTOResponse':>13}{'speedup':>9}  same JSON")
+    for path, content in samples(items).items():
+        field = _route(path).response_field
+        legacy_body = loop.run_until_complete(_validated(field, content))
+        fast_body = DTOResponse(content).body
+        same = json.loads(legacy_body) == json.loads(fast_body)
+
+        legacy = _median_us(lambda: loop.run_until_complete(_validated(field, content)), repeat)
+        fast = _median_us(lambda: DTOResponse(content).body, repeat)
+        print(f"{path:<28}{legacy:>15.0f}{fast:>13.0f}{legacy / fast:>8.1f}x  {'yes' if same else 'NO'}")
+    loop.close()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--items', type=int, default=100)
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+    main(args.items, args.repeat)
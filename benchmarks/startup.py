@@ -0,0 +1,146 @@
+"""Worker cold start: import time per module and time to first request.
+
+Every sample runs in a fresh interpreter, so only the OS page cache is warm.
+
+    python -m benchmarks.startup [--runs 5] [--top 25]
+    python -m benchmarks.startup --first-request [--path /openapi.json] [--lifespan off]
+    python -m benchmarks.startup --budget-ms 1500
+
+Exits with 1 when the median import of the app is over `--budget-ms`, or when
+a module that should only load on first use (DEFERRED_MODULES) is imported
+with the app. `--lifespan off` measures a server that skips start-up work,
+for machines without Postgres.
+"""
+import argparse
+import http.client
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+APP_MODULE = 'src.main.web'
+# Loaded on first use, see TrendingService.score and the password context.
+DEFERRED_MODULES = ('numpy', 'passlib', 'bcrypt')
+
+_PROBE = f"""
+import sys, time
+started = time.perf_counter()
+import {APP_MODULE}
+elapsed = time.perf_counter() - started
+print(elapsed, ','.join(name for name in {DEFERRED_MODULES!r} if name in sys.modules))
+"""
+
+
+def import_time() -> Tuple[float, List[str]]:
+    """Seconds to import the app, and the deferred modules it pulled in."""
+    output = subprocess.run([sys.executable, '-c', _PROBE], capture_output=True, text=True, check=True).stdout
+    elapsed, _, loaded = output.splitlines()[-1].partition(' ')
+    return float(elapsed), [name for name in loaded.split(',') if name]
+
+
+def module_costs() -> Dict[str, Tuple[int, int]]:
+    """Self and cumulative import time in µs per module, from `-X importtime`."""
+    stderr = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {APP_MODULE}'],
+        capture_output=True, text=True, check=True
+    ).stderr
+    costs = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        costs[name.strip()] = (int(self_us), int(cumulative_us))
+    return costs
+
+
+def report_modules(top: int) -> None:
+    costs = module_costs()
+    print(f"{'module':<60}{'self ms':>10}{'cumulative ms':>15}")
+    for name, (self_us, cumulative_us) in sorted(costs.items(), key=lambda item: -item[1][0])[:top]:
+        print(f"{name:<60}{self_us / 1000:>10.1f}{cumulative_us / 1000:>15.1f}")
+
+    packages = defaultdict(int)
+    for name, (self_us, _) in costs.items():
+        root = name.split('.')[0]
+        packages['.'.join(name.split('.')[:2]) if root == 'src' else root] += self_us
+    print(f"\n{'package (self time summed)':<60}{'ms':>10}")
+    for package, self_us in sorted(packages.items(), key=lambda item: -item[1])[:top]:
+        print(f"{package:<60}{self_us / 1000:>10.1f}")
+    print(f"\n{len(costs)} modules, {sum(self_us for self_us, _ in costs.values()) / 1000:.0f} ms in total")
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def first_request_time(path: str, lifespan: str, timeout: float = 30.0) -> Optional[float]:
+    """Seconds from spawning a single worker until `path` answers, None if the server died."""
+    port = _free_port()
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, '-m', 'uvicorn', f'{APP_MODULE}:app', '--port', str(port),
+         '--lifespan', lifespan, '--log-level', 'warning'],
+        env=os.environ.copy()
+    )
+    try:
+        while time.perf_counter() - started < timeout:
+            if server.poll() is not None:
+                return None
+            connection = http.client.HTTPConnection('127.0.0.1', port, timeout=timeout)
+            try:
+                connection.request('GET', path)
+                connection.getresponse().read()
+                return time.perf_counter() - started
+            except OSError:
+                time.sleep(0.01)
+            finally:
+                connection.close()
+        return None
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main(runs: int, top: int, first_request: bool, path: str, lifespan: str, budget_ms: Optional[float]) -> int:
+    samples = [import_time() for _ in range(runs)]
+    median_ms = statistics.median(elapsed for elapsed, _ in samples) * 1000
+    deferred = sorted({name for _, loaded in samples for name in loaded})
+    print(f"import {APP_MODULE}: median {median_ms:.0f} ms over {runs} runs "
+          f"(min {min(elapsed for elapsed, _ in samples) * 1000:.0f} ms)\n")
+    report_modules(top)
+
+    if first_request:
+        times = [first_request_time(path, lifespan) for _ in range(runs)]
+        answered = [elapsed for elapsed in times if elapsed is not None]
+        if answered:
+            print(f"\nfirst response to GET {path}: median {statistics.median(answered) * 1000:.0f} ms "
+                  f"over {len(answered)} runs")
+        if len(answered) < runs:
+            print(f"{runs - len(answered)} servers exited or never answered", file=sys.stderr)
+
+    failed = False
+    if deferred:
+        print(f"\nFAIL: imported with the app, should load on first use: {', '.join(deferred)}")
+        failed = True
+    if budget_ms is not None and median_ms > budget_ms:
+        print(f"\nFAIL: median import {median_ms:.0f} ms is over the {budget_ms:.0f} ms budget")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--top', type=int, default=25)
+    parser.add_argument('--first-request', action='store_true')
+    parser.add_argument('--path', default='/openapi.json')
+    parser.add_argument('--lifespan', choices=('on', 'off'), default='on')
+    parser.add_argument('--budget-ms', type=float)
+    args = parser.parse_args()
+    sys.exit(main(args.runs, args.top, args.first_request, args.path, args.lifespan, args.budget_ms))
@@ -0,0 +1,87 @@
+"""Tag substring search on a synthetic 1M-row table, with and without the trigram index.
+
+Runs against the database from the app settings and only touches its own
+`bench_tags` table, which is dropped afterwards.
+
+    python -m benchmarks.tag_trigram_search [--rows 1000000] [--repeat 20]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+import sqlalchemy as sa
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from src.main.config import settings
+
+QUERIES = ('salsa', 'hip', 'cardio-12', 'zumba fit', 'xq7')
+
+CREATE_TABLE = sa.text("""
+    CREATE UNLOGGED TABLE bench_tags AS
+    SELECT i AS id,
+           (ARRAY['salsa', 'hiphop', 'cardio', 'zumba', 'stretch', 'ballet', 'krump', 'vogue'])[1 + i % 8]
+           || '-' || substr(md5(i::text), 1, 6) || '-' || (i % 997) AS name,
+           (i * 7919) % 5000 AS usages
+    FROM generate_series(1, :rows) AS i
+""")
+
+LEGACY_SEARCH = sa.text("SELECT id, name, usages FROM bench_tags WHERE name ILIKE :pattern")
+
+RANKED_SEARCH = sa.text("""
+    SELECT id, name, usages FROM bench_tags
+    WHERE name ILIKE :pattern OR name % :query
+    ORDER BY similarity(name, :query) DESC, usages DESC, id
+    LIMIT 20
+""")
+
+
+async def _measure(conn, stmt, repeat: int) -> dict:
+    timings = {}
+    for query in QUERIES:
+        samples = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            await conn.execute(stmt, {'pattern': f'%{query}%', 'query': query})
+            samples.append((time.perf_counter() - started) * 1000)
+        timings[query] = statistics.median(samples)
+    return timings
+
+
+async def main(rows: int, repeat: int) -> None:
+    engine = create_async_engine(settings.db.db_uri)
+    async with engine.connect() as conn:
+        await conn.execute(sa.text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await conn.execute(sa.text("DROP TABLE IF EXISTS bench_tags"))
+        await conn.execute(CREATE_TABLE, {'rows': rows})
+        await conn.execute(sa.text("ANALYZE bench_tags"))
+        await conn.commit()
+        try:
+            legacy = await _measure(conn, LEGACY_SEARCH, repeat)
+            unindexed = await _measure(conn, RANKED_SEARCH, repeat)
+
+            started = time.perf_counter()
+            await conn.execute(sa.text(
+                "CREATE INDEX bench_tags_name_trgm ON bench_tags USING gin (name gin_trgm_ops)"
+            ))
+            await conn.execute(sa.text("ANALYZE bench_tags"))
+            await conn.commit()
+            index_build = time.perf_counter() - started
+            indexed = await _measure(conn, RANKED_SEARCH, repeat)
+        finally:
+            await conn.execute(sa.text("DROP TABLE IF EXISTS bench_tags"))
+            await conn.commit()
+    await engine.dispose()
+
+    print(f"rows={rows} repeat={repeat} trigram index build={index_build:.1f}s")
+    print(f"{'query':<12}{'ILIKE, no limit':>18}{'ranked, no index':>18}{'ranked, trgm':>16}  (median ms)")
+    for query in QUERIES:
+        print(f"{query:<12}{legacy[query]:>18.2f}{unindexed[query]:>18.2f}{indexed[query]:>16.2f}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.repeat))
@@ -0,0 +1,98 @@
+"""Concurrent view counting: the old per-request UPDATE path against the write-behind buffer.
+
+Needs a database from the app settings with some workouts in it. Most views
+go to a single hot workout, the rest are spread over the others; view counts
+of the sampled workouts are restored afterwards.
+
+    python -m benchmarks.views_load_test [--seconds 10] [--concurrency 64] [--hot-share 0.8]
+"""
+import argparse
+import asyncio
+import random
+import time
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import selectinload
+
+from src.adapters.database.models import WorkoutOrm
+from src.adapters.database.provider import get_workout_repository
+from src.adapters.database.views_buffer import WorkoutViewsBuffer
+from src.main.config import settings
+
+
+async def legacy_view(session_factory, workout_id: int) -> None:
+    async with session_factory() as session:
+        await get_workout_repository(session).get(workout_id)
+        result = await session.execute(
+            select(WorkoutOrm).where(WorkoutOrm.id == workout_id).options(selectinload(WorkoutOrm.tags))
+        )
+        result.scalar_one().views_count += 1
+        await session.flush()
+        await session.commit()
+
+
+def buffered_view(buffer: WorkoutViewsBuffer):
+    async def view(session_factory, workout_id: int) -> None:
+        async with session_factory() as session:
+            await get_workout_repository(session).get_views_count(workout_id)
+        buffer.record(workout_id)
+
+    return view
+
+
+async def _drive(view, session_factory, workout_ids, seconds: float, concurrency: int, hot_share: float) -> int:
+    deadline = time.perf_counter() + seconds
+    hot, rest = workout_ids[0], workout_ids[1:] or workout_ids
+
+    async def client() -> int:
+        done = 0
+        while time.perf_counter() < deadline:
+            workout_id = hot if random.random() < hot_share else random.choice(rest)
+            await view(session_factory, workout_id)
+            done += 1
+        return done
+
+    return sum(await asyncio.gather(*(client() for _ in range(concurrency))))
+
+
+async def main(seconds: float, concurrency: int, hot_share: float) -> None:
+    engine = create_async_engine(settings.db.db_uri, pool_size=concurrency, max_overflow=0)
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async with session_factory() as session:
+        rows = (await session.execute(select(WorkoutOrm.id, WorkoutOrm.views_count).limit(100))).all()
+    if not rows:
+        raise SystemExit("No workouts to view, seed the database first.")
+    workout_ids = [row.id for row in rows]
+
+    try:
+        legacy = await _drive(legacy_view, session_factory, workout_ids, seconds, concurrency, hot_share)
+
+        buffer = WorkoutViewsBuffer(session_factory, flush_interval=settings.views.flush_interval_ms / 1000)
+        await buffer.start()
+        buffered = await _drive(buffered_view(buffer), session_factory, workout_ids, seconds, concurrency, hot_share)
+        started = time.perf_counter()
+        await buffer.stop()
+        final_flush = (time.perf_counter() - started) * 1000
+    finally:
+        async with session_factory() as session:
+            for row in rows:
+                await session.execute(
+                    update(WorkoutOrm).where(WorkoutOrm.id == row.id).values(views_count=row.views_count)
+                )
+            await session.commit()
+        await engine.dispose()
+
+    print(f"workouts={len(workout_ids)} concurrency={concurrency} hot share={hot_share:.0%} {seconds:g}s per run")
+    print(f"{'per-request UPDATE':<22}{legacy / seconds:>10.0f} views/s")
+    print(f"{'write-behind buffer':<22}{buffered / seconds:>10.0f} views/s  (final flush {final_flush:.1f} ms)")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--seconds', type=float, default=10)
+    parser.add_argument('--concurrency', type=int, default=64)
+    parser.add_argument('--hot-share', type=float, default=0.8)
+    args = parser.parse_args()
+    asyncio.run(main(args.seconds, args.concurrency, args.hot_share))
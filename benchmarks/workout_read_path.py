@@ -0,0 +1,143 @@
+"""Workout list reads: ORM entities + asdict against Core rows mapped straight to DTOs.
+
+Seeds 10k workouts into a throwaway `bench_read_path` schema of the database
+from the app settings, then times both read paths per page size and records
+the peak Python memory allocated per call with tracemalloc, in separate
+untimed runs.
+
+    python -m benchmarks.workout_read_path [--workouts 10000] [--repeat 20]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import tracemalloc
+from dataclasses import asdict
+
+import sqlalchemy as sa
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import selectinload
+
+from src.adapters.database.common.pagination import paginate
+from src.adapters.database.common.workout_query import workout_sort_order
+from src.adapters.database.config import Base
+from src.adapters.database.models import WorkoutOrm
+from src.adapters.database.readers.workout_reader import WorkoutReaderImpl
+from src.adapters.database.repositories.workout_repository import WorkoutRepositoryImpl
+from src.application.workout.dto import WorkoutResponseStyleDTO
+from src.domain.entities.workout import WorkoutFilter
+from src.main.config import settings
+
+SCHEMA = 'bench_read_path'
+PAGE_SIZES = (20, 100, 10_000)
+
+SEED = (
+    "INSERT INTO styles (id, name, image_url) "
+    "SELECT i, 'style-' || i, '/media/style-' || i || '.png' FROM generate_series(1, 10) AS i",
+    "INSERT INTO tags (id, name, usages) SELECT i, 'tag-' || i, 0 FROM generate_series(1, 200) AS i",
+    """
+    INSERT INTO workouts (id, name, calories, duration, level, description, dance_video,
+                          thumbnail_image, author_name, views_count, style_id)
+    SELECT i, 'workout-' || i, 100 + i % 400, 10 + i % 50,
+           (ARRAY['BEGINNER', 'INTERMEDIATE', 'IMPOSSIBLE'])[1 + i % 3]::levelsenum,
+           repeat('Step, turn and hold the pose. ', 20), '/media/video-' || i || '.mp4',
+           '/media/thumb-' || i || '.png', 'author-' || i % 97, i * 13 % 10000, 1 + i % 10
+    FROM generate_series(1, :workouts) AS i
+    """,
+    """
+    INSERT INTO workout_tag_association (workout_id, tag_id)
+    SELECT w, 1 + (w * k * 7) % 200 FROM generate_series(1, :workouts) AS w, generate_series(1, 3) AS k
+    ON CONFLICT DO NOTHING
+    """,
+)
+
+
+async def orm_path(session_factory, page_size: int) -> list:
+    # The same ordering and exact window count as list_cards, so only the mapping differs.
+    async with session_factory() as session:
+        stmt = select(WorkoutOrm).options(
+            selectinload(WorkoutOrm.tags),
+            selectinload(WorkoutOrm.style)
+        ).order_by(*workout_sort_order(WorkoutFilter().sort))
+        workouts, _ = await paginate(session, stmt, 1, page_size)
+        return [
+            WorkoutResponseStyleDTO(**asdict(WorkoutRepositoryImpl._map_to_db_workout(w, True)))
+            for w in workouts
+        ]
+
+
+async def core_path(session_factory, page_size: int) -> list:
+    async with session_factory() as session:
+        cards, _ = await WorkoutReaderImpl(session).list_cards(WorkoutFilter(), 1, page_size)
+        return cards
+
+
+async def _measure(path, session_factory, page_size: int, repeat: int) -> tuple:
+    # Timed with tracing off, since tracemalloc slows every allocation several times over.
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await path(session_factory, page_size)
+        timings.append(time.perf_counter() - started)
+
+    peaks = []
+    tracemalloc.start()
+    try:
+        for _ in range(max(1, repeat // 4)):
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            await path(session_factory, page_size)
+            peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+    finally:
+        tracemalloc.stop()
+    return statistics.median(timings), statistics.median(peaks)
+
+
+async def main(workouts: int, repeat: int) -> None:
+    # The translate map points create_all and every model query at the bench schema; with
+    # only a search path, create_all would find the public tables and seed those instead.
+    engine = create_async_engine(
+        settings.db.db_uri,
+        connect_args={'server_settings': {'search_path': f'{SCHEMA}, public'}},
+        execution_options={'schema_translate_map': {None: SCHEMA}}
+    )
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.execute(sa.text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await conn.execute(sa.text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await conn.execute(sa.text(f"CREATE SCHEMA {SCHEMA}"))
+        await conn.run_sync(Base.metadata.create_all)
+        for stmt in SEED:
+            await conn.execute(sa.text(stmt), {'workouts': workouts})
+        await conn.execute(sa.text("ANALYZE"))
+
+    results = {}
+    try:
+        for page_size in PAGE_SIZES:
+            # One warm-up call per path so statement compilation is cached for both.
+            await orm_path(session_factory, page_size)
+            await core_path(session_factory, page_size)
+            results[page_size] = (
+                await _measure(orm_path, session_factory, page_size, repeat),
+                await _measure(core_path, session_factory, page_size, repeat),
+            )
+    finally:
+        async with engine.begin() as conn:
+            await conn.execute(sa.text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await engine.dispose()
+
+    print(f"workouts={workouts} repeat={repeat} (median per call)")
+    print(f"{'page size':<10}{'ORM rows/s':>14}{'Core rows/s':>14}{'ORM peak KiB':>15}{'Core peak KiB':>15}")
+    for page_size, ((orm_time, orm_peak), (core_time, core_peak)) in results.items():
+        rows = min(page_size, workouts)
+        print(f"{page_size:<10}{rows / orm_time:>14.0f}{rows / core_time:>14.0f}"
+              f"{orm_peak / 1024:>15.0f}{core_peak / 1024:>15.0f}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--workouts', type=int, default=10_000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.workouts, args.repeat))
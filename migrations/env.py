@@ -4,7 +4,7 @@ from sqlalchemy import pool
 from alembic import context
 
 from src.adapters.database.config import Base
-from src.main.web import settings
+from src.main.config import settings
 from src.adapters.database.models import *
 
 # Alembic Config object
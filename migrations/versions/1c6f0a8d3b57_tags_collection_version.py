@@ -0,0 +1,32 @@
+"""tags collection version
+
+Revision ID: 1c6f0a8d3b57
+Revises: 7a3e9c5d1b24
+Create Date: 2026-10-19 19:42:08.316254
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1c6f0a8d3b57'
+down_revision: Union[str, None] = '7a3e9c5d1b24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Only statements that can change the tag set or names bump the version;
+    # usage counter updates would serialize every workout write on the row.
+    op.execute("""
+        CREATE TRIGGER tags_collection_touch
+        AFTER INSERT OR UPDATE OF name OR DELETE ON tags
+        FOR EACH STATEMENT EXECUTE FUNCTION table_counters_touch()
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS tags_collection_touch ON tags")
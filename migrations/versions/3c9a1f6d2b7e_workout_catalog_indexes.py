@@ -0,0 +1,38 @@
+"""workout catalog indexes
+
+Revision ID: 3c9a1f6d2b7e
+Revises: d03ac41a8ff9
+Create Date: 2026-10-19 10:12:41.503218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c9a1f6d2b7e'
+down_revision: Union[str, None] = 'd03ac41a8ff9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_workouts_style_id_level_duration',
+        'workouts',
+        ['style_id', 'level', 'duration'],
+        unique=False
+    )
+    op.create_index(
+        'ix_workout_tag_association_tag_id_workout_id',
+        'workout_tag_association',
+        ['tag_id', 'workout_id'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_workout_tag_association_tag_id_workout_id', table_name='workout_tag_association')
+    op.drop_index('ix_workouts_style_id_level_duration', table_name='workouts')
@@ -0,0 +1,40 @@
+"""workouts style keyset indexes
+
+Revision ID: 4f8b2c6e0d13
+Revises: 9d4c7b2e1f08
+Create Date: 2026-10-19 16:02:11.804317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f8b2c6e0d13'
+down_revision: Union[str, None] = '9d4c7b2e1f08'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Serve one page of a style's workouts, newest or most viewed first, from
+    # an index range instead of sorting every workout of the style.
+    op.create_index(
+        'ix_workouts_style_id_id',
+        'workouts',
+        ['style_id', 'id'],
+        unique=False
+    )
+    op.create_index(
+        'ix_workouts_style_id_views_count_id',
+        'workouts',
+        ['style_id', 'views_count', 'id'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_workouts_style_id_views_count_id', table_name='workouts')
+    op.drop_index('ix_workouts_style_id_id', table_name='workouts')
@@ -0,0 +1,121 @@
+"""workouts full text search
+
+Revision ID: 5b0e8d3f6a21
+Revises: a7d25e9c1f40
+Create Date: 2026-10-19 12:31:52.077463
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b0e8d3f6a21'
+down_revision: Union[str, None] = 'a7d25e9c1f40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('workouts', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+
+    # Weights: name A, tag names B, author C, description D. The 'simple'
+    # configuration does no stemming, so mixed-language content is matched as typed.
+    op.execute("""
+        CREATE FUNCTION workout_search_document(
+            p_workout_id integer, p_name text, p_author_name text, p_description text
+        ) RETURNS tsvector AS $$
+            SELECT setweight(to_tsvector('simple', coalesce(p_name, '')), 'A')
+                || setweight(to_tsvector('simple', coalesce((
+                       SELECT string_agg(t.name, ' ')
+                       FROM workout_tag_association a
+                       JOIN tags t ON t.id = a.tag_id
+                       WHERE a.workout_id = p_workout_id
+                   ), '')), 'B')
+                || setweight(to_tsvector('simple', coalesce(p_author_name, '')), 'C')
+                || setweight(to_tsvector('simple', coalesce(p_description, '')), 'D')
+        $$ LANGUAGE sql STABLE
+    """)
+
+    op.execute("""
+        CREATE FUNCTION workouts_search_vector_refresh() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector := workout_search_document(NEW.id, NEW.name, NEW.author_name, NEW.description);
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER workouts_search_vector
+        BEFORE INSERT OR UPDATE OF name, author_name, description ON workouts
+        FOR EACH ROW EXECUTE FUNCTION workouts_search_vector_refresh()
+    """)
+
+    op.execute("""
+        CREATE FUNCTION workout_tags_search_vector_refresh() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE workouts w
+                SET search_vector = workout_search_document(w.id, w.name, w.author_name, w.description)
+                WHERE w.id IN (SELECT workout_id FROM new_rows);
+            ELSE
+                UPDATE workouts w
+                SET search_vector = workout_search_document(w.id, w.name, w.author_name, w.description)
+                WHERE w.id IN (SELECT workout_id FROM old_rows);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER workout_tags_search_vector_insert
+        AFTER INSERT ON workout_tag_association
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION workout_tags_search_vector_refresh()
+    """)
+    op.execute("""
+        CREATE TRIGGER workout_tags_search_vector_delete
+        AFTER DELETE ON workout_tag_association
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION workout_tags_search_vector_refresh()
+    """)
+
+    op.execute("""
+        CREATE FUNCTION tags_search_vector_refresh() RETURNS trigger AS $$
+        BEGIN
+            UPDATE workouts w
+            SET search_vector = workout_search_document(w.id, w.name, w.author_name, w.description)
+            WHERE w.id IN (SELECT workout_id FROM workout_tag_association WHERE tag_id = NEW.id);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER tags_search_vector
+        AFTER UPDATE OF name ON tags
+        FOR EACH ROW WHEN (OLD.name IS DISTINCT FROM NEW.name)
+        EXECUTE FUNCTION tags_search_vector_refresh()
+    """)
+
+    op.execute("""
+        UPDATE workouts
+        SET search_vector = workout_search_document(id, name, author_name, description)
+    """)
+    op.create_index('ix_workouts_search_vector', 'workouts', ['search_vector'], unique=False,
+                    postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_workouts_search_vector', table_name='workouts')
+    op.execute("DROP TRIGGER IF EXISTS tags_search_vector ON tags")
+    op.execute("DROP TRIGGER IF EXISTS workout_tags_search_vector_delete ON workout_tag_association")
+    op.execute("DROP TRIGGER IF EXISTS workout_tags_search_vector_insert ON workout_tag_association")
+    op.execute("DROP TRIGGER IF EXISTS workouts_search_vector ON workouts")
+    op.execute("DROP FUNCTION IF EXISTS tags_search_vector_refresh()")
+    op.execute("DROP FUNCTION IF EXISTS workout_tags_search_vector_refresh()")
+    op.execute("DROP FUNCTION IF EXISTS workouts_search_vector_refresh()")
+    op.execute("DROP FUNCTION IF EXISTS workout_search_document(integer, text, text, text)")
+    op.drop_column('workouts', 'search_vector')
@@ -0,0 +1,130 @@
+"""catalog row versions
+
+Revision ID: 7a3e9c5d1b24
+Revises: 4f8b2c6e0d13
+Create Date: 2026-10-19 16:41:57.130962
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a3e9c5d1b24'
+down_revision: Union[str, None] = '4f8b2c6e0d13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+VERSIONED_TABLES = ('styles', 'tags', 'workouts', 'avatars')
+# Tables whose lists are served with a collection ETag.
+COLLECTION_TABLES = ('styles', 'avatars')
+
+
+def upgrade() -> None:
+    for table in VERSIONED_TABLES:
+        op.add_column(table, sa.Column('version', sa.BigInteger(), server_default='1', nullable=False))
+        op.add_column(table, sa.Column('updated_at', sa.DateTime(timezone=True),
+                                       server_default=sa.text('now()'), nullable=False))
+    # Any real change to a row bumps its version; no-op updates leave it alone.
+    op.execute("""
+        CREATE FUNCTION row_version_bump() RETURNS trigger AS $$
+        BEGIN
+            IF NEW IS DISTINCT FROM OLD THEN
+                NEW.version := OLD.version + 1;
+                NEW.updated_at := now();
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    for table in VERSIONED_TABLES:
+        op.execute(f"""
+            CREATE TRIGGER {table}_version_bump
+            BEFORE UPDATE ON {table}
+            FOR EACH ROW EXECUTE FUNCTION row_version_bump()
+        """)
+
+    # A workout's detail lists its tags, so adding or removing one is a change of the workout.
+    op.execute("""
+        CREATE FUNCTION workouts_tags_touch() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE workouts SET version = version + 1
+                WHERE id IN (SELECT workout_id FROM new_rows);
+            ELSE
+                UPDATE workouts SET version = version + 1
+                WHERE id IN (SELECT workout_id FROM old_rows);
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER workout_tags_touch_insert
+        AFTER INSERT ON workout_tag_association
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION workouts_tags_touch()
+    """)
+    op.execute("""
+        CREATE TRIGGER workout_tags_touch_delete
+        AFTER DELETE ON workout_tag_association
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION workouts_tags_touch()
+    """)
+
+    # Collection versions live on the table_counters row. The row lock orders
+    # concurrent writers, so a reader can never see a later version while an
+    # earlier write is still uncommitted, which max(updated_at) cannot promise.
+    op.add_column('table_counters', sa.Column('version', sa.BigInteger(), server_default='0', nullable=False))
+    op.execute("""
+        CREATE FUNCTION table_counters_touch() RETURNS trigger AS $$
+        BEGIN
+            UPDATE table_counters SET version = version + 1 WHERE table_name = TG_TABLE_NAME;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        INSERT INTO table_counters (table_name, row_count)
+        SELECT 'avatars', count(*) FROM avatars
+        ON CONFLICT (table_name) DO NOTHING
+    """)
+    op.execute("""
+        CREATE TRIGGER avatars_counter_insert
+        AFTER INSERT ON avatars
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION table_counters_bump()
+    """)
+    op.execute("""
+        CREATE TRIGGER avatars_counter_delete
+        AFTER DELETE ON avatars
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION table_counters_bump()
+    """)
+    for table in COLLECTION_TABLES:
+        op.execute(f"""
+            CREATE TRIGGER {table}_collection_touch
+            AFTER INSERT OR UPDATE OR DELETE ON {table}
+            FOR EACH STATEMENT EXECUTE FUNCTION table_counters_touch()
+        """)
+
+
+def downgrade() -> None:
+    for table in COLLECTION_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_collection_touch ON {table}")
+    op.execute("DROP TRIGGER IF EXISTS avatars_counter_delete ON avatars")
+    op.execute("DROP TRIGGER IF EXISTS avatars_counter_insert ON avatars")
+    op.execute("DELETE FROM table_counters WHERE table_name = 'avatars'")
+    op.execute("DROP FUNCTION IF EXISTS table_counters_touch()")
+    op.drop_column('table_counters', 'version')
+
+    op.execute("DROP TRIGGER IF EXISTS workout_tags_touch_delete ON workout_tag_association")
+    op.execute("DROP TRIGGER IF EXISTS workout_tags_touch_insert ON workout_tag_association")
+    op.execute("DROP FUNCTION IF EXISTS workouts_tags_touch()")
+    for table in VERSIONED_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_version_bump ON {table}")
+        op.drop_column(table, 'updated_at')
+        op.drop_column(table, 'version')
+    op.execute("DROP FUNCTION IF EXISTS row_version_bump()")
@@ -0,0 +1,71 @@
+"""table counters
+
+Revision ID: 8e41b07c5a93
+Revises: 3c9a1f6d2b7e
+Create Date: 2026-10-19 11:02:17.318840
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e41b07c5a93'
+down_revision: Union[str, None] = '3c9a1f6d2b7e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COUNTED_TABLES = ('tags', 'workouts', 'styles')
+
+
+def upgrade() -> None:
+    op.create_table('table_counters',
+    sa.Column('table_name', sa.String(), nullable=False),
+    sa.Column('row_count', sa.BigInteger(), nullable=False, server_default='0'),
+    sa.PrimaryKeyConstraint('table_name')
+    )
+    # Statement-level triggers with transition tables: one counter update per
+    # INSERT/DELETE statement instead of one per row.
+    op.execute("""
+        CREATE FUNCTION table_counters_bump() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE table_counters
+                SET row_count = row_count + (SELECT count(*) FROM new_rows)
+                WHERE table_name = TG_TABLE_NAME;
+            ELSIF TG_OP = 'DELETE' THEN
+                UPDATE table_counters
+                SET row_count = row_count - (SELECT count(*) FROM old_rows)
+                WHERE table_name = TG_TABLE_NAME;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    for table in COUNTED_TABLES:
+        op.execute(f"""
+            CREATE TRIGGER {table}_counter_insert
+            AFTER INSERT ON {table}
+            REFERENCING NEW TABLE AS new_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION table_counters_bump()
+        """)
+        op.execute(f"""
+            CREATE TRIGGER {table}_counter_delete
+            AFTER DELETE ON {table}
+            REFERENCING OLD TABLE AS old_rows
+            FOR EACH STATEMENT EXECUTE FUNCTION table_counters_bump()
+        """)
+        op.execute(f"""
+            INSERT INTO table_counters (table_name, row_count)
+            SELECT '{table}', count(*) FROM {table}
+        """)
+
+
+def downgrade() -> None:
+    for table in COUNTED_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_counter_delete ON {table}")
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_counter_insert ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS table_counters_bump()")
+    op.drop_table('table_counters')
@@ -0,0 +1,82 @@
+"""workout trending
+
+Revision ID: 9d4c7b2e1f08
+Revises: e6a3d1b8c947
+Create Date: 2026-10-19 15:12:36.220517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d4c7b2e1f08'
+down_revision: Union[str, None] = 'e6a3d1b8c947'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE TABLE workout_view_events (
+            workout_id INTEGER NOT NULL,
+            viewed_at TIMESTAMP WITH TIME ZONE DEFAULT now() NOT NULL,
+            views INTEGER NOT NULL
+        ) PARTITION BY RANGE (viewed_at)
+    """)
+    # Catches rows when maintenance fell behind; it should stay empty.
+    op.execute("CREATE TABLE workout_view_events_default PARTITION OF workout_view_events DEFAULT")
+    # Creates daily partitions up to `days_ahead` days from today and drops
+    # the ones entirely older than `retention_days`. Safe to call repeatedly.
+    op.execute("""
+        CREATE FUNCTION workout_view_events_maintain(days_ahead integer, retention_days integer)
+        RETURNS void AS $$
+        DECLARE
+            day date;
+            partition record;
+        BEGIN
+            FOR day IN
+                SELECT generate_series(current_date, current_date + days_ahead, interval '1 day')::date
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE IF NOT EXISTS %I PARTITION OF workout_view_events FOR VALUES FROM (%L) TO (%L)',
+                    'workout_view_events_' || to_char(day, 'YYYYMMDD'), day, day + 1
+                );
+            END LOOP;
+            FOR partition IN
+                SELECT c.relname
+                FROM pg_inherits i
+                JOIN pg_class c ON c.oid = i.inhrelid
+                WHERE i.inhparent = 'workout_view_events'::regclass
+                  AND c.relname ~ '^workout_view_events_[0-9]{8}$'
+                  AND to_date(right(c.relname, 8), 'YYYYMMDD') < current_date - retention_days
+            LOOP
+                EXECUTE format('DROP TABLE %I', partition.relname);
+            END LOOP;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("SELECT workout_view_events_maintain(2, 30)")
+
+    op.create_table('workout_trending_scores',
+    sa.Column('workout_id', sa.Integer(), nullable=False),
+    sa.Column('style_id', sa.Integer(), nullable=False),
+    sa.Column('score', sa.Float(), nullable=False),
+    sa.Column('computed_at', sa.DateTime(timezone=True), nullable=False),
+    sa.ForeignKeyConstraint(['workout_id'], ['workouts.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('workout_id')
+    )
+    op.create_index('ix_workout_trending_scores_score', 'workout_trending_scores',
+                    [sa.text('score DESC'), 'workout_id'], unique=False)
+    op.create_index('ix_workout_trending_scores_style_id_score', 'workout_trending_scores',
+                    ['style_id', sa.text('score DESC'), 'workout_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_workout_trending_scores_style_id_score', table_name='workout_trending_scores')
+    op.drop_index('ix_workout_trending_scores_score', table_name='workout_trending_scores')
+    op.drop_table('workout_trending_scores')
+    op.execute("DROP FUNCTION IF EXISTS workout_view_events_maintain(integer, integer)")
+    op.execute("DROP TABLE IF EXISTS workout_view_events")
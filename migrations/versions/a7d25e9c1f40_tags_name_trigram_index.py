@@ -0,0 +1,37 @@
+"""tags name trigram index
+
+Revision ID: a7d25e9c1f40
+Revises: 8e41b07c5a93
+Create Date: 2026-10-19 11:47:05.921374
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d25e9c1f40'
+down_revision: Union[str, None] = '8e41b07c5a93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tags_name_trgm',
+            'tags',
+            ['name'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'name': 'gin_trgm_ops'},
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_tags_name_trgm', table_name='tags', postgresql_concurrently=True)
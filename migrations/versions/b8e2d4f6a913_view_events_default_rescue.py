@@ -0,0 +1,105 @@
+"""view events default partition rescue
+
+Revision ID: b8e2d4f6a913
+Revises: 1c6f0a8d3b57
+Create Date: 2026-10-19 21:06:51.482903
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8e2d4f6a913'
+down_revision: Union[str, None] = '1c6f0a8d3b57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("DROP FUNCTION workout_view_events_maintain(integer, integer)")
+    # Now also moves rows out of the default partition, which fills up when
+    # maintenance fell behind: a day partition cannot be created while the
+    # default holds rows of that day. The default is detached, rows past
+    # retention are dropped, the days of the rest get partitions, the rest is
+    # routed through the parent and the emptied default is attached back.
+    # Returns how many rows were moved so the caller can report it.
+    op.execute("""
+        CREATE FUNCTION workout_view_events_maintain(days_ahead integer, retention_days integer)
+        RETURNS integer AS $$
+        DECLARE
+            day date;
+            partition record;
+            rescued integer := 0;
+        BEGIN
+            IF EXISTS (SELECT 1 FROM workout_view_events_default) THEN
+                ALTER TABLE workout_view_events DETACH PARTITION workout_view_events_default;
+                DELETE FROM workout_view_events_default WHERE viewed_at < current_date - retention_days;
+                FOR day IN
+                    SELECT DISTINCT viewed_at::date FROM workout_view_events_default
+                LOOP
+                    EXECUTE format(
+                        'CREATE TABLE IF NOT EXISTS %I PARTITION OF workout_view_events FOR VALUES FROM (%L) TO (%L)',
+                        'workout_view_events_' || to_char(day, 'YYYYMMDD'), day, day + 1
+                    );
+                END LOOP;
+                INSERT INTO workout_view_events SELECT * FROM workout_view_events_default;
+                GET DIAGNOSTICS rescued = ROW_COUNT;
+                TRUNCATE workout_view_events_default;
+                ALTER TABLE workout_view_events ATTACH PARTITION workout_view_events_default DEFAULT;
+            END IF;
+            FOR day IN
+                SELECT generate_series(current_date, current_date + days_ahead, interval '1 day')::date
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE IF NOT EXISTS %I PARTITION OF workout_view_events FOR VALUES FROM (%L) TO (%L)',
+                    'workout_view_events_' || to_char(day, 'YYYYMMDD'), day, day + 1
+                );
+            END LOOP;
+            FOR partition IN
+                SELECT c.relname
+                FROM pg_inherits i
+                JOIN pg_class c ON c.oid = i.inhrelid
+                WHERE i.inhparent = 'workout_view_events'::regclass
+                  AND c.relname ~ '^workout_view_events_[0-9]{8}$'
+                  AND to_date(right(c.relname, 8), 'YYYYMMDD') < current_date - retention_days
+            LOOP
+                EXECUTE format('DROP TABLE %I', partition.relname);
+            END LOOP;
+            RETURN rescued;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP FUNCTION workout_view_events_maintain(integer, integer)")
+    op.execute("""
+        CREATE FUNCTION workout_view_events_maintain(days_ahead integer, retention_days integer)
+        RETURNS void AS $$
+        DECLARE
+            day date;
+            partition record;
+        BEGIN
+            FOR day IN
+                SELECT generate_series(current_date, current_date + days_ahead, interval '1 day')::date
+            LOOP
+                EXECUTE format(
+                    'CREATE TABLE IF NOT EXISTS %I PARTITION OF workout_view_events FOR VALUES FROM (%L) TO (%L)',
+                    'workout_view_events_' || to_char(day, 'YYYYMMDD'), day, day + 1
+                );
+            END LOOP;
+            FOR partition IN
+                SELECT c.relname
+                FROM pg_inherits i
+                JOIN pg_class c ON c.oid = i.inhrelid
+                WHERE i.inhparent = 'workout_view_events'::regclass
+                  AND c.relname ~ '^workout_view_events_[0-9]{8}$'
+                  AND to_date(right(c.relname, 8), 'YYYYMMDD') < current_date - retention_days
+            LOOP
+                EXECUTE format('DROP TABLE %I', partition.relname);
+            END LOOP;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
@@ -0,0 +1,52 @@
+"""tag changes notify
+
+Revision ID: c2f7a9e4d618
+Revises: 5b0e8d3f6a21
+Create Date: 2026-10-19 13:20:44.612905
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2f7a9e4d618'
+down_revision: Union[str, None] = '5b0e8d3f6a21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # NOTIFY is delivered on commit, so workers only see committed tag changes.
+    op.execute("""
+        CREATE FUNCTION tags_notify_change() RETURNS trigger AS $$
+        DECLARE
+            tag_row tags%ROWTYPE;
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                tag_row := OLD;
+            ELSE
+                tag_row := NEW;
+            END IF;
+            PERFORM pg_notify('tag_changes', json_build_object(
+                'op', TG_OP,
+                'id', tag_row.id,
+                'name', tag_row.name,
+                'usages', coalesce(tag_row.usages, 0)
+            )::text);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER tags_notify_change
+        AFTER INSERT OR UPDATE OF name, usages OR DELETE ON tags
+        FOR EACH ROW EXECUTE FUNCTION tags_notify_change()
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS tags_notify_change ON tags")
+    op.execute("DROP FUNCTION IF EXISTS tags_notify_change()")
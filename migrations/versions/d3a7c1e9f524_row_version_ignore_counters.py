@@ -0,0 +1,74 @@
+"""row versions ignore counter columns
+
+Revision ID: d3a7c1e9f524
+Revises: b8e2d4f6a913
+Create Date: 2026-10-19 22:14:08.517340
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3a7c1e9f524'
+down_revision: Union[str, None] = 'b8e2d4f6a913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Columns that are written without the row's rendered content changing: view
+# and usage counters, and the search document derived from other columns.
+# Bumping on them would move ETags the cached detail never follows.
+COUNTER_COLUMNS = {
+    'workouts': ('views_count', 'search_vector'),
+    'tags': ('usages',),
+}
+
+
+def upgrade() -> None:
+    # Trigger arguments name the columns left out of the comparison.
+    op.execute("""
+        CREATE OR REPLACE FUNCTION row_version_bump() RETURNS trigger AS $$
+        BEGIN
+            IF TG_NARGS = 0 THEN
+                IF NEW IS NOT DISTINCT FROM OLD THEN
+                    RETURN NEW;
+                END IF;
+            ELSIF to_jsonb(NEW) - TG_ARGV IS NOT DISTINCT FROM to_jsonb(OLD) - TG_ARGV THEN
+                RETURN NEW;
+            END IF;
+            NEW.version := OLD.version + 1;
+            NEW.updated_at := now();
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    for table, columns in COUNTER_COLUMNS.items():
+        arguments = ', '.join(f"'{column}'" for column in columns)
+        op.execute(f"DROP TRIGGER {table}_version_bump ON {table}")
+        op.execute(f"""
+            CREATE TRIGGER {table}_version_bump
+            BEFORE UPDATE ON {table}
+            FOR EACH ROW EXECUTE FUNCTION row_version_bump({arguments})
+        """)
+
+
+def downgrade() -> None:
+    for table in COUNTER_COLUMNS:
+        op.execute(f"DROP TRIGGER {table}_version_bump ON {table}")
+        op.execute(f"""
+            CREATE TRIGGER {table}_version_bump
+            BEFORE UPDATE ON {table}
+            FOR EACH ROW EXECUTE FUNCTION row_version_bump()
+        """)
+    op.execute("""
+        CREATE OR REPLACE FUNCTION row_version_bump() RETURNS trigger AS $$
+        BEGIN
+            IF NEW IS DISTINCT FROM OLD THEN
+                NEW.version := OLD.version + 1;
+                NEW.updated_at := now();
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
@@ -0,0 +1,86 @@
+"""tag usages triggers
+
+Revision ID: e6a3d1b8c947
+Revises: c2f7a9e4d618
+Create Date: 2026-10-19 14:05:12.408113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6a3d1b8c947'
+down_revision: Union[str, None] = 'c2f7a9e4d618'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # One grouped UPDATE per statement on the association table, which also
+    # covers rows removed by ON DELETE CASCADE from workouts, styles and tags.
+    # Tags are updated in id order so concurrent statements lock them in the same order.
+    op.execute("""
+        CREATE FUNCTION tags_usages_apply() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                UPDATE tags t SET usages = coalesce(t.usages, 0) + d.delta
+                FROM (SELECT tag_id, count(*) AS delta FROM new_rows GROUP BY tag_id ORDER BY tag_id) d
+                WHERE t.id = d.tag_id;
+            ELSIF TG_OP = 'DELETE' THEN
+                UPDATE tags t SET usages = greatest(coalesce(t.usages, 0) - d.delta, 0)
+                FROM (SELECT tag_id, count(*) AS delta FROM old_rows GROUP BY tag_id ORDER BY tag_id) d
+                WHERE t.id = d.tag_id;
+            ELSE
+                UPDATE tags t SET usages = greatest(coalesce(t.usages, 0) + d.delta, 0)
+                FROM (
+                    SELECT tag_id, sum(delta) AS delta
+                    FROM (
+                        SELECT tag_id, 1 AS delta FROM new_rows
+                        UNION ALL
+                        SELECT tag_id, -1 AS delta FROM old_rows
+                    ) changes
+                    GROUP BY tag_id
+                    HAVING sum(delta) <> 0
+                    ORDER BY tag_id
+                ) d
+                WHERE t.id = d.tag_id;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER workout_tags_usages_insert
+        AFTER INSERT ON workout_tag_association
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION tags_usages_apply()
+    """)
+    op.execute("""
+        CREATE TRIGGER workout_tags_usages_delete
+        AFTER DELETE ON workout_tag_association
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION tags_usages_apply()
+    """)
+    op.execute("""
+        CREATE TRIGGER workout_tags_usages_update
+        AFTER UPDATE ON workout_tag_association
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION tags_usages_apply()
+    """)
+    # Counters kept by hand so far may already have drifted.
+    op.execute("""
+        UPDATE tags t SET usages = (SELECT count(*) FROM workout_tag_association a WHERE a.tag_id = t.id)
+        WHERE t.usages IS DISTINCT FROM (SELECT count(*) FROM workout_tag_association a WHERE a.tag_id = t.id)
+    """)
+    op.alter_column('tags', 'usages', existing_type=sa.Integer(), server_default='0')
+
+
+def downgrade() -> None:
+    op.alter_column('tags', 'usages', existing_type=sa.Integer(), server_default=None)
+    op.execute("DROP TRIGGER IF EXISTS workout_tags_usages_update ON workout_tag_association")
+    op.execute("DROP TRIGGER IF EXISTS workout_tags_usages_delete ON workout_tag_association")
+    op.execute("DROP TRIGGER IF EXISTS workout_tags_usages_insert ON workout_tag_association")
+    op.execute("DROP FUNCTION IF EXISTS tags_usages_apply()")
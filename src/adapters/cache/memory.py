@@ -0,0 +1,82 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Sequence, Set, Tuple
+
+
+class MemoryCache:
+    """Per-process LRU cache with per-entry TTL and tag-based invalidation.
+
+    Values are kept as-is, not copied, so callers must treat them as
+    read-only. Expired entries are dropped lazily when read or when they
+    reach the LRU end. Each tag counts its invalidations, and `clear` counts
+    as one for every tag.
+    """
+
+    def __init__(self, max_entries: int = 10_000, clock: Callable[[], float] = time.monotonic):
+        self._entries: OrderedDict[str, Tuple[Any, float, Tuple[str, ...]]] = OrderedDict()
+        self._keys_by_tag: Dict[str, Set[str]] = {}
+        self._tag_generations: Dict[str, int] = {}
+        self._clears = 0
+        self._max_entries = max_entries
+        self._clock = clock
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at, _ = entry
+        if expires_at <= self._clock():
+            self._discard(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def generation(self, tags: Sequence[str]) -> Tuple[int, ...]:
+        return (self._clears, *(self._tag_generations.get(tag, 0) for tag in tags))
+
+    async def set(
+            self,
+            key: str,
+            value: Any,
+            ttl: float,
+            tags: Sequence[str] = (),
+            generation: Optional[Tuple[int, ...]] = None
+    ) -> None:
+        if generation is not None and generation != await self.generation(tags):
+            return
+        self._discard(key)
+        self._entries[key] = (value, self._clock() + ttl, tuple(tags))
+        for tag in tags:
+            self._keys_by_tag.setdefault(tag, set()).add(key)
+        while len(self._entries) > self._max_entries:
+            self._discard(next(iter(self._entries)))
+            self.evictions += 1
+
+    async def invalidate_tags(self, tags: Sequence[str]) -> None:
+        for tag in tags:
+            self._tag_generations[tag] = self._tag_generations.get(tag, 0) + 1
+            for key in self._keys_by_tag.pop(tag, ()):
+                self._discard(key)
+
+    async def clear(self) -> None:
+        self._clears += 1
+        self._entries.clear()
+        self._keys_by_tag.clear()
+
+    async def close(self) -> None:
+        await self.clear()
+
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry[2]:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
@@ -0,0 +1,117 @@
+import pickle
+from typing import Any, List, Optional, Sequence
+
+from redis.asyncio import Redis
+
+# KEYS: the entry, then n tag sets, then their n generation counters.
+# ARGV: value, ttl in ms, the unprefixed key, n, then the n expected generations if any.
+_SET_SCRIPT = """
+local n = tonumber(ARGV[4])
+for i = 1, #ARGV - 4 do
+    if (redis.call('GET', KEYS[1 + n + i]) or '0') ~= ARGV[4 + i] then
+        return 0
+    end
+end
+local ttl = tonumber(ARGV[2])
+redis.call('SET', KEYS[1], ARGV[1], 'PX', ttl)
+for i = 1, n do
+    redis.call('SADD', KEYS[1 + i], ARGV[3])
+    if redis.call('PTTL', KEYS[1 + i]) < ttl then
+        redis.call('PEXPIRE', KEYS[1 + i], ttl)
+    end
+end
+return 1
+"""
+
+# KEYS: n tag sets, then their n generation counters. ARGV: the key prefix, n.
+_INVALIDATE_SCRIPT = """
+local n = tonumber(ARGV[2])
+for i = 1, n do
+    redis.call('INCR', KEYS[n + i])
+    for _, key in ipairs(redis.call('SMEMBERS', KEYS[i])) do
+        redis.call('DEL', ARGV[1] .. key)
+    end
+    redis.call('DEL', KEYS[i])
+end
+return n
+"""
+
+
+class RedisCache:
+    """Cache shared by all workers, kept in Redis.
+
+    Values are pickled, so only this application's own DTOs should be stored.
+    Each tag is a Redis set of the keys written under it plus a counter of its
+    invalidations. Both writes and invalidations run as Lua scripts, so a tag
+    is dropped atomically, and a write carrying a `generation` token is
+    skipped by Redis itself if any of its tags was invalidated since, by any
+    worker. The scripts touch entry keys they are not passed, which is fine on
+    a single Redis but not on Redis Cluster. Takes a client instance so tests
+    can pass a local stand-in such as fakeredis.
+    """
+
+    def __init__(self, client: Redis, prefix: str = 'cache:'):
+        self._client = client
+        self._prefix = prefix
+        self._set_script = client.register_script(_SET_SCRIPT)
+        self._invalidate_script = client.register_script(_INVALIDATE_SCRIPT)
+
+    @classmethod
+    def from_url(cls, url: str, prefix: str = 'cache:') -> 'RedisCache':
+        return cls(Redis.from_url(url), prefix)
+
+    async def get(self, key: str) -> Optional[Any]:
+        data = await self._client.get(self._prefix + key)
+        return pickle.loads(data) if data is not None else None
+
+    async def generation(self, tags: Sequence[str]) -> List[int]:
+        if not tags:
+            return []
+        counters = await self._client.mget([self._generation_key(tag) for tag in tags])
+        return [int(counter or 0) for counter in counters]
+
+    async def set(
+            self,
+            key: str,
+            value: Any,
+            ttl: float,
+            tags: Sequence[str] = (),
+            generation: Optional[Sequence[int]] = None
+    ) -> None:
+        ttl_ms = max(1, int(ttl * 1000))
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        await self._set_script(
+            keys=[
+                self._prefix + key,
+                *(self._tag_key(tag) for tag in tags),
+                *(self._generation_key(tag) for tag in tags)
+            ],
+            args=[data, ttl_ms, key, len(tags), *(generation or ())]
+        )
+
+    async def invalidate_tags(self, tags: Sequence[str]) -> None:
+        if not tags:
+            return
+        await self._invalidate_script(
+            keys=[*(self._tag_key(tag) for tag in tags), *(self._generation_key(tag) for tag in tags)],
+            args=[self._prefix, len(tags)]
+        )
+
+    async def clear(self) -> None:
+        batch = []
+        async for key in self._client.scan_iter(match=self._prefix + '*', count=500):
+            batch.append(key)
+            if len(batch) >= 500:
+                await self._client.unlink(*batch)
+                batch.clear()
+        if batch:
+            await self._client.unlink(*batch)
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+    def _tag_key(self, tag: str) -> str:
+        return f'{self._prefix}tag:{tag}'
+
+    def _generation_key(self, tag: str) -> str:
+        return f'{self._prefix}gen:{tag}'
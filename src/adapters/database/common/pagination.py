@@ -0,0 +1,74 @@
+from typing import Any, List, Tuple
+
+import sqlalchemy as sa
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.adapters.database.models.table_counter import TableCounterOrm
+from src.domain.value_objects.pagination import CountStrategy
+
+_ESTIMATED_ROWS_STMT = sa.text(
+    "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table_name)"
+)
+
+
+async def paginate(
+        session: AsyncSession,
+        stmt: Select,
+        page: int,
+        page_size: int,
+        count_strategy: CountStrategy = CountStrategy.EXACT,
+        table: sa.Table | None = None,
+        rows: bool = False,
+) -> Tuple[List[Any], int]:
+    """Fetch one page of a single-entity select together with the total count.
+
+    With `rows=True` the select may have any columns and whole rows are returned.
+
+    EXACT adds a window count to the page query, so one round trip returns both.
+    CACHED and ESTIMATED count the whole `table` and are only correct for
+    unfiltered listings.
+    """
+    page_stmt = stmt.offset((page - 1) * page_size).limit(page_size)
+
+    if count_strategy == CountStrategy.EXACT:
+        page_stmt = page_stmt.add_columns(func.count().over().label('total_count'))
+        result = await session.execute(page_stmt)
+        result_rows = result.all()
+        if result_rows:
+            return [row if rows else row[0] for row in result_rows], result_rows[0].total_count
+        if page > 1:
+            return [], await _exact_count(session, stmt)
+        return [], 0
+
+    result = await session.execute(page_stmt)
+    items = list(result.all() if rows else result.scalars().all())
+    if count_strategy == CountStrategy.CACHED:
+        total_count = await _cached_count(session, table)
+    else:
+        total_count = await _estimated_count(session, table)
+    if total_count is None:
+        total_count = await _exact_count(session, stmt)
+    return items, total_count
+
+
+async def _exact_count(session: AsyncSession, stmt: Select) -> int:
+    count_stmt = select(func.count()).select_from(
+        stmt.order_by(None).limit(None).offset(None).subquery()
+    )
+    result = await session.execute(count_stmt)
+    return result.scalar_one()
+
+
+async def _cached_count(session: AsyncSession, table: sa.Table) -> int | None:
+    stmt = select(TableCounterOrm.row_count).where(TableCounterOrm.table_name == table.name)
+    result = await session.execute(stmt)
+    return result.scalar_one_or_none()
+
+
+async def _estimated_count(session: AsyncSession, table: sa.Table) -> int | None:
+    result = await session.execute(_ESTIMATED_ROWS_STMT, {'table_name': table.name})
+    estimate = result.scalar_one_or_none()
+    if estimate is None or estimate < 0:
+        return None
+    return estimate
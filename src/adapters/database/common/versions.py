@@ -0,0 +1,17 @@
+from typing import Optional
+
+import sqlalchemy as sa
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.adapters.database.models.table_counter import TableCounterOrm
+
+
+async def collection_version(session: AsyncSession, table: sa.Table) -> Optional[str]:
+    """Version of a whole table, bumped by a trigger on every insert, update or delete.
+
+    A primary key lookup on `table_counters`; None for tables without a counter row.
+    """
+    stmt = select(TableCounterOrm.version).where(TableCounterOrm.table_name == table.name)
+    version = await session.scalar(stmt)
+    return str(version) if version is not None else None
@@ -0,0 +1,67 @@
+from typing import Any, Optional, Tuple
+
+from sqlalchemy import ScalarSelect, Select, Text, cast, func, literal, select
+from sqlalchemy.dialects.postgresql import JSON, aggregate_order_by
+
+from src.adapters.database.common.workout_query import workout_keyset_condition, workout_sort_keys, \
+    workout_sort_order
+from src.adapters.database.models import WorkoutOrm
+from src.domain.value_objects.pagination import KeysetCursor
+from src.domain.value_objects.workout import WorkoutSortEnum
+
+SUMMARY_COLUMNS = (
+    WorkoutOrm.id,
+    WorkoutOrm.name,
+    WorkoutOrm.thumbnail_image,
+    WorkoutOrm.author_name,
+    WorkoutOrm.views_count,
+)
+
+
+def workout_summaries_page(
+        stmt: Select,
+        sort: WorkoutSortEnum,
+        limit: int,
+        after: Optional[KeysetCursor] = None
+) -> Tuple[ScalarSelect, ScalarSelect]:
+    """One keyset page of workout summaries as scalar JSON subqueries.
+
+    `stmt` selects from workouts and narrows them to the parent. Only `limit`
+    rows are read; `lead()` over the same order tells whether another page
+    follows. Returns the JSON array of summaries (`[]` when empty) and the
+    next cursor token, NULL on the last page.
+    """
+    order = workout_sort_order(sort)
+    if after is not None:
+        stmt = stmt.where(workout_keyset_condition(sort, after.keys))
+    page = (
+        stmt.with_only_columns(
+            *SUMMARY_COLUMNS,
+            func.row_number().over(order_by=order).label('position'),
+            func.lead(WorkoutOrm.id).over(order_by=order).label('next_id'),
+        )
+        .order_by(*order)
+        .limit(limit)
+        .cte('workouts_page')
+    )
+
+    summary = func.json_build_object(*(
+        part for column in SUMMARY_COLUMNS for part in (column.key, page.c[column.key])
+    ))
+    workouts = select(
+        func.coalesce(func.json_agg(aggregate_order_by(summary, page.c.position)), cast(literal('[]'), JSON))
+    ).scalar_subquery()
+
+    keys, _ = workout_sort_keys(sort)
+    last_keys = as_text(func.json_build_array(*(page.c[key.key] for key in keys)))
+    next_cursor = (
+        select(func.encode(func.convert_to(last_keys, 'UTF8'), 'hex'))
+        .where(page.c.position == limit, page.c.next_id.is_not(None))
+        .scalar_subquery()
+    )
+    return workouts, next_cursor
+
+
+def as_text(document: Any) -> Any:
+    """Cast a JSON expression to text so the driver hands back the raw document."""
+    return cast(document, Text)
@@ -0,0 +1,57 @@
+from typing import Sequence, Tuple
+
+from sqlalchemy import select, func, tuple_
+
+from src.adapters.database.models import WorkoutOrm, workout_tag_association_orm
+from src.domain.entities.workout import WorkoutFilter
+from src.domain.value_objects.workout import WorkoutSortEnum, TagMatchEnum
+
+
+def workout_filter_conditions(filters: WorkoutFilter) -> list:
+    conditions = []
+    if filters.style_id is not None:
+        conditions.append(WorkoutOrm.style_id == filters.style_id)
+    if filters.level is not None:
+        conditions.append(WorkoutOrm.level == filters.level)
+    if filters.min_duration is not None:
+        conditions.append(WorkoutOrm.duration >= filters.min_duration)
+    if filters.max_duration is not None:
+        conditions.append(WorkoutOrm.duration <= filters.max_duration)
+    if filters.min_calories is not None:
+        conditions.append(WorkoutOrm.calories >= filters.min_calories)
+    if filters.max_calories is not None:
+        conditions.append(WorkoutOrm.calories <= filters.max_calories)
+    if filters.tag_ids:
+        tag_ids = set(filters.tag_ids)
+        tagged_workouts = select(workout_tag_association_orm.c.workout_id).where(
+            workout_tag_association_orm.c.tag_id.in_(tag_ids)
+        )
+        if filters.tags_match == TagMatchEnum.ALL:
+            tagged_workouts = (
+                tagged_workouts
+                .group_by(workout_tag_association_orm.c.workout_id)
+                .having(func.count() == len(tag_ids))
+            )
+        conditions.append(WorkoutOrm.id.in_(tagged_workouts))
+    return conditions
+
+
+def workout_sort_keys(sort: WorkoutSortEnum) -> Tuple[tuple, bool]:
+    """Columns a sort orders by, ending with the id tie-breaker, and whether it is descending."""
+    if sort == WorkoutSortEnum.VIEWS:
+        return (WorkoutOrm.views_count, WorkoutOrm.id), True
+    if sort == WorkoutSortEnum.NAME:
+        return (WorkoutOrm.name, WorkoutOrm.id), False
+    return (WorkoutOrm.id,), True
+
+
+def workout_sort_order(sort: WorkoutSortEnum) -> tuple:
+    keys, descending = workout_sort_keys(sort)
+    return tuple(key.desc() if descending else key.asc() for key in keys)
+
+
+def workout_keyset_condition(sort: WorkoutSortEnum, after: Sequence):
+    """Rows strictly after `after` (the sort-key values of the previous page's last row)."""
+    keys, descending = workout_sort_keys(sort)
+    left, right = tuple_(*keys), tuple_(*after)
+    return left < right if descending else left > right
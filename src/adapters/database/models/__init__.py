@@ -6,3 +6,6 @@ from .tag import TagOrm
 from .workout import WorkoutOrm
 from .workout_to_tags import workout_tag_association_orm
 from .avatar import AvatarOrm
+from .table_counter import TableCounterOrm
+from .workout_view_event import workout_view_events
+from .workout_trending_score import WorkoutTrendingScoreOrm
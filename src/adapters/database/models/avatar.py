@@ -1,3 +1,5 @@
+from datetime import datetime
+
 import sqlalchemy as sa
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -9,5 +11,7 @@ class AvatarOrm(Base):
 
     id: Mapped[int] = mapped_column(sa.Integer, primary_key=True)
     image_url: Mapped[str] = mapped_column(sa.String, nullable=True)
+    version: Mapped[int] = mapped_column(sa.BigInteger, nullable=False, server_default='1')
+    updated_at: Mapped[datetime] = mapped_column(sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now())
 
     users = relationship("UserOrm", back_populates="avatar")
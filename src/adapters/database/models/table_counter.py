@@ -0,0 +1,12 @@
+import sqlalchemy as sa
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.adapters.database.config import Base
+
+
+class TableCounterOrm(Base):
+    __tablename__ = 'table_counters'
+
+    table_name: Mapped[str] = mapped_column(sa.String, primary_key=True)
+    row_count: Mapped[int] = mapped_column(sa.BigInteger, nullable=False, default=0)
+    version: Mapped[int] = mapped_column(sa.BigInteger, nullable=False, server_default='0')
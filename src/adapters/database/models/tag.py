@@ -1,3 +1,5 @@
+from datetime import datetime
+
 import sqlalchemy as sa
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -8,8 +10,17 @@ from .workout_to_tags import workout_tag_association_orm
 
 class TagOrm(Base):
     __tablename__ = 'tags'
+    __table_args__ = (
+        sa.Index(
+            'ix_tags_name_trgm', 'name',
+            postgresql_using='gin',
+            postgresql_ops={'name': 'gin_trgm_ops'}
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(sa.String, nullable=False, unique=True)
-    usages: Mapped[int] = mapped_column(sa.Integer, default=0, nullable=True)
+    usages: Mapped[int] = mapped_column(sa.Integer, default=0, server_default='0', nullable=True)
+    version: Mapped[int] = mapped_column(sa.BigInteger, nullable=False, server_default='1')
+    updated_at: Mapped[datetime] = mapped_column(sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now())
     workouts = relationship('WorkoutOrm', secondary=workout_tag_association_orm, back_populates='tags')
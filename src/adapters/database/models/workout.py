@@ -1,4 +1,8 @@
+from datetime import datetime
+from typing import Optional
+
 import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from src.adapters.database.config import Base
 from src.domain.value_objects.workout import LevelsEnum
@@ -7,6 +11,12 @@ from .workout_to_tags import workout_tag_association_orm
 
 class WorkoutOrm(Base):
     __tablename__ = 'workouts'
+    __table_args__ = (
+        sa.Index('ix_workouts_style_id_level_duration', 'style_id', 'level', 'duration'),
+        sa.Index('ix_workouts_style_id_id', 'style_id', 'id'),
+        sa.Index('ix_workouts_style_id_views_count_id', 'style_id', 'views_count', 'id'),
+        sa.Index('ix_workouts_search_vector', 'search_vector', postgresql_using='gin'),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(sa.String, nullable=False, index=True)
@@ -18,6 +28,9 @@ class WorkoutOrm(Base):
     thumbnail_image: Mapped[str] = mapped_column(sa.String, nullable=False)
     author_name: Mapped[str] = mapped_column(sa.String, nullable=False)
     views_count: Mapped[int] = mapped_column(sa.Integer, default=0)
+    search_vector: Mapped[Optional[str]] = mapped_column(TSVECTOR, nullable=True, deferred=True)
+    version: Mapped[int] = mapped_column(sa.BigInteger, nullable=False, server_default='1')
+    updated_at: Mapped[datetime] = mapped_column(sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now())
 
     tags = relationship('TagOrm', secondary=workout_tag_association_orm, back_populates='workouts')
     style_id: Mapped[int] = mapped_column(sa.ForeignKey('styles.id', ondelete="CASCADE"), nullable=False)
@@ -7,5 +7,6 @@ workout_tag_association_orm = sa.Table(
     Base.metadata,
     sa.Column('workout_id', sa.ForeignKey('workouts.id', ondelete="CASCADE"), primary_key=True),
     sa.Column('tag_id', sa.ForeignKey('tags.id', ondelete="CASCADE"), primary_key=True),
-    sa.PrimaryKeyConstraint('workout_id', 'tag_id', name='pk_workout_tag_association')
+    sa.PrimaryKeyConstraint('workout_id', 'tag_id', name='pk_workout_tag_association'),
+    sa.Index('ix_workout_tag_association_tag_id_workout_id', 'tag_id', 'workout_id'),
 )
@@ -0,0 +1,19 @@
+from datetime import datetime
+
+import sqlalchemy as sa
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.adapters.database.config import Base
+
+
+class WorkoutTrendingScoreOrm(Base):
+    __tablename__ = 'workout_trending_scores'
+    __table_args__ = (
+        sa.Index('ix_workout_trending_scores_score', sa.text('score DESC'), 'workout_id'),
+        sa.Index('ix_workout_trending_scores_style_id_score', 'style_id', sa.text('score DESC'), 'workout_id'),
+    )
+
+    workout_id: Mapped[int] = mapped_column(sa.ForeignKey('workouts.id', ondelete="CASCADE"), primary_key=True)
+    style_id: Mapped[int] = mapped_column(sa.Integer, nullable=False)
+    score: Mapped[float] = mapped_column(sa.Float, nullable=False)
+    computed_at: Mapped[datetime] = mapped_column(sa.DateTime(timezone=True), nullable=False)
@@ -0,0 +1,14 @@
+import sqlalchemy as sa
+
+from src.adapters.database.config import Base
+
+# Append-only and range-partitioned by day; partitions are created and
+# dropped by `workout_view_events_maintain()` (see the migration).
+workout_view_events = sa.Table(
+    'workout_view_events',
+    Base.metadata,
+    sa.Column('workout_id', sa.Integer, nullable=False),
+    sa.Column('viewed_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+    sa.Column('views', sa.Integer, nullable=False),
+    postgresql_partition_by='RANGE (viewed_at)',
+)
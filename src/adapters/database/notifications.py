@@ -0,0 +1,225 @@
+import asyncio
+import json
+import logging
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Set
+
+import asyncpg
+from sqlalchemy import func, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.application.common.cache import ReadThroughCache
+from src.application.tag.autocomplete import TagAutocompleteIndex
+from src.domain.entities.tag import DBTag
+from src.main.config import DBSettings
+
+logger = logging.getLogger(__name__)
+
+TAG_CHANGES_CHANNEL = 'tag_changes'
+CACHE_INVALIDATION_CHANNEL = 'cache_invalidation'
+
+NotificationHandler = Callable[[str], Optional[Awaitable[None]]]
+ReconnectHandler = Callable[[], Optional[Awaitable[None]]]
+
+
+class PgListener:
+    """Holds one dedicated connection that LISTENs on the subscribed channels.
+
+    Notifications sent while the connection was down are lost, so every
+    reconnect runs the registered resync handlers; one that fails is logged
+    and retried with the reconnect backoff until it succeeds. Notification
+    handlers may be coroutine functions; those run as tasks so the
+    connection's callback never waits.
+    """
+
+    def __init__(
+            self,
+            settings: DBSettings,
+            health_check_interval: float = 15.0,
+            reconnect_delay: float = 1.0,
+            max_reconnect_delay: float = 30.0
+    ):
+        self._dsn = settings.dsn
+        self._health_check_interval = health_check_interval
+        self._reconnect_delay = reconnect_delay
+        self._max_reconnect_delay = max_reconnect_delay
+        self._handlers: Dict[str, List[NotificationHandler]] = {}
+        self._reconnect_handlers: List[ReconnectHandler] = []
+        self._connection: Optional[asyncpg.Connection] = None
+        self._task: Optional[asyncio.Task] = None
+        self._pending: Set[asyncio.Task] = set()
+
+    def subscribe(self, channel: str, handler: NotificationHandler) -> None:
+        self._handlers.setdefault(channel, []).append(handler)
+
+    def on_reconnect(self, handler: ReconnectHandler) -> None:
+        self._reconnect_handlers.append(handler)
+
+    async def start(self) -> None:
+        await self._connect()
+        self._task = asyncio.create_task(self._watch())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+        if self._connection and not self._connection.is_closed():
+            await self._connection.close()
+
+    async def _connect(self) -> None:
+        self._connection = await asyncpg.connect(self._dsn)
+        for channel in self._handlers:
+            await self._connection.add_listener(channel, self._dispatch)
+
+    async def _watch(self) -> None:
+        while True:
+            await self._wait_until_lost()
+            logger.warning("Notification listener connection lost, reconnecting")
+            if not self._connection.is_closed():
+                self._connection.terminate()
+            await self._reconnect()
+
+    async def _wait_until_lost(self) -> None:
+        lost = asyncio.Event()
+        self._connection.add_termination_listener(lambda _connection: lost.set())
+        while not lost.is_set():
+            try:
+                await asyncio.wait_for(lost.wait(), self._health_check_interval)
+            except asyncio.TimeoutError:
+                try:
+                    await self._connection.execute('SELECT 1')
+                except (OSError, asyncpg.PostgresError, asyncpg.InterfaceError):
+                    return
+
+    async def _reconnect(self) -> None:
+        delay = self._reconnect_delay
+        while True:
+            try:
+                await self._connect()
+                break
+            except (OSError, asyncpg.PostgresError) as e:
+                logger.warning("Notification listener reconnect failed: %s", e)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self._max_reconnect_delay)
+        pending = list(self._reconnect_handlers)
+        delay = self._reconnect_delay
+        while pending:
+            pending = [handler for handler in pending if not await self._resync(handler)]
+            if pending:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self._max_reconnect_delay)
+
+    @staticmethod
+    async def _resync(handler: ReconnectHandler) -> bool:
+        try:
+            result = handler()
+            if result is not None:
+                await result
+        except Exception:
+            logger.exception("Resync after notification listener reconnect failed, retrying")
+            return False
+        return True
+
+    def _dispatch(self, _connection, _pid: int, channel: str, payload: str) -> None:
+        for handler in self._handlers.get(channel, ()):
+            try:
+                result = handler(payload)
+            except Exception:
+                logger.exception("Notification handler for %s failed", channel)
+                continue
+            if result is not None:
+                task = asyncio.ensure_future(result)
+                self._pending.add(task)
+                task.add_done_callback(lambda done: self._finish(done, channel))
+
+    def _finish(self, task: asyncio.Task, channel: str) -> None:
+        self._pending.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Notification handler for %s failed", channel, exc_info=task.exception())
+
+
+class TagChangeFeed:
+    """Applies `tag_changes` notifications to the local autocomplete index."""
+
+    def __init__(self, index: TagAutocompleteIndex):
+        self._index = index
+
+    def __call__(self, payload: str) -> None:
+        change = json.loads(payload)
+        if change['op'] == 'DELETE':
+            self._index.remove(change['id'])
+        else:
+            self._index.upsert(DBTag(id=change['id'], name=change['name'], usages=change['usages']))
+
+
+class PgInvalidationPublisher:
+    """Sends cache invalidations to the other workers with pg_notify.
+
+    Each message carries the tags (entity type and id, such as `style:3`), the
+    sending process and the send time. It goes out in its own short
+    transaction after the write committed; a failed send is logged, not
+    raised, since the write already happened and the other workers' entries
+    still expire with their TTL.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession], clock: Callable[[], float] = time.time):
+        self._session_factory = session_factory
+        self._clock = clock
+        self.origin = uuid.uuid4().hex
+
+    async def publish(self, tags: Sequence[str]) -> None:
+        payload = json.dumps({'origin': self.origin, 'tags': list(tags), 'sent_at': self._clock()})
+        try:
+            async with self._session_factory() as session:
+                await session.execute(select(func.pg_notify(CACHE_INVALIDATION_CHANNEL, payload)))
+                await session.commit()
+        except (OSError, SQLAlchemyError):
+            logger.warning("Could not publish cache invalidation for %s", list(tags), exc_info=True)
+
+
+@dataclass
+class InvalidationStats:
+    received: int = 0
+    flushes: int = 0
+    latency_total: float = 0.0
+    latency_max: float = 0.0
+
+    @property
+    def latency_mean(self) -> float:
+        return self.latency_total / self.received if self.received else 0.0
+
+
+class CacheInvalidationFeed:
+    """Applies `cache_invalidation` notifications from other workers to the local cache.
+
+    Latency is measured from the sender's wall clock, so it includes clock
+    skew between hosts. Messages this process published itself are skipped.
+    """
+
+    def __init__(self, cache: ReadThroughCache, origin: str, clock: Callable[[], float] = time.time):
+        self._cache = cache
+        self._origin = origin
+        self._clock = clock
+        self.stats = InvalidationStats()
+
+    async def __call__(self, payload: str) -> None:
+        message = json.loads(payload)
+        if message['origin'] == self._origin:
+            return
+        await self._cache.invalidate_local(message['tags'])
+        latency = max(0.0, self._clock() - message['sent_at'])
+        self.stats.received += 1
+        self.stats.latency_total += latency
+        self.stats.latency_max = max(self.stats.latency_max, latency)
+
+    async def resync(self) -> None:
+        self.stats.flushes += 1
+        await self._cache.flush()
@@ -0,0 +1,28 @@
+import time
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from src.adapters.observability.metrics import DB_POOL_CHECKED_OUT, DB_POOL_CHECKOUT_WAIT, DB_POOL_CONNECTIONS, \
+    DB_POOL_OVERFLOW
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """The default async queue pool, reporting checkout waits and occupancy to metrics."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - started)
+            self._report()
+
+    def _do_return_conn(self, record) -> None:
+        super()._do_return_conn(record)
+        self._report()
+
+    def _report(self) -> None:
+        # overflow() starts at -pool_size and counts up as connections are opened.
+        DB_POOL_CONNECTIONS.set(self.size() + self.overflow())
+        DB_POOL_OVERFLOW.set(max(0, self.overflow()))
+        DB_POOL_CHECKED_OUT.set(self.checkedout())
@@ -1,10 +1,14 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.adapters.database.readers.style_reader import StyleReaderImpl
+from src.adapters.database.readers.tag_reader import TagReaderImpl
+from src.adapters.database.readers.workout_reader import WorkoutReaderImpl
 from src.adapters.database.repositories.avatar_repository import AvatarRepository
 from src.adapters.database.repositories.client_repository import ClientRepositoryImpl
 from src.adapters.database.repositories.staff_repository import StaffRepositoryImpl
 from src.adapters.database.repositories.style_respository import StyleRepositoryImpl
 from src.adapters.database.repositories.tag_repository import TagRepositoryImpl
+from src.adapters.database.repositories.trending_repository import TrendingRepositoryImpl
 from src.adapters.database.repositories.user_repository import UserRepositoryImpl
 from src.adapters.database.repositories.workout_repository import WorkoutRepositoryImpl
 from src.adapters.database.repositories.workout_tag_repository import WorkoutTagAssociationRepository
@@ -45,3 +49,19 @@ def get_workout_tag_repository(session: AsyncSession) -> WorkoutTagAssociationRe
 
 def get_avatar_repository(session: AsyncSession) -> AvatarRepository:
     return AvatarRepository(session=session)
+
+
+def get_trending_repository(session: AsyncSession) -> TrendingRepositoryImpl:
+    return TrendingRepositoryImpl(session=session)
+
+
+def get_workout_reader(session: AsyncSession) -> WorkoutReaderImpl:
+    return WorkoutReaderImpl(session=session)
+
+
+def get_style_reader(session: AsyncSession) -> StyleReaderImpl:
+    return StyleReaderImpl(session=session)
+
+
+def get_tag_reader(session: AsyncSession) -> TagReaderImpl:
+    return TagReaderImpl(session=session)
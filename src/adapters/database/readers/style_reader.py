@@ -0,0 +1,39 @@
+from typing import Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.adapters.database.common.workout_document import as_text, workout_summaries_page
+from src.adapters.database.models import StyleOrm, WorkoutOrm
+from src.domain.value_objects.pagination import KeysetCursor
+from src.domain.value_objects.workout import WorkoutSortEnum
+
+
+class StyleReaderImpl:
+    """Style detail documents assembled by Postgres in a single query."""
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def get_detail_document(
+            self,
+            style_id: int,
+            sort: WorkoutSortEnum,
+            limit: int,
+            after: Optional[KeysetCursor] = None
+    ) -> Optional[bytes]:
+        workouts, next_cursor = workout_summaries_page(
+            select(WorkoutOrm.id).where(WorkoutOrm.style_id == style_id), sort, limit, after
+        )
+        workouts_count = select(func.count()).where(WorkoutOrm.style_id == style_id).scalar_subquery()
+        document = func.json_build_object(
+            'id', StyleOrm.id,
+            'name', StyleOrm.name,
+            'image_url', StyleOrm.image_url,
+            'workouts_count', workouts_count,
+            'workouts', workouts,
+            'next_cursor', next_cursor,
+        )
+        stmt = select(as_text(document)).where(StyleOrm.id == style_id)
+        result = await self._session.scalar(stmt)
+        return result.encode() if result is not None else None
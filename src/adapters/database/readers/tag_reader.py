@@ -0,0 +1,42 @@
+from typing import Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.adapters.database.common.workout_document import as_text, workout_summaries_page
+from src.adapters.database.models import TagOrm, WorkoutOrm, workout_tag_association_orm
+from src.domain.value_objects.pagination import KeysetCursor
+from src.domain.value_objects.workout import WorkoutSortEnum
+
+
+class TagReaderImpl:
+    """Tag detail documents assembled by Postgres in a single query."""
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def get_detail_document(
+            self,
+            tag_id: int,
+            sort: WorkoutSortEnum,
+            limit: int,
+            after: Optional[KeysetCursor] = None
+    ) -> Optional[bytes]:
+        workouts, next_cursor = workout_summaries_page(
+            select(WorkoutOrm.id)
+            .join(workout_tag_association_orm, workout_tag_association_orm.c.workout_id == WorkoutOrm.id)
+            .where(workout_tag_association_orm.c.tag_id == tag_id),
+            sort, limit, after
+        )
+        # `usages` is kept equal to the association count by triggers.
+        document = func.json_build_object(
+            'id', TagOrm.id,
+            'name', TagOrm.name,
+            'usages', TagOrm.usages,
+            'workouts_count', func.coalesce(TagOrm.usages, 0),
+            'workouts', workouts,
+            'next_cursor', next_cursor,
+        )
+        stmt = select(as_text(document)).where(TagOrm.id == tag_id)
+        result = await self._session.scalar(stmt)
+        return result.encode() if result is not None else None
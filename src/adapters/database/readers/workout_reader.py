@@ -0,0 +1,275 @@
+from collections import defaultdict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import sqlalchemy as sa
+from sqlalchemy import Row, func, select
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.adapters.database.common.pagination import paginate
+from src.adapters.database.common.workout_query import workout_filter_conditions, workout_sort_order
+from src.adapters.database.models import StyleOrm, TagOrm, WorkoutOrm, WorkoutTrendingScoreOrm, \
+    workout_tag_association_orm
+from src.application.style.dto import ResponseStyleDTO
+from src.application.tag.dto import ResponseWorkoutTagDTO
+from src.application.workout.dto import VersionedWorkoutDTO, WorkoutCardResponseDTO, WorkoutResponseDTO, \
+    WorkoutResponseStyleDTO, WorkoutSearchResponseDTO
+from src.domain.entities.workout import WorkoutFilter
+
+SEARCH_CONFIG = 'simple'
+NAME_HEADLINE_OPTIONS = 'HighlightAll=true, StartSel=<mark>, StopSel=</mark>'
+DESCRIPTION_HEADLINE_OPTIONS = 'MaxFragments=2, MaxWords=25, MinWords=8, StartSel=<mark>, StopSel=</mark>'
+HTML_ESCAPES = (('&', '&amp;'), ('<', '&lt;'), ('>', '&gt;'), ('"', '&quot;'), ("'", '&#39;'))
+
+STYLE_COLUMNS = (
+    StyleOrm.name.label('style_name'),
+    StyleOrm.image_url.label('style_image_url'),
+)
+
+
+CARD_COLUMNS = (
+    WorkoutOrm.id,
+    WorkoutOrm.name,
+    WorkoutOrm.calories,
+    WorkoutOrm.duration,
+    WorkoutOrm.level,
+    WorkoutOrm.thumbnail_image,
+    WorkoutOrm.author_name,
+    WorkoutOrm.views_count,
+    WorkoutOrm.style_id,
+    *STYLE_COLUMNS,
+)
+DETAIL_COLUMNS = (
+    WorkoutOrm.id,
+    WorkoutOrm.name,
+    WorkoutOrm.calories,
+    WorkoutOrm.duration,
+    WorkoutOrm.level,
+    WorkoutOrm.description,
+    WorkoutOrm.dance_video,
+    WorkoutOrm.thumbnail_image,
+    WorkoutOrm.author_name,
+    WorkoutOrm.views_count,
+    WorkoutOrm.style_id,
+)
+
+def html_escape(column):
+    """Escape a text column in SQL, so the only markup in a headline is the highlight tags."""
+    for character, entity in HTML_ESCAPES:
+        column = func.replace(column, character, entity)
+    return column
+
+
+class WorkoutReaderImpl:
+    """Read-only queries that map Core rows straight into response DTOs.
+
+    No ORM instances, identity map or intermediate entities are involved;
+    tags for a page are fetched with one extra query and grouped in Python.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def list_cards(
+            self,
+            filters: WorkoutFilter,
+            page: int,
+            page_size: int
+    ) -> Tuple[List[WorkoutCardResponseDTO], int]:
+        stmt = (
+            select(*CARD_COLUMNS)
+            .join(StyleOrm, StyleOrm.id == WorkoutOrm.style_id)
+            .where(*workout_filter_conditions(filters))
+            .order_by(*workout_sort_order(filters.sort))
+        )
+        return await self._card_page(stmt, page, page_size)
+
+    async def list_trending_cards(
+            self,
+            style_id: Optional[int],
+            page: int,
+            page_size: int
+    ) -> Tuple[List[WorkoutCardResponseDTO], int]:
+        stmt = (
+            select(*CARD_COLUMNS)
+            .join(WorkoutTrendingScoreOrm, WorkoutTrendingScoreOrm.workout_id == WorkoutOrm.id)
+            .join(StyleOrm, StyleOrm.id == WorkoutOrm.style_id)
+            .order_by(WorkoutTrendingScoreOrm.score.desc(), WorkoutTrendingScoreOrm.workout_id)
+        )
+        if style_id is not None:
+            stmt = stmt.where(WorkoutTrendingScoreOrm.style_id == style_id)
+        return await self._card_page(stmt, page, page_size)
+
+    async def list_all(self) -> List[WorkoutResponseStyleDTO]:
+        """Every workout with its style and tags, for the deprecated unpaginated list."""
+        stmt = (
+            select(*DETAIL_COLUMNS, *STYLE_COLUMNS)
+            .join(StyleOrm, StyleOrm.id == WorkoutOrm.style_id)
+            .order_by(WorkoutOrm.id)
+        )
+        rows = (await self._session.execute(stmt)).all()
+        tags = await self._tags_by_workout(None)
+        return [WorkoutResponseStyleDTO(**self._full_fields(row, tags.get(row.id, []))) for row in rows]
+
+    async def search(
+            self,
+            query: str,
+            page: int,
+            page_size: int
+    ) -> Tuple[List[WorkoutSearchResponseDTO], int]:
+        search_config = sa.cast(SEARCH_CONFIG, REGCONFIG)
+        ts_query = func.websearch_to_tsquery(search_config, query)
+        matches = WorkoutOrm.search_vector.bool_op('@@')(ts_query)
+        rank = func.ts_rank(WorkoutOrm.search_vector, ts_query)
+
+        # Rank and page on the index first, then build highlights for the page rows only.
+        ranked = (
+            select(WorkoutOrm.id, rank.label('rank'), func.count().over().label('total_count'))
+            .where(matches)
+            .order_by(rank.desc(), WorkoutOrm.id)
+            .offset((page - 1) * page_size)
+            .limit(page_size)
+            .subquery()
+        )
+        stmt = (
+            select(
+                *DETAIL_COLUMNS,
+                *STYLE_COLUMNS,
+                ranked.c.rank,
+                ranked.c.total_count,
+                func.ts_headline(
+                    search_config, html_escape(WorkoutOrm.name), ts_query, NAME_HEADLINE_OPTIONS
+                ).label('name_highlight'),
+                func.ts_headline(
+                    search_config, html_escape(WorkoutOrm.description), ts_query, DESCRIPTION_HEADLINE_OPTIONS
+                ).label('description_highlight'),
+            )
+            .join(ranked, ranked.c.id == WorkoutOrm.id)
+            .join(StyleOrm, StyleOrm.id == WorkoutOrm.style_id)
+            .order_by(ranked.c.rank.desc(), WorkoutOrm.id)
+        )
+        rows = (await self._session.execute(stmt)).all()
+        if not rows:
+            if page == 1:
+                return [], 0
+            total_result = await self._session.execute(select(func.count(WorkoutOrm.id)).where(matches))
+            return [], total_result.scalar_one()
+
+        tags = await self._tags_by_workout([row.id for row in rows])
+        hits = [
+            WorkoutSearchResponseDTO(
+                **self._full_fields(row, tags.get(row.id, [])),
+                rank=row.rank,
+                name_highlight=row.name_highlight,
+                description_highlight=row.description_highlight
+            )
+            for row in rows
+        ]
+        return hits, rows[0].total_count
+
+    async def get_detail_version(self, workout_id: int) -> Optional[str]:
+        """The same version get_detail reports, read without loading the detail itself."""
+        stmt = (
+            select(WorkoutOrm.version, self._tags_version().label('tags_version'))
+            .where(WorkoutOrm.id == workout_id)
+        )
+        row = (await self._session.execute(stmt)).one_or_none()
+        if row is None:
+            return None
+        return f'{row.version}.{row.tags_version}'
+
+    async def get_detail(self, workout_id: int) -> Optional[VersionedWorkoutDTO]:
+        """The workout detail and the row versions behind it: the workout and each of its tags."""
+        stmt = (
+            select(*DETAIL_COLUMNS, WorkoutOrm.version, self._tags_version().label('tags_version'))
+            .where(WorkoutOrm.id == workout_id)
+        )
+        row = (await self._session.execute(stmt)).one_or_none()
+        if row is None:
+            return None
+        tags = await self._tags_by_workout([workout_id])
+        return VersionedWorkoutDTO(
+            version=f'{row.version}.{row.tags_version}',
+            workout=WorkoutResponseDTO(
+                id=row.id,
+                name=row.name,
+                calories=row.calories,
+                duration=row.duration,
+                level=row.level,
+                description=row.description,
+                dance_video=row.dance_video,
+                thumbnail_image=row.thumbnail_image,
+                author_name=row.author_name,
+                style_id=row.style_id,
+                views_count=row.views_count,
+                tags=tags.get(workout_id, [])
+            )
+        )
+
+    async def _card_page(self, stmt, page: int, page_size: int) -> Tuple[List[WorkoutCardResponseDTO], int]:
+        rows, total_count = await paginate(self._session, stmt, page, page_size, rows=True)
+        tags = await self._tags_by_workout([row.id for row in rows])
+        return [self._map_to_card(row, tags.get(row.id, [])) for row in rows], total_count
+
+    async def _tags_by_workout(
+            self,
+            workout_ids: Optional[Sequence[int]]
+    ) -> Dict[int, List[ResponseWorkoutTagDTO]]:
+        """Tags grouped by workout, for `workout_ids` or, with None, for every workout."""
+        if workout_ids is not None and not workout_ids:
+            return {}
+        stmt = (
+            select(workout_tag_association_orm.c.workout_id, TagOrm.id, TagOrm.name)
+            .join(TagOrm, TagOrm.id == workout_tag_association_orm.c.tag_id)
+            .order_by(workout_tag_association_orm.c.workout_id, TagOrm.id)
+        )
+        if workout_ids is not None:
+            stmt = stmt.where(workout_tag_association_orm.c.workout_id.in_(workout_ids))
+        tags = defaultdict(list)
+        for workout_id, tag_id, tag_name in (await self._session.execute(stmt)).tuples():
+            tags[workout_id].append(ResponseWorkoutTagDTO(id=tag_id, name=tag_name))
+        return tags
+
+    @staticmethod
+    def _tags_version():
+        # Tags are versioned separately, so a rename shows up as a changed sum.
+        return (
+            select(func.coalesce(func.sum(TagOrm.version), 0))
+            .join(workout_tag_association_orm, workout_tag_association_orm.c.tag_id == TagOrm.id)
+            .where(workout_tag_association_orm.c.workout_id == WorkoutOrm.id)
+            .scalar_subquery()
+        )
+
+    @staticmethod
+    def _full_fields(row: Row, tags: List[ResponseWorkoutTagDTO]) -> dict:
+        return dict(
+            id=row.id,
+            name=row.name,
+            calories=row.calories,
+            duration=row.duration,
+            level=row.level,
+            description=row.description,
+            dance_video=row.dance_video,
+            thumbnail_image=row.thumbnail_image,
+            author_name=row.author_name,
+            views_count=row.views_count,
+            style_id=row.style_id,
+            style=ResponseStyleDTO(id=row.style_id, name=row.style_name, image_url=row.style_image_url),
+            tags=tags
+        )
+
+    @staticmethod
+    def _map_to_card(row: Row, tags: List[ResponseWorkoutTagDTO]) -> WorkoutCardResponseDTO:
+        return WorkoutCardResponseDTO(
+            id=row.id,
+            name=row.name,
+            calories=row.calories,
+            duration=row.duration,
+            level=row.level,
+            thumbnail_image=row.thumbnail_image,
+            author_name=row.author_name,
+            views_count=row.views_count,
+            style_id=row.style_id,
+            style=ResponseStyleDTO(id=row.style_id, name=row.style_name, image_url=row.style_image_url),
+            tags=tags
+        )
@@ -1,9 +1,10 @@
 from dataclasses import asdict
-from typing import List
+from typing import List, Optional
 
 from sqlalchemy import insert, update, delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.adapters.database.common.versions import collection_version
 from src.adapters.database.models import AvatarOrm
 from src.domain.entities.avatar import Avatar, DBAvatar
 
@@ -27,6 +28,9 @@ class AvatarRepository:
         result = await self._session.execute(stmt)
         return [self._map_to_entity(avatar) for avatar in result.scalars().all()]
 
+    async def get_collection_version(self) -> Optional[str]:
+        return await collection_version(self._session, AvatarOrm.__table__)
+
     async def update(self, avatar: DBAvatar) -> DBAvatar:
         stmt = update(AvatarOrm).values(**asdict(avatar)).where(AvatarOrm.id == avatar.id).returning(AvatarOrm)
         result = await self._session.execute(stmt)
@@ -2,12 +2,10 @@ from typing import Optional, List
 
 from sqlalchemy import select, delete
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
-from src.adapters.database.models import StyleOrm, WorkoutOrm
-from src.domain.entities.style import DBStyle, DBStyleWorkout, Style
-from src.domain.entities.tag import DBTag
-from src.domain.entities.workout import DBWorkout
+from src.adapters.database.common.versions import collection_version
+from src.adapters.database.models import StyleOrm
+from src.domain.entities.style import DBStyle, Style
 
 
 class StyleRepositoryImpl:
@@ -39,6 +37,9 @@ class StyleRepositoryImpl:
         style_orms = result.scalars().all()
         return [self._map_to_db_style(style_orm) for style_orm in style_orms]
 
+    async def get_collection_version(self) -> Optional[str]:
+        return await collection_version(self.session, StyleOrm.__table__)
+
     async def update(self, item: DBStyle) -> None:
         stmt = select(StyleOrm).where(StyleOrm.id == item.id)
         result = await self.session.execute(stmt)
@@ -52,19 +53,6 @@ class StyleRepositoryImpl:
         await self.session.execute(stmt)
         await self.session.flush()
 
-    async def get_with_workouts(self, style_id: int) -> Optional[DBStyleWorkout]:
-        stmt = (
-            select(StyleOrm)
-            .where(StyleOrm.id == style_id)
-            .options(selectinload(StyleOrm.workouts).options(selectinload(WorkoutOrm.tags)))
-        )
-        result = await self.session.execute(stmt)
-        style_orm = result.scalar_one_or_none()
-        if style_orm:
-            return self._map_to_db_style_workouts(style_orm)
-        else:
-            return None
-
     async def get_by_name(self, name: str) -> Optional[DBStyle]:
         stmt = select(StyleOrm).where(StyleOrm.name == name)
         result = await self.session.execute(stmt)
@@ -81,26 +69,3 @@ class StyleRepositoryImpl:
             name=style.name,
             image_url=style.image_url
         )
-
-    @staticmethod
-    def _map_to_db_style_workouts(style: StyleOrm) -> DBStyleWorkout:
-        return DBStyleWorkout(
-            id=style.id,
-            name=style.name,
-            image_url=style.image_url,
-            workouts=[DBWorkout(id=workout_orm.id,
-                                name=workout_orm.name,
-                                calories=workout_orm.calories,
-                                duration=workout_orm.duration,
-                                level=workout_orm.level,
-                                description=workout_orm.description,
-                                dance_video=workout_orm.dance_video,
-                                thumbnail_image=workout_orm.thumbnail_image,
-                                author_name=workout_orm.author_name,
-                                views_count=workout_orm.views_count,
-                                style_id=workout_orm.style_id,
-                                tags=[
-                                    DBTag(id=tag.id, name=tag.name, usages=tag.usages)
-                                    for tag in workout_orm.tags],
-                                ) for workout_orm in style.workouts]
-        )
@@ -1,13 +1,15 @@
 from typing import Optional, List, Tuple
 
-from sqlalchemy import select, func
+from sqlalchemy import select, update, func, or_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
-from src.adapters.database.models import TagOrm, WorkoutOrm
-from src.domain.entities.tag import DBTagWorkout, Tag, DBTag
-from src.domain.entities.workout import DBWorkout
-from src.domain.exceptions.base import NotFound
+from src.adapters.database.common.pagination import paginate
+from src.adapters.database.common.versions import collection_version
+from src.adapters.database.models import TagOrm, workout_tag_association_orm
+from src.domain.entities.tag import Tag, DBTag
+from src.domain.value_objects.pagination import CountStrategy
+
+RECONCILE_USAGES_LOCK_ID = 0x7461677573  # 'tagus'
 
 
 class TagRepositoryImpl:
@@ -35,6 +37,14 @@ class TagRepositoryImpl:
         tag_orms = result.scalars().all()
         return [self._map_to_db_tag(tag_orm) for tag_orm in tag_orms]
 
+    async def list_index_entries(self) -> List[DBTag]:
+        stmt = select(TagOrm.id, TagOrm.name, TagOrm.usages)
+        result = await self._session.execute(stmt)
+        return [DBTag(id=tag_id, name=name, usages=usages or 0) for tag_id, name, usages in result.all()]
+
+    async def get_collection_version(self) -> Optional[str]:
+        return await collection_version(self._session, TagOrm.__table__)
+
     async def update(self, item: DBTag) -> None:
         stmt = select(TagOrm).where(TagOrm.id == item.id)
         result = await self._session.execute(stmt)
@@ -49,55 +59,48 @@ class TagRepositoryImpl:
         await self._session.delete(tag_orm)
         await self._session.flush()
 
-    async def increment_usages(self, tag_id: int) -> int:
-        stmt = select(TagOrm).where(TagOrm.id == tag_id)
+    async def reconcile_usages(self) -> int:
+        """Recount `usages` from the association table, fixing only rows that drifted.
+
+        Returns the number of corrected tags, or 0 when another worker holds the job.
+        """
+        locked = await self._session.scalar(select(func.pg_try_advisory_xact_lock(RECONCILE_USAGES_LOCK_ID)))
+        if not locked:
+            return 0
+        actual = select(func.count()).where(
+            workout_tag_association_orm.c.tag_id == TagOrm.id
+        ).scalar_subquery()
+        stmt = update(TagOrm).where(TagOrm.usages.is_distinct_from(actual)).values(usages=actual)
         result = await self._session.execute(stmt)
-        tag_orm = result.scalar_one_or_none()
-        if tag_orm.usages is None:
-            tag_orm.usages = 1
-        else:
-            tag_orm.usages += 1
-        await self._session.flush()
-        await self._session.refresh(tag_orm)
-        return tag_orm.usages
-
-    async def decrement_usages(self, tag_id: int) -> int:
-        stmt = select(TagOrm).where(TagOrm.id == tag_id)
-        result = await self._session.execute(stmt)
-        tag_orm = result.scalar_one_or_none()
-        if not tag_orm:
-            raise NotFound(f"Tag with id {tag_id} not found.")
-        if tag_orm.usages and tag_orm.usages > 0:
-            tag_orm.usages -= 1
-        await self._session.flush()
-        await self._session.refresh(tag_orm)
-        return tag_orm.usages
+        return result.rowcount
 
     async def search_by_constraints(
             self,
-            name: Optional[str] = None
+            name: Optional[str] = None,
+            limit: int = 20
     ) -> List[DBTag]:
         stmt = select(TagOrm)
         if name:
-            stmt = stmt.where(TagOrm.name.ilike(f"%{name}%"))
+            pattern = name.replace('/', '//').replace('%', '/%').replace('_', '/_')
+            stmt = (
+                stmt
+                .where(or_(
+                    TagOrm.name.ilike(f"%{pattern}%", escape='/'),
+                    TagOrm.name.bool_op('%')(name)
+                ))
+                .order_by(
+                    func.similarity(TagOrm.name, name).desc(),
+                    TagOrm.usages.desc().nulls_last(),
+                    TagOrm.id
+                )
+            )
+        else:
+            stmt = stmt.order_by(TagOrm.usages.desc().nulls_last(), TagOrm.id)
+        stmt = stmt.limit(limit)
         result = await self._session.execute(stmt)
         tag_orms = result.scalars().all()
         return [self._map_to_db_tag(tag_orm) for tag_orm in tag_orms]
 
-    async def get_with_workouts(self, tag_id: int) -> Optional[DBTagWorkout]:
-        stmt = (
-            select(TagOrm)
-            .where(TagOrm.id == tag_id)
-            .options(
-                selectinload(TagOrm.workouts).selectinload(WorkoutOrm.tags)
-            )
-        )
-        result = await self._session.execute(stmt)
-        tag_orm = result.scalar_one_or_none()
-        if tag_orm:
-            return self._map_to_db_tag_workouts(tag_orm)
-        return None
-
     async def get_by_name(self, name: str) -> Optional[DBTag]:
         stmt = select(TagOrm).where(TagOrm.name == name)
         result = await self._session.execute(stmt)
@@ -106,18 +109,16 @@ class TagRepositoryImpl:
             return self._map_to_db_tag(tag_orm)
         return None
 
-    async def list_paginated_tags(self, page: int, limit: int) -> Tuple[List[DBTag], int]:
-        total_count_stmt = select(func.count(TagOrm.id))
-        total_result = await self._session.execute(total_count_stmt)
-        total_count = total_result.scalar_one()
-
-        stmt = (
-            select(TagOrm)
-            .offset((page - 1) * limit)
-            .limit(limit)
+    async def list_paginated_tags(
+            self,
+            page: int,
+            limit: int,
+            count_strategy: CountStrategy = CountStrategy.EXACT
+    ) -> Tuple[List[DBTag], int]:
+        stmt = select(TagOrm).order_by(TagOrm.id)
+        tag_orms, total_count = await paginate(
+            self._session, stmt, page, limit, count_strategy, TagOrm.__table__
         )
-        result = await self._session.execute(stmt)
-        tag_orms = result.scalars().all()
         tags = [self._map_to_db_tag(tag_orm) for tag_orm in tag_orms]
 
         return tags, total_count
@@ -125,20 +126,13 @@ class TagRepositoryImpl:
     async def list_paginated_popular_tags(
             self,
             page: int,
-            page_size: int
+            page_size: int,
+            count_strategy: CountStrategy = CountStrategy.EXACT
     ) -> Tuple[List[DBTag], int]:
-        total_count_stmt = select(func.count(TagOrm.id))
-        total_result = await self._session.execute(total_count_stmt)
-        total_count = total_result.scalar_one()
-
-        stmt = (
-            select(TagOrm)
-            .order_by(TagOrm.usages.desc())
-            .offset((page - 1) * page_size)
-            .limit(page_size)
+        stmt = select(TagOrm).order_by(TagOrm.usages.desc(), TagOrm.id)
+        tag_orms, total_count = await paginate(
+            self._session, stmt, page, page_size, count_strategy, TagOrm.__table__
         )
-        result = await self._session.execute(stmt)
-        tag_orms = result.scalars().all()
         tags = [self._map_to_db_tag(tag_orm) for tag_orm in tag_orms]
 
         return tags, total_count
@@ -150,31 +144,3 @@ class TagRepositoryImpl:
             name=tag.name,
             usages=tag.usages
         )
-
-    @staticmethod
-    def _map_to_db_tag_workouts(tag: TagOrm) -> DBTagWorkout:
-        return DBTagWorkout(
-            id=tag.id,
-            name=tag.name,
-            usages=tag.usages,
-            workouts=[
-                DBWorkout(
-                    id=db_workout.id,
-                    name=db_workout.name,
-                    calories=db_workout.calories,
-                    duration=db_workout.duration,
-                    level=db_workout.level,
-                    description=db_workout.description,
-                    dance_video=db_workout.dance_video,
-                    thumbnail_image=db_workout.thumbnail_image,
-                    author_name=db_workout.author_name,
-                    views_count=db_workout.views_count,
-                    style_id=db_workout.style_id,
-                    tags=[
-                        DBTag(id=tag.id, name=tag.name, usages=tag.usages)
-                        for tag in db_workout.tags
-                    ],
-                )
-                for db_workout in tag.workouts
-            ]
-        )
@@ -0,0 +1,69 @@
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List
+
+from sqlalchemy import select, insert, delete, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.adapters.database.models import WorkoutOrm, WorkoutTrendingScoreOrm, workout_view_events
+from src.domain.entities.workout import WorkoutViewBuckets, WorkoutTrendingScore
+
+TRENDING_LOCK_ID = 0x7472656e64  # 'trend'
+
+
+class TrendingRepositoryImpl:
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def add_view_events(self, deltas: Dict[int, int]) -> None:
+        if not deltas:
+            return
+        stmt = insert(workout_view_events).values(
+            [{'workout_id': workout_id, 'views': views} for workout_id, views in sorted(deltas.items())]
+        )
+        await self._session.execute(stmt)
+
+    async def try_lock(self) -> bool:
+        return await self._session.scalar(select(func.pg_try_advisory_xact_lock(TRENDING_LOCK_ID)))
+
+    async def maintain_partitions(self, days_ahead: int, retention_days: int) -> int:
+        return await self._session.scalar(select(func.workout_view_events_maintain(days_ahead, retention_days)))
+
+    async def view_buckets(self, window_hours: int) -> WorkoutViewBuckets:
+        hour = func.date_trunc('hour', workout_view_events.c.viewed_at)
+        age_hours = func.extract('epoch', func.now() - hour) / 3600
+        stmt = (
+            select(
+                workout_view_events.c.workout_id,
+                WorkoutOrm.style_id,
+                age_hours.label('age_hours'),
+                func.sum(workout_view_events.c.views).label('views'),
+            )
+            .join(WorkoutOrm, WorkoutOrm.id == workout_view_events.c.workout_id)
+            .where(workout_view_events.c.viewed_at >= func.now() - timedelta(hours=window_hours))
+            .group_by(workout_view_events.c.workout_id, WorkoutOrm.style_id, hour)
+        )
+        result = await self._session.execute(stmt)
+        rows = result.all()
+        return WorkoutViewBuckets(
+            workout_ids=[row.workout_id for row in rows],
+            style_ids=[row.style_id for row in rows],
+            age_hours=[float(row.age_hours) for row in rows],
+            views=[row.views for row in rows],
+        )
+
+    async def replace_scores(self, scores: List[WorkoutTrendingScore]) -> None:
+        computed_at = datetime.now(timezone.utc)
+        await self._session.execute(delete(WorkoutTrendingScoreOrm))
+        if scores:
+            await self._session.execute(
+                insert(WorkoutTrendingScoreOrm),
+                [
+                    {
+                        'workout_id': score.workout_id,
+                        'style_id': score.style_id,
+                        'score': score.score,
+                        'computed_at': computed_at,
+                    }
+                    for score in scores
+                ]
+            )
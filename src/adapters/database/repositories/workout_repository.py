@@ -1,14 +1,14 @@
 from dataclasses import asdict
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Union
+import sqlalchemy as sa
 from sqlalchemy import select, update, delete, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from src.adapters.database.models import WorkoutOrm
 from src.domain.entities.style import DBStyle
-from src.domain.entities.workout import DBWorkout, Workout, DBWorkoutStyle
+from src.domain.entities.workout import DBWorkout, Workout, DBWorkoutStyle, WorkoutCounters
 from src.domain.entities.tag import DBTag
 
-
 class WorkoutRepositoryImpl:
     def __init__(
             self,
@@ -37,6 +37,11 @@ class WorkoutRepositoryImpl:
         workout_orm = result.scalar_one_or_none()
         return self._map_to_db_workout(workout_orm, True) if workout_orm else None
 
+    async def get_counters(self, workout_id: int) -> Optional[WorkoutCounters]:
+        stmt = select(WorkoutOrm.id, WorkoutOrm.views_count).where(WorkoutOrm.id == workout_id)
+        row = (await self._session.execute(stmt)).one_or_none()
+        return WorkoutCounters(id=row.id, views_count=row.views_count) if row else None
+
     async def get_by_name(self, workout_name: str) -> Optional[
         DBWorkout]:
         stmt = select(WorkoutOrm).where(WorkoutOrm.name == workout_name).options(
@@ -84,16 +89,27 @@ class WorkoutRepositoryImpl:
         await self._session.execute(stmt)
         await self._session.flush()
 
-    async def update_workout_views(self, workout_id: int) -> DBWorkout:
-        stmt = select(WorkoutOrm).where(WorkoutOrm.id == workout_id).options(
-            selectinload(WorkoutOrm.tags),
+    async def add_views(self, deltas: Dict[int, int]) -> None:
+        if not deltas:
+            return
+        # Lock the rows in id order first: the planner picks the join order of
+        # the UPDATE below, so only this keeps concurrent flushes from other
+        # workers from deadlocking on each other.
+        await self._session.execute(
+            select(WorkoutOrm.id)
+            .where(WorkoutOrm.id.in_(deltas))
+            .order_by(WorkoutOrm.id)
+            .with_for_update()
         )
-        result = await self._session.execute(stmt)
-        workout_orm = result.scalar_one()
-
-        workout_orm.views_count += 1
-        await self._session.flush()
-        return self._map_to_db_workout(workout_orm, False)
+        increments = sa.values(
+            sa.column('id', sa.Integer),
+            sa.column('delta', sa.Integer),
+            name='increments'
+        ).data(sorted(deltas.items()))
+        stmt = update(WorkoutOrm).where(WorkoutOrm.id == increments.c.id).values(
+            views_count=WorkoutOrm.views_count + increments.c.delta
+        )
+        await self._session.execute(stmt)
 
     @staticmethod
     def _map_to_db_workout(workout_orm: WorkoutOrm, with_style: bool) -> Union[DBWorkout, DBWorkoutStyle]:
@@ -1,3 +1,5 @@
+from typing import List
+
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, delete, insert
 from sqlalchemy.dialects.postgresql import insert
@@ -16,6 +18,21 @@ class WorkoutTagAssociationRepository:
         await self._session.execute(stmt)
         await self._session.commit()
 
+    async def insert_workout_tag_associations(self, workout_id: int, tag_ids: List[int]) -> None:
+        if not tag_ids:
+            return
+        stmt = insert(workout_tag_association_orm).values(
+            [{'workout_id': workout_id, 'tag_id': tag_id} for tag_id in dict.fromkeys(tag_ids)]
+        )
+        stmt = stmt.on_conflict_do_nothing(index_elements=['workout_id', 'tag_id'])
+        await self._session.execute(stmt)
+
+    async def delete_by_workout_id(self, workout_id: int) -> None:
+        stmt = delete(workout_tag_association_orm).where(
+            workout_tag_association_orm.c.workout_id == workout_id
+        )
+        await self._session.execute(stmt)
+
     async def delete_workout_tag_association(self, workout_id: int, tag_id: int):
         stmt = delete(workout_tag_association_orm).where(
             workout_tag_association_orm.c.workout_id == workout_id,
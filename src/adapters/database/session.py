@@ -1,5 +1,5 @@
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import AsyncIterator
 
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
@@ -9,16 +9,22 @@ from sqlalchemy.ext.asyncio import (
 )
 from sqlalchemy.orm import sessionmaker
 
+from src.adapters.database.pool import InstrumentedQueuePool
 from src.main.config import DBSettings
 
 
-async def get_engine(settings: DBSettings) -> AsyncGenerator[AsyncEngine, None]:
+@asynccontextmanager
+async def get_engine(settings: DBSettings) -> AsyncIterator[AsyncEngine]:
     engine = create_async_engine(
-        settings.db_uri
+        settings.db_uri,
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.pool_size,
+        max_overflow=settings.max_overflow
     )
-    yield engine
-
-    await engine.dispose()
+    try:
+        yield engine
+    finally:
+        await engine.dispose()
 
 
 async def get_async_sessionmaker(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
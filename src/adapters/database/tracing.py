@@ -0,0 +1,160 @@
+"""Per-request SQL tracing on top of the engine's cursor events.
+
+Every statement the engine runs is timed. Statements over the slow threshold
+are logged with their parameters reduced to type names. Inside a trace (one
+per HTTP request, see QueryTracingMiddleware) statements are also counted by
+fingerprint, the statement with literals and placeholders folded, so the same
+query issued once per row of an earlier result shows up as one fingerprint
+repeated many times.
+
+SQLAlchemy runs the events in a greenlet that shares the awaiting task's
+context, so the current trace is found through a ContextVar.
+"""
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Iterator, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.adapters.observability.metrics import DB_QUERIES_PER_REQUEST, DB_REPEATED_QUERIES, DB_SLOW_QUERIES, \
+    DB_TIME_PER_REQUEST
+
+logger = logging.getLogger(__name__)
+
+# asyncpg renders bind parameters with a cast, such as `$1::INTEGER` or
+# `$2::TIMESTAMP WITH TIME ZONE`; the cast is folded with the placeholder.
+_CAST = r"(?:::\w+(?:\(\d+(?:,\s*\d+)?\))?(?:\s+WITH(?:OUT)?\s+TIME\s+ZONE)?(?:\[\])?)?"
+_LITERALS = re.compile(r"(?:'(?:[^']|'')*'|\$\d+|%\(\w+\)s|\b\d+(?:\.\d+)?\b)" + _CAST)
+_VALUE_LISTS = re.compile(r"\(\s*\?" + _CAST + r"(?:\s*,\s*\?" + _CAST + r")*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+_current_trace: ContextVar[Optional['QueryTrace']] = ContextVar('query_trace', default=None)
+
+
+@lru_cache(maxsize=2048)
+def fingerprint(statement: str) -> str:
+    """The statement with literals and bind placeholders as `?` and IN lists as `(...)`."""
+    normalized = _LITERALS.sub('?', _WHITESPACE.sub(' ', statement).strip())
+    return _VALUE_LISTS.sub('(...)', normalized)
+
+
+def redact_parameters(parameters: Any, executemany: bool = False) -> str:
+    """Describe bind parameters without their values."""
+    if executemany:
+        return f'<{len(parameters)} parameter sets>'
+    if isinstance(parameters, dict):
+        return '{' + ', '.join(f'{key}: {type(value).__name__}' for key, value in parameters.items()) + '}'
+    if isinstance(parameters, (list, tuple)):
+        return '(' + ', '.join(type(value).__name__ for value in parameters) + ')'
+    return type(parameters).__name__
+
+
+@dataclass
+class QueryTrace:
+    name: str
+    queries: int = 0
+    duration: float = 0.0
+    fingerprints: Counter = field(default_factory=Counter)
+
+    def repeated(self, threshold: int) -> List[tuple]:
+        """Fingerprints issued at least `threshold` times, most repeated first."""
+        return [(statement, count) for statement, count in self.fingerprints.most_common() if count >= threshold]
+
+
+def current_trace() -> Optional[QueryTrace]:
+    return _current_trace.get()
+
+
+class QueryTracer:
+    def __init__(self, slow_query_s: float, repeat_threshold: int):
+        self._slow_query_s = slow_query_s
+        self._repeat_threshold = repeat_threshold
+        self._watchers: List[List[QueryTrace]] = []
+
+    def install(self, engine: AsyncEngine) -> None:
+        event.listen(engine.sync_engine, 'before_cursor_execute', self._before_cursor_execute)
+        event.listen(engine.sync_engine, 'after_cursor_execute', self._after_cursor_execute)
+
+    @contextmanager
+    def trace(self, name: str) -> Iterator[QueryTrace]:
+        trace = QueryTrace(name)
+        token = _current_trace.set(trace)
+        try:
+            yield trace
+        finally:
+            _current_trace.reset(token)
+            self._finish(trace)
+
+    @contextmanager
+    def watch(self) -> Iterator[List[QueryTrace]]:
+        """Collect every trace finished while the block runs, from any thread."""
+        finished: List[QueryTrace] = []
+        self._watchers.append(finished)
+        try:
+            yield finished
+        finally:
+            self._watchers.remove(finished)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        context._query_started = time.perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        elapsed = time.perf_counter() - context._query_started
+        trace = _current_trace.get()
+        if trace is not None:
+            trace.queries += 1
+            trace.duration += elapsed
+            trace.fingerprints[fingerprint(statement)] += 1
+        if elapsed >= self._slow_query_s:
+            DB_SLOW_QUERIES.inc()
+            logger.warning(
+                "Slow query (%.1f ms%s): %s parameters=%s",
+                elapsed * 1000, f', {trace.name}' if trace is not None else '',
+                _WHITESPACE.sub(' ', statement).strip(), redact_parameters(parameters, executemany)
+            )
+
+    def _finish(self, trace: QueryTrace) -> None:
+        DB_QUERIES_PER_REQUEST.observe(trace.queries)
+        DB_TIME_PER_REQUEST.observe(trace.duration)
+        for statement, count in trace.repeated(self._repeat_threshold):
+            DB_REPEATED_QUERIES.inc()
+            logger.warning("Possible N+1 in %s: %s queries like %s", trace.name, count, statement)
+        logger.debug("%s: %s queries in %.1f ms", trace.name, trace.queries, trace.duration * 1000)
+        for finished in self._watchers:
+            finished.append(trace)
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+@contextmanager
+def assert_query_budget(tracer: QueryTracer, max_queries: int, max_repeats: Optional[int] = None) -> Iterator[None]:
+    """Fail when a request made inside the block, or the block itself, goes over budget.
+
+        with assert_query_budget(app.state.query_tracer, 4, max_repeats=1):
+            client.post('/api/v1/workouts/', ...)
+
+    Requests are traced by QueryTracingMiddleware, so test clients that run
+    the app in another thread are covered too. `max_repeats` bounds how often
+    one fingerprint may run per trace.
+    """
+    with tracer.watch() as finished, tracer.trace('assert_query_budget'):
+        yield
+    for trace in finished:
+        if trace.queries > max_queries:
+            raise QueryBudgetExceeded(
+                f"{trace.name} ran {trace.queries} queries, budget is {max_queries}:\n" + '\n'.join(
+                    f'{count} x {statement}' for statement, count in trace.fingerprints.most_common()
+                )
+            )
+        if max_repeats is not None and trace.repeated(max_repeats + 1):
+            statement, count = trace.repeated(max_repeats + 1)[0]
+            raise QueryBudgetExceeded(f"{trace.name} ran {count} x {statement}, at most {max_repeats} allowed")
@@ -0,0 +1,205 @@
+import asyncio
+import glob
+import logging
+import os
+import uuid
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, TextIO
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.adapters.database.provider import get_workout_repository, get_trending_repository
+from src.adapters.snapshot.store import SnapshotLock
+
+logger = logging.getLogger(__name__)
+
+
+class WorkoutViewsBuffer:
+    """Write-behind aggregation of workout views for one worker process.
+
+    Views are counted in memory and every `flush_interval` seconds the
+    accumulated deltas go out as a single batched UPDATE, together with one
+    `workout_view_events` row per workout for trending. A failed flush keeps
+    its deltas for the next round; `stop` flushes whatever is left.
+
+    With `journal_path` set every view is also appended to a journal segment
+    of this worker (`<journal_path>.<worker>.<n>`). A flush seals the current
+    segment in the same step as it takes the counters, and deletes the sealed
+    segments once the write committed. A crash loses the views still in the
+    open segment's 64 KiB write buffer. Journal file I/O runs in worker
+    threads, off the event loop.
+
+    Every worker of a host shares `journal_path` but owns its segments,
+    proven by a lock on `<journal_path>.<worker>.owner` held while it runs.
+    On `start`, under the host-wide `<journal_path>.lock`, a worker adopts
+    the segments whose owner is gone: it renames them into its own name and
+    replays them, so each leftover view is counted exactly once however many
+    workers start together.
+    """
+
+    _JOURNAL_BUFFER = 1 << 16
+
+    def __init__(
+            self,
+            session_factory: async_sessionmaker[AsyncSession],
+            flush_interval: float = 0.5,
+            journal_path: Optional[str] = None
+    ):
+        self._session_factory = session_factory
+        self._flush_interval = flush_interval
+        self._journal_path = Path(journal_path) if journal_path else None
+        self._pending: Counter = Counter()
+        self._flushing: Counter = Counter()
+        self._flush_lock = asyncio.Lock()
+        self._journal: Optional[TextIO] = None
+        self._next_journal: Optional[TextIO] = None
+        self._next_segment = 0
+        self._sealed: List[Path] = []
+        self._worker = uuid.uuid4().hex[:12]
+        self._owner: Optional[SnapshotLock] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def record(self, workout_id: int) -> int:
+        self._pending[workout_id] += 1
+        if self._journal is not None:
+            self._journal.write(f"{workout_id}\n")
+        return self.pending(workout_id)
+
+    def pending(self, workout_id: int) -> int:
+        return self._pending[workout_id] + self._flushing[workout_id]
+
+    async def start(self) -> None:
+        if self._journal_path is not None:
+            await asyncio.to_thread(self._replay_journal)
+            self._journal = await asyncio.to_thread(self._open_segment)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        try:
+            await self.flush()
+        finally:
+            if self._journal is not None:
+                await asyncio.to_thread(self._close_journal, not self._pending and not self._flushing)
+            if self._owner is not None:
+                await asyncio.to_thread(self._release_ownership)
+
+    async def flush(self) -> None:
+        async with self._flush_lock:
+            if not self._pending and not self._flushing:
+                return
+            if self._journal is not None and self._next_journal is None:
+                self._next_journal = await asyncio.to_thread(self._open_segment)
+
+            # No await between taking the counters and switching segments, so
+            # the sealed segments hold exactly the views now in `_flushing`.
+            self._flushing.update(self._pending)
+            self._pending = Counter()
+            if self._journal is not None:
+                sealed, self._journal, self._next_journal = self._journal, self._next_journal, None
+                self._sealed.append(Path(sealed.name))
+                await asyncio.to_thread(sealed.close)
+
+            await self._write(dict(self._flushing))
+            self._flushing = Counter()
+            if self._sealed:
+                sealed_paths, self._sealed = self._sealed, []
+                await asyncio.to_thread(_unlink_all, sealed_paths)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Flushing %d buffered workout views failed", sum(self._flushing.values()))
+
+    async def _write(self, deltas: Dict[int, int]) -> None:
+        async with self._session_factory() as session:
+            await get_workout_repository(session).add_views(deltas)
+            await get_trending_repository(session).add_view_events(deltas)
+            await session.commit()
+
+    def _journal_file(self, suffix: str) -> Path:
+        return self._journal_path.with_name(f"{self._journal_path.name}.{suffix}")
+
+    def _segment_path(self, segment: int) -> Path:
+        return self._journal_file(f"{self._worker}.{segment}")
+
+    def _open_segment(self) -> TextIO:
+        path = self._segment_path(self._next_segment)
+        self._next_segment += 1
+        return path.open('a', buffering=self._JOURNAL_BUFFER)
+
+    def _close_journal(self, drop_current: bool) -> None:
+        for journal, drop in ((self._journal, drop_current), (self._next_journal, True)):
+            if journal is None:
+                continue
+            journal.close()
+            if drop:
+                Path(journal.name).unlink(missing_ok=True)
+        self._journal = self._next_journal = None
+
+    def _replay_journal(self) -> None:
+        replay_lock = SnapshotLock(self._journal_file('lock'))
+        replay_lock.acquire()
+        try:
+            self._owner = SnapshotLock(self._journal_file(f"{self._worker}.owner"))
+            self._owner.acquire()
+            adopted = [self._adopt(path) for path in self._orphaned_segments()]
+        finally:
+            replay_lock.release()
+
+        for path in adopted:
+            with path.open() as journal:
+                # A torn last line from a crash has no newline yet and is skipped.
+                self._pending.update(int(line) for line in journal if line.endswith('\n'))
+        # Deleted by the first flush that writes their views.
+        self._sealed.extend(adopted)
+        if self._pending:
+            logger.info("Replayed %d workout views from %s", sum(self._pending.values()), self._journal_path)
+
+    def _orphaned_segments(self) -> List[Path]:
+        prefix = f"{self._journal_path.name}."
+        # Journals from before per-worker segments have no owner.
+        orphaned = [path for path in (self._journal_path, self._journal_file('flushing')) if path.exists()]
+        by_worker: Dict[str, List[Path]] = {}
+        for path in self._journal_path.parent.glob(f"{glob.escape(prefix)}*"):
+            suffix = path.name[len(prefix):]
+            worker, _, segment = suffix.partition('.')
+            if suffix.isdigit():
+                orphaned.append(path)
+            elif segment.isdigit():
+                by_worker.setdefault(worker, []).append(path)
+
+        for worker, paths in by_worker.items():
+            owner_path = self._journal_file(f"{worker}.owner")
+            owner = SnapshotLock(owner_path)
+            if not owner.acquire(blocking=False):
+                continue
+            orphaned.extend(paths)
+            owner.release()
+            owner_path.unlink(missing_ok=True)
+        return orphaned
+
+    def _adopt(self, path: Path) -> Path:
+        adopted = self._segment_path(self._next_segment)
+        self._next_segment += 1
+        os.replace(path, adopted)
+        return adopted
+
+    def _release_ownership(self) -> None:
+        self._owner.release()
+        self._owner = None
+        self._journal_file(f"{self._worker}.owner").unlink(missing_ok=True)
+
+
+def _unlink_all(paths: List[Path]) -> None:
+    for path in paths:
+        path.unlink(missing_ok=True)
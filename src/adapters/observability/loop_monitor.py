@@ -0,0 +1,138 @@
+"""Event loop lag and blocking-call detection for one worker.
+
+A task sleeps `interval` seconds at a time and measures how late it wakes
+up: that lateness is how long every other ready callback waited too, and it
+is exported as a histogram. A wake-up later than `block_threshold` is a
+stall. With `capture_stacks`, a watchdog thread notices a stall while it is
+still going on and grabs the loop thread's stack, so the log names the
+blocking call and not just its duration.
+"""
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator, List, Optional
+
+from src.adapters.observability.metrics import EVENT_LOOP_LAG, EVENT_LOOP_STALLS
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LoopStall:
+    duration: float
+    stack: Optional[str]
+
+
+class LoopLagMonitor:
+    def __init__(self, interval: float, block_threshold: float, capture_stacks: bool = False):
+        self._interval = interval
+        self._block_threshold = block_threshold
+        self._capture_stacks = capture_stacks
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        self._loop_thread_id: Optional[int] = None
+        self._heartbeat = time.monotonic()
+        self._captured_stack: Optional[str] = None
+        self._watchers: List[List[LoopStall]] = []
+
+    def start(self) -> None:
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._task = asyncio.create_task(self._run(), name='event loop lag monitor')
+        if self._capture_stacks:
+            self._stopping.clear()
+            self._watchdog = threading.Thread(target=self._watch, name='event loop watchdog', daemon=True)
+            self._watchdog.start()
+
+    async def stop(self) -> None:
+        if self._watchdog:
+            self._stopping.set()
+            await asyncio.to_thread(self._watchdog.join)
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    @contextmanager
+    def watch(self) -> Iterator[List[LoopStall]]:
+        """Collect every stall that ends while the block runs."""
+        stalls: List[LoopStall] = []
+        self._watchers.append(stalls)
+        try:
+            yield stalls
+        finally:
+            self._watchers.remove(stalls)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self._interval
+            await asyncio.sleep(self._interval)
+            lag = max(0.0, loop.time() - expected)
+            self._heartbeat = time.monotonic()
+            EVENT_LOOP_LAG.observe(lag)
+            if lag >= self._block_threshold:
+                stack, self._captured_stack = self._captured_stack, None
+                self._report(LoopStall(lag, stack))
+
+    def _watch(self) -> None:
+        # A heartbeat older than one interval plus the threshold means the
+        # loop is blocked right now; take one stack per stall.
+        reported = None
+        while not self._stopping.wait(self._block_threshold / 2):
+            heartbeat = self._heartbeat
+            if heartbeat == reported or time.monotonic() - heartbeat < self._interval + self._block_threshold:
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is not None:
+                self._captured_stack = ''.join(traceback.format_list(_callback_frames(frame)))
+            reported = heartbeat
+
+    def _report(self, stall: LoopStall) -> None:
+        EVENT_LOOP_STALLS.inc()
+        if stall.stack:
+            logger.warning("Event loop blocked for %.0f ms in:\n%s", stall.duration * 1000, stall.stack)
+        else:
+            logger.warning("Event loop blocked for %.0f ms", stall.duration * 1000)
+        for stalls in self._watchers:
+            stalls.append(stall)
+
+
+def _callback_frames(frame) -> traceback.StackSummary:
+    # Drop the event loop's own frames above the running callback; under
+    # uvloop there are none to drop.
+    frames = traceback.extract_stack(frame)
+    for position in range(len(frames) - 1, -1, -1):
+        if frames[position].filename == asyncio.events.__file__ and frames[position].name == '_run':
+            return traceback.StackSummary.from_list(frames[position + 1:])
+    return frames
+
+
+class LoopBlocked(AssertionError):
+    pass
+
+
+@contextmanager
+def assert_loop_not_blocked(monitor: LoopLagMonitor) -> Iterator[None]:
+    """Fail if the event loop stalls while the block runs; the test mode.
+
+    Wrap a test, or a whole session's client, with a low
+    LOOP_BLOCK_THRESHOLD_MS and LOOP_MONITOR_CAPTURE_STACKS=true:
+
+        with TestClient(app) as client, assert_loop_not_blocked(app.state.loop_monitor):
+            ...
+    """
+    with monitor.watch() as stalls:
+        yield
+    if stalls:
+        raise LoopBlocked(f"Event loop blocked {len(stalls)} time(s):\n" + '\n'.join(
+            f'{stall.duration * 1000:.0f} ms' + (f' in:\n{stall.stack}' if stall.stack else '') for stall in stalls
+        ))
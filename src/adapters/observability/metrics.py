@@ -0,0 +1,162 @@
+"""Prometheus metrics of one worker process.
+
+When PROMETHEUS_MULTIPROC_DIR is set (src.main.server sets it for every
+server), prometheus_client keeps each process's values in its own mmap-backed
+files, so recording never waits on another worker, and a scrape sums the files
+of all workers. Without it, as under a plain `uvicorn` in development, the
+values live in this process only.
+"""
+import inspect
+import os
+import time
+from functools import wraps
+from typing import Callable, Dict, Optional, Tuple
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, \
+    generate_latest, multiprocess
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import Request
+from starlette.responses import Response
+
+from src.application.common.cache import CacheStats, ReadThroughCache
+from src.adapters.database.notifications import CacheInvalidationFeed, InvalidationStats
+from src.adapters.observability.timing import add_timing, timed
+from src.domain.entities.upload import UploadResponse
+from src.domain.services.upload import UploadService
+
+LATENCY_BUCKETS = (.001, .0025, .005, .01, .025, .05, .1, .25, .5, 1.0, 2.5, 5.0, 10.0)
+WAIT_BUCKETS = (.0001, .0005, .001, .005, .01, .05, .1, .5, 1.0, 5.0, 30.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89)
+
+HTTP_REQUEST_DURATION = Histogram(
+    'http_request_duration_seconds', 'HTTP request latency by route template',
+    ('method', 'route', 'status'), buckets=LATENCY_BUCKETS
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    'http_requests_in_progress', 'HTTP requests being handled', multiprocess_mode='livesum'
+)
+DB_POOL_CONNECTIONS = Gauge(
+    'db_pool_connections', 'Connections held by the pool, idle or in use', multiprocess_mode='livesum'
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    'db_pool_checked_out', 'Pool connections currently in use', multiprocess_mode='livesum'
+)
+DB_POOL_OVERFLOW = Gauge(
+    'db_pool_overflow', 'Connections open beyond pool_size', multiprocess_mode='livesum'
+)
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    'db_pool_checkout_wait_seconds', 'Time to get a pool connection, including opening a new one',
+    buckets=WAIT_BUCKETS
+)
+DB_QUERIES_PER_REQUEST = Histogram(
+    'db_queries_per_request', 'SQL statements run per HTTP request', buckets=QUERY_COUNT_BUCKETS
+)
+DB_TIME_PER_REQUEST = Histogram(
+    'db_time_per_request_seconds', 'Summed SQL statement time per HTTP request', buckets=LATENCY_BUCKETS
+)
+DB_SLOW_QUERIES = Counter('db_slow_queries', 'SQL statements over the slow query threshold')
+DB_REPEATED_QUERIES = Counter(
+    'db_repeated_queries', 'Statement fingerprints repeated past the N+1 threshold within one request'
+)
+INTERACTOR_DURATION = Histogram(
+    'interactor_duration_seconds', 'Interactor method latency, session included',
+    ('interactor', 'method'), buckets=LATENCY_BUCKETS
+)
+EVENT_LOOP_LAG = Histogram(
+    'event_loop_lag_seconds', 'How late a timer on the event loop fired', buckets=WAIT_BUCKETS
+)
+EVENT_LOOP_STALLS = Counter('event_loop_stalls', 'Event loop lags over the blocking threshold')
+UPLOAD_BYTES = Counter('upload_bytes', 'Bytes of uploaded files stored', ('directory',))
+CACHE_READS = Counter('cache_reads', 'Read-through cache lookups by outcome', ('outcome',))
+CACHE_INVALIDATIONS = Counter('cache_invalidations', 'Tag invalidations applied to the cache')
+CACHE_FLUSHES = Counter('cache_flushes', 'Full cache flushes')
+CACHE_REMOTE_INVALIDATIONS = Counter(
+    'cache_remote_invalidations', 'Invalidations received from other workers'
+)
+CACHE_REMOTE_INVALIDATION_LATENCY = Counter(
+    'cache_remote_invalidation_latency_seconds', 'Summed delivery latency of invalidations from other workers'
+)
+
+_interactor_histograms: Dict[Tuple[str, str], Histogram] = {}
+
+
+def render_metrics() -> bytes:
+    if 'PROMETHEUS_MULTIPROC_DIR' not in os.environ:
+        return generate_latest(REGISTRY)
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry)
+
+
+async def metrics_endpoint(_request: Request) -> Response:
+    # Merging every worker's files is file I/O, so keep it off the event loop.
+    return Response(await run_in_threadpool(render_metrics), media_type=CONTENT_TYPE_LATEST)
+
+
+def mark_worker_stopped() -> None:
+    """Drop this process's live gauges from the totals; call on worker shutdown."""
+    if 'PROMETHEUS_MULTIPROC_DIR' in os.environ:
+        multiprocess.mark_process_dead(os.getpid())
+
+
+def instrument_interactor(method: Callable) -> Callable:
+    """Wrap a bound async interactor method so each call is timed, also for Server-Timing."""
+    if not inspect.iscoroutinefunction(method):
+        return method
+    key = (type(method.__self__).__name__, method.__name__)
+    histogram = _interactor_histograms.get(key)
+    if histogram is None:
+        histogram = _interactor_histograms[key] = INTERACTOR_DURATION.labels(*key)
+
+    @wraps(method)
+    async def timed(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return await method(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - started
+            histogram.observe(elapsed)
+            add_timing('interactor', elapsed)
+
+    return timed
+
+
+class MeteredUploadService(UploadService):
+    async def upload_file(self, file: bytes, filename: str, file_dir: str = '') -> UploadResponse:
+        with timed('file'):
+            response = await super().upload_file(file, filename, file_dir)
+        UPLOAD_BYTES.labels(file_dir or '.').inc(len(file))
+        return response
+
+    async def delete_file(self, file_path: str) -> bool:
+        with timed('file'):
+            return await super().delete_file(file_path)
+
+
+class CacheMetrics:
+    """Copies the in-process cache counters into Prometheus counters.
+
+    ReadThroughCache keeps plain integer counters on its hot path; `sync`
+    adds what changed since the previous call and runs as a periodic job.
+    """
+
+    def __init__(self, cache: ReadThroughCache, invalidation_feed: Optional[CacheInvalidationFeed] = None):
+        self._cache = cache
+        self._invalidation_feed = invalidation_feed
+        self._cache_seen = CacheStats()
+        self._feed_seen = InvalidationStats()
+
+    async def sync(self) -> None:
+        stats, seen = self._cache.stats, self._cache_seen
+        CACHE_READS.labels('hit').inc(stats.hits - seen.hits)
+        CACHE_READS.labels('miss').inc(stats.misses - seen.misses)
+        CACHE_READS.labels('coalesced').inc(stats.coalesced - seen.coalesced)
+        CACHE_INVALIDATIONS.inc(stats.invalidations - seen.invalidations)
+        CACHE_FLUSHES.inc(stats.flushes - seen.flushes)
+        self._cache_seen = CacheStats(**vars(stats))
+
+        if self._invalidation_feed is not None:
+            stats, seen = self._invalidation_feed.stats, self._feed_seen
+            CACHE_REMOTE_INVALIDATIONS.inc(stats.received - seen.received)
+            CACHE_REMOTE_INVALIDATION_LATENCY.inc(stats.latency_total - seen.latency_total)
+            self._feed_seen = InvalidationStats(**vars(stats))
@@ -0,0 +1,51 @@
+"""Sampling profiles of single requests, kept as speedscope JSON files.
+
+Needs the `profiling` extra. Open a profile at https://www.speedscope.app.
+"""
+import os
+import time
+import uuid
+from pathlib import Path
+
+from pyinstrument import Profiler
+from pyinstrument.renderers import SpeedscopeRenderer
+
+PROFILE_SUFFIX = '.speedscope.json'
+
+
+class ProfileStore:
+    """A directory of request profiles holding at most `max_profiles`, oldest dropped first."""
+
+    def __init__(self, directory: Path, max_profiles: int, interval_s: float):
+        self._directory = directory
+        self._max_profiles = max_profiles
+        self._interval_s = interval_s
+
+    def start(self, description: str) -> Profiler:
+        # async_mode follows the request's task across awaits, so time spent
+        # waiting on I/O shows as `await` frames and other tasks stay out.
+        profiler = Profiler(interval=self._interval_s, async_mode='enabled')
+        profiler.start(target_description=description)
+        return profiler
+
+    @staticmethod
+    def new_id() -> str:
+        return f"{time.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:8]}"
+
+    def path(self, profile_id: str) -> Path:
+        return self._directory / f'{profile_id}{PROFILE_SUFFIX}'
+
+    def save(self, profile_id: str, profiler: Profiler) -> Path:
+        """Render a stopped profiler and write it; blocking, run it in a thread."""
+        self._directory.mkdir(parents=True, exist_ok=True)
+        path = self.path(profile_id)
+        temporary = path.with_name(f'.{path.name}.tmp')
+        temporary.write_text(profiler.output(SpeedscopeRenderer()))
+        os.replace(temporary, path)
+        self._prune()
+        return path
+
+    def _prune(self) -> None:
+        profiles = sorted(self._directory.glob(f'*{PROFILE_SUFFIX}'), key=lambda path: path.stat().st_mtime)
+        for path in profiles[:-self._max_profiles]:
+            path.unlink(missing_ok=True)
@@ -0,0 +1,64 @@
+"""Where a request's time went, for the Server-Timing response header.
+
+Code on the request path reports into the current request's RequestTimings
+through a ContextVar; outside a sampled request there is nothing to report
+into and `timed` only reads the variable. Phases nest (the interactor's
+time includes its queries), so the parts need not add up to the total.
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+
+PHASES = {
+    'auth': 'Authentication',
+    'db': 'SQL statements',
+    'interactor': 'Interactor',
+    'serialize': 'Serialization',
+    'file': 'File I/O',
+    'total': 'Until response start',
+}
+
+_current_timings: ContextVar[Optional['RequestTimings']] = ContextVar('request_timings', default=None)
+
+
+class RequestTimings:
+    def __init__(self):
+        self.durations: Dict[str, float] = {}
+
+    def add(self, phase: str, seconds: float) -> None:
+        self.durations[phase] = self.durations.get(phase, 0.0) + seconds
+
+    def header(self) -> str:
+        return ', '.join(
+            f'{phase};dur={self.durations[phase] * 1000:.2f};desc="{description}"'
+            for phase, description in PHASES.items() if phase in self.durations
+        )
+
+
+@contextmanager
+def collect_timings(timings: RequestTimings) -> Iterator[RequestTimings]:
+    token = _current_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _current_timings.reset(token)
+
+
+def add_timing(phase: str, seconds: float) -> None:
+    timings = _current_timings.get()
+    if timings is not None:
+        timings.add(phase, seconds)
+
+
+@contextmanager
+def timed(phase: str) -> Iterator[None]:
+    timings = _current_timings.get()
+    if timings is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(phase, time.perf_counter() - started)
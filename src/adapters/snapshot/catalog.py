@@ -0,0 +1,155 @@
+import asyncio
+import logging
+import time
+from bisect import bisect_left
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.adapters.database.provider import get_tag_repository
+from src.adapters.snapshot.format import Snapshot, SnapshotBuilder
+from src.adapters.snapshot.store import SnapshotStore
+from src.application.tag.autocomplete import TagAutocompleteIndex, TagList
+from src.domain.entities.tag import DBTag
+
+logger = logging.getLogger(__name__)
+
+SECTIONS = ('tags.keys', 'tags.ids', 'tags.names', 'tags.usages', 'tags.by_rank', 'tags.by_id')
+
+
+class SnapshotTags:
+    """`SortedTags` read straight from a mapped catalog snapshot."""
+
+    def __init__(self, snapshot: Snapshot):
+        self.keys = snapshot.strings('tags.keys')
+        self.ids = snapshot.ints('tags.ids')
+        self.names = snapshot.strings('tags.names')
+        self.usages = snapshot.ints('tags.usages')
+        self.by_rank = snapshot.ints('tags.by_rank')
+        self._by_id = snapshot.ints('tags.by_id')
+
+    def position(self, tag_id: int) -> Optional[int]:
+        found = bisect_left(self._by_id, tag_id, key=self.ids.__getitem__)
+        if found < len(self._by_id) and self.ids[self._by_id[found]] == tag_id:
+            return self._by_id[found]
+        return None
+
+
+def build_catalog_snapshot(tags: Iterable[DBTag], generation: int, built_at: float) -> bytes:
+    ordered = TagList(tags)
+    builder = SnapshotBuilder()
+    builder.add_strings('tags.keys', ordered.keys)
+    builder.add_ints('tags.ids', ordered.ids)
+    builder.add_strings('tags.names', ordered.names)
+    builder.add_ints('tags.usages', ordered.usages)
+    builder.add_ints('tags.by_rank', ordered.by_rank)
+    builder.add_ints('tags.by_id', sorted(range(len(ordered.ids)), key=ordered.ids.__getitem__))
+    return builder.build(generation, built_at)
+
+
+class CatalogSnapshotLoader:
+    """Loads the tag autocomplete index from the catalog snapshot shared by this host's workers.
+
+    The snapshot generation is the tags collection version. The first worker
+    to find the snapshot missing, outdated or older than `max_age` rebuilds it
+    under the store lock while the others wait, then everyone maps the same
+    file. If no matching snapshot can be had, the index is loaded from the
+    database as before. Usage counts do not bump the version; the index
+    applies the usage changes it has seen since a snapshot was built on top
+    of it, and `max_age` bounds how stale the usages of a worker that started
+    after those changes get.
+    """
+
+    _ATTEMPTS = 3
+
+    def __init__(
+            self,
+            store: SnapshotStore,
+            session_factory: async_sessionmaker[AsyncSession],
+            index: TagAutocompleteIndex,
+            max_age: float,
+            clock: Callable[[], float] = time.time
+    ):
+        self._store = store
+        self._session_factory = session_factory
+        self._index = index
+        self._max_age = max_age
+        self._clock = clock
+        self._loaded: Optional[Tuple[int, float]] = None
+
+    async def load_index(self) -> None:
+        # A rename committed between reading the version and swapping the
+        # index in would be lost, so check the version again afterwards.
+        for _ in range(self._ATTEMPTS):
+            generation = await self._load()
+            if generation == await self._tags_version():
+                return
+        logger.warning("Tags kept changing while loading the autocomplete index")
+
+    async def refresh(self) -> None:
+        snapshot = await self._open()
+        if snapshot is not None and (snapshot.generation, snapshot.built_at) == self._loaded \
+                and self._is_fresh(snapshot) and snapshot.generation == await self._tags_version():
+            return
+        await self.load_index()
+
+    async def _load(self) -> int:
+        version = await self._tags_version()
+        snapshot = await self._open()
+        if not self._matches(snapshot, version):
+            snapshot = await self._rebuild(version)
+        if self._matches(snapshot, version):
+            # built_at is when its tags were read, so usage changes seen since are kept.
+            self._index.load_sorted(SnapshotTags(snapshot), as_of=snapshot.built_at)
+            self._loaded = (snapshot.generation, snapshot.built_at)
+            return snapshot.generation
+
+        read_at = self._clock()
+        tags, version = await self._read_tags()
+        self._index.load(tags, as_of=read_at)
+        self._loaded = None
+        return version
+
+    async def _rebuild(self, version: int) -> Optional[Snapshot]:
+        lock = self._store.lock()
+        if lock.acquire(blocking=False):
+            try:
+                snapshot = await self._open()
+                if not self._matches(snapshot, version):
+                    read_at = self._clock()
+                    tags, version = await self._read_tags()
+                    data = await asyncio.to_thread(build_catalog_snapshot, tags, version, read_at)
+                    await asyncio.to_thread(self._store.publish, data)
+                    logger.info("Published catalog snapshot generation %s with %s tags", version, len(tags))
+            finally:
+                lock.release()
+        else:
+            # Another worker is rebuilding; wait for it to finish.
+            await asyncio.to_thread(lock.acquire)
+            lock.release()
+        return await self._open()
+
+    async def _open(self) -> Optional[Snapshot]:
+        # Opening maps the file and reads its header, which can block on disk.
+        return await asyncio.to_thread(self._store.open)
+
+    def _matches(self, snapshot: Optional[Snapshot], version: int) -> bool:
+        # A file written by an older build may lack sections; rebuilding replaces it.
+        return snapshot is not None and snapshot.generation == version and self._is_fresh(snapshot) \
+            and all(name in snapshot for name in SECTIONS)
+
+    def _is_fresh(self, snapshot: Snapshot) -> bool:
+        return self._clock() - snapshot.built_at < self._max_age
+
+    async def _tags_version(self) -> int:
+        async with self._session_factory() as session:
+            return int(await get_tag_repository(session).get_collection_version() or 0)
+
+    async def _read_tags(self) -> Tuple[List[DBTag], int]:
+        async with self._session_factory() as session:
+            # One snapshot for both reads, so the tags are exactly those of the version.
+            await session.connection(execution_options={'isolation_level': 'REPEATABLE READ'})
+            repository = get_tag_repository(session)
+            version = await repository.get_collection_version()
+            tags = await repository.list_index_entries()
+        return tags, int(version or 0)
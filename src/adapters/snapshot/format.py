@@ -0,0 +1,111 @@
+import mmap
+import struct
+from array import array
+from collections.abc import Sequence
+from typing import Dict, Iterable, List, Tuple
+
+MAGIC = b'CATSNAP1'
+
+# magic, generation, build time (unix seconds), section count
+_HEADER = struct.Struct('<8sqdI4x')
+# name, offset, length in bytes
+_SECTION = struct.Struct('<24sqq')
+_ALIGNMENT = 8
+
+
+class SnapshotFormatError(Exception):
+    pass
+
+
+class SnapshotBuilder:
+    """Lays out named columns in one buffer: int64 arrays and string tables.
+
+    A string table is a blob of UTF-8 text plus an int64 array of n + 1 offsets
+    into it. Sections start 8-byte aligned so they can be cast in place.
+    Integers are in the native byte order, since a snapshot never leaves the
+    host that built it.
+    """
+
+    def __init__(self):
+        self._sections: List[Tuple[str, bytes]] = []
+
+    def add_ints(self, name: str, values: Iterable[int]) -> None:
+        self._sections.append((name, array('q', values).tobytes()))
+
+    def add_strings(self, name: str, values: Iterable[str]) -> None:
+        blob = bytearray()
+        offsets = array('q', [0])
+        for value in values:
+            blob += value.encode()
+            offsets.append(len(blob))
+        self._sections.append((f'{name}.offsets', offsets.tobytes()))
+        self._sections.append((name, bytes(blob)))
+
+    def build(self, generation: int, built_at: float) -> bytes:
+        table_end = _HEADER.size + _SECTION.size * len(self._sections)
+        buffer = bytearray(_align(table_end))
+        _HEADER.pack_into(buffer, 0, MAGIC, generation, built_at, len(self._sections))
+        for number, (name, data) in enumerate(self._sections):
+            offset = len(buffer)
+            _SECTION.pack_into(buffer, _HEADER.size + _SECTION.size * number, name.encode(), offset, len(data))
+            buffer += data
+            buffer += bytes(_align(len(buffer)) - len(buffer))
+        return bytes(buffer)
+
+
+class StringColumn(Sequence):
+    """String table read in place; each item is decoded when accessed."""
+
+    def __init__(self, offsets: memoryview, blob: memoryview):
+        self._offsets = offsets
+        self._blob = blob
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, position: int) -> str:
+        if not 0 <= position < len(self):
+            raise IndexError(position)
+        return str(self._blob[self._offsets[position]:self._offsets[position + 1]], 'utf-8')
+
+
+class Snapshot:
+    """Read-only view over a snapshot buffer, usually a mapped file.
+
+    Columns are memoryviews into the buffer, so nothing is copied and pages
+    of a mapped file are shared by every process that maps it.
+    """
+
+    def __init__(self, buffer: mmap.mmap):
+        if len(buffer) < _HEADER.size:
+            raise SnapshotFormatError('Snapshot is truncated')
+        magic, self.generation, self.built_at, count = _HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise SnapshotFormatError('Not a catalog snapshot')
+        self._view = memoryview(buffer)
+        self._sections: Dict[str, Tuple[int, int]] = {}
+        for number in range(count):
+            name, offset, length = _SECTION.unpack_from(buffer, _HEADER.size + _SECTION.size * number)
+            if offset + length > len(buffer):
+                raise SnapshotFormatError('Snapshot is truncated')
+            self._sections[name.rstrip(b'\0').decode()] = (offset, length)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._sections
+
+    def ints(self, name: str) -> memoryview:
+        return self._section(name).cast('q')
+
+    def strings(self, name: str) -> StringColumn:
+        return StringColumn(self.ints(f'{name}.offsets'), self._section(name))
+
+    def _section(self, name: str) -> memoryview:
+        try:
+            offset, length = self._sections[name]
+        except KeyError:
+            raise SnapshotFormatError(f'Snapshot has no {name} section') from None
+        return self._view[offset:offset + length]
+
+
+def _align(size: int) -> int:
+    return -(-size // _ALIGNMENT) * _ALIGNMENT
@@ -0,0 +1,80 @@
+import fcntl
+import mmap
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from src.adapters.snapshot.format import Snapshot, SnapshotFormatError
+
+
+class SnapshotLock:
+    """Advisory file lock held by the process rebuilding a snapshot.
+
+    The OS drops it if that process dies, so waiters never hang on a crashed
+    builder.
+    """
+
+    def __init__(self, path: Path):
+        self._path = path
+        self._file = None
+
+    def acquire(self, blocking: bool = True) -> bool:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        lock_file = open(self._path, 'a')
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            lock_file.close()
+            return False
+        self._file = lock_file
+        return True
+
+    def release(self) -> None:
+        if self._file is not None:
+            fcntl.flock(self._file, fcntl.LOCK_UN)
+            self._file.close()
+            self._file = None
+
+
+class SnapshotStore:
+    """A snapshot file shared by the workers of one host.
+
+    A new generation is written to a temporary file and renamed over the
+    current one, so a reader maps either the old file or the new one, never a
+    partial write. Processes still mapping the old file keep reading it until
+    they open the store again.
+    """
+
+    def __init__(self, directory: Path, name: str = 'catalog'):
+        self._path = directory / f'{name}.snap'
+        self._lock_path = directory / f'{name}.lock'
+
+    def lock(self) -> SnapshotLock:
+        return SnapshotLock(self._lock_path)
+
+    def open(self) -> Optional[Snapshot]:
+        try:
+            with open(self._path, 'rb') as snapshot_file:
+                buffer = mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (FileNotFoundError, ValueError):
+            # ValueError: mapping an empty file.
+            return None
+        try:
+            return Snapshot(buffer)
+        except SnapshotFormatError:
+            buffer.close()
+            return None
+
+    def publish(self, data: bytes) -> None:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temporary_path = tempfile.mkstemp(dir=self._path.parent, prefix=f'.{self._path.name}.')
+        try:
+            with os.fdopen(fd, 'wb') as temporary_file:
+                temporary_file.write(data)
+                temporary_file.flush()
+                os.fsync(temporary_file.fileno())
+            os.replace(temporary_path, self._path)
+        except BaseException:
+            os.unlink(temporary_path)
+            raise
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional
 
 from src.domain.entities.upload import CreateUpload
 
@@ -18,3 +18,10 @@ class UpdateAvatarDTO:
 class ResponseAvatarDTO:
     id: int
     image_url: str
+
+
+@dataclass(kw_only=True)
+class VersionedAvatarsDTO:
+    """The avatar list with the collection version it was read at, cached together."""
+    version: Optional[str]
+    avatars: List[ResponseAvatarDTO]
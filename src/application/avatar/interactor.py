@@ -1,7 +1,9 @@
+import logging
 from dataclasses import asdict
-from typing import List
+from typing import Optional
 
-from src.application.avatar.dto import ResponseAvatarDTO, CreateAvatarDTO, UpdateAvatarDTO
+from src.application.avatar.dto import ResponseAvatarDTO, CreateAvatarDTO, UpdateAvatarDTO, VersionedAvatarsDTO
+from src.application.common.cache import ReadThroughCache
 from src.application.interfaces.repository import AvatarRepository
 from src.application.interfaces.uow import UoW
 from src.domain.entities.avatar import DBAvatar, Avatar
@@ -9,25 +11,42 @@ from src.domain.exceptions.base import NotFound, InternalServerError
 from src.domain.services.avatar import AvatarService
 from src.domain.services.upload import UploadService
 
+logger = logging.getLogger(__name__)
+
 
 class AvatarInteractor:
     def __init__(self,
                  avatar_repository: AvatarRepository,
                  uow: UoW,
                  avatar_service: AvatarService,
-                 upload_service: UploadService
+                 upload_service: UploadService,
+                 cache: ReadThroughCache
                  ):
         self._avatar_repository = avatar_repository
         self._uow = uow
         self._avatar_service = avatar_service
         self._upload_service = upload_service
+        self._cache = cache
+
+    async def get_all_avatars(self) -> VersionedAvatarsDTO:
+        # The version is cached with the list, so an ETag always names the body it is served with.
+        return await self._cache.get_or_load('avatars-versioned', self._load_avatars, tags=['avatars'])
 
-    async def get_all_avatars(self) -> List[ResponseAvatarDTO]:
-        result = await self._avatar_repository.list()
-        return [ResponseAvatarDTO(**asdict(r)) for r in result]
+    async def _load_avatars(self) -> VersionedAvatarsDTO:
+        # Version first: a write landing in between leaves it behind the rows, never ahead of them.
+        version = await self._avatar_repository.get_collection_version()
+        avatars = await self._avatar_repository.list()
+        return VersionedAvatarsDTO(version=version, avatars=[ResponseAvatarDTO(**asdict(r)) for r in avatars])
+
+    async def get_avatars_version(self) -> Optional[str]:
+        return await self._avatar_repository.get_collection_version()
 
     async def get_avatar_by_id(self, avatar_id: int) -> ResponseAvatarDTO:
-        db_avatar: DBAvatar = await self._avatar_repository.get(avatar_id)
+        db_avatar: DBAvatar = await self._cache.get_or_load(
+            f'avatar:{avatar_id}',
+            lambda: self._avatar_repository.get(avatar_id),
+            tags=['avatars']
+        )
         if db_avatar is None:
             raise NotFound("Avatar with such id not found")
         return ResponseAvatarDTO(**asdict(db_avatar))
@@ -42,13 +61,14 @@ class AvatarInteractor:
                 avatar_entity = self._avatar_service.create_avatar(image_url=file_path.url)
                 inserted_avatar: DBAvatar = await self._avatar_repository.add(avatar_entity)
                 await self._uow.commit()
-                return ResponseAvatarDTO(id=inserted_avatar.id, image_url=inserted_avatar.image_url)
-            except Exception as e:
+            except Exception:
                 if file_path is not None:
                     await self._upload_service.delete_file(file_path.url)
                 await self._uow.rollback()
-                print(e)
+                logger.exception("Failed to create avatar")
                 raise InternalServerError("Failed to create avatar")
+        await self._cache.invalidate('avatars')
+        return ResponseAvatarDTO(id=inserted_avatar.id, image_url=inserted_avatar.image_url)
 
     async def update_avatar(self, avatar_id: int, avatar: UpdateAvatarDTO) -> ResponseAvatarDTO:
         async with self._uow:
@@ -75,12 +95,13 @@ class AvatarInteractor:
                 await self._uow.commit()
                 if old_file_path:
                     await self._upload_service.delete_file(old_file_path)
-                return ResponseAvatarDTO(**asdict(updated_avatar))
             except Exception as e:
                 await self._uow.rollback()
                 if file_path:
                     await self._upload_service.delete_file(file_path.url)
                 raise InternalServerError(f"Something went wrong while updating avatar: {str(e)}")
+        await self._cache.invalidate('avatars')
+        return ResponseAvatarDTO(**asdict(updated_avatar))
 
     async def delete_avatar(self, avatar_id: int) -> None:
         async with self._uow:
@@ -96,3 +117,4 @@ class AvatarInteractor:
             except Exception as e:
                 await self._uow.rollback()
                 raise InternalServerError(f"Something went wrong while deleting avatar: {str(e)}")
+        await self._cache.invalidate('avatars')
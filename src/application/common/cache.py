@@ -0,0 +1,135 @@
+import asyncio
+import logging
+import random
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Optional, Sequence, TypeVar
+
+from src.application.interfaces.cache import Cache, InvalidationPublisher
+
+T = TypeVar('T')
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    invalidations: int = 0
+    flushes: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of reads served without a load; coalesced waits count as hits."""
+        reads = self.hits + self.coalesced + self.misses
+        return (self.hits + self.coalesced) / reads if reads else 0.0
+
+
+class ReadThroughCache:
+    """Read-through access to a `Cache` for interactors.
+
+    Concurrent misses for one key share a single load (stampede guard), and a
+    load that overlaps an invalidation is returned but not stored, so a read
+    racing a commit cannot put the old value back. The check is made both
+    here, per process, and by the cache against its tag generations, which
+    covers invalidations made by other workers sharing it. TTLs get a little jitter so
+    entries written together do not expire together. Not-found results (None)
+    are never cached. With a `publisher`, invalidations are also sent to the
+    other workers, which apply them through `invalidate_local`.
+    """
+
+    def __init__(
+            self,
+            cache: Cache,
+            ttl: float,
+            jitter: float = 0.1,
+            publisher: Optional[InvalidationPublisher] = None
+    ):
+        self._cache = cache
+        self._ttl = ttl
+        self._jitter = jitter
+        self._publisher = publisher
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._generation = 0
+        self._stats = CacheStats()
+
+    @property
+    def stats(self) -> CacheStats:
+        return self._stats
+
+    async def get_or_load(
+            self,
+            key: str,
+            loader: Callable[[], Awaitable[Optional[T]]],
+            tags: Sequence[str] = (),
+            ttl: Optional[float] = None
+    ) -> Optional[T]:
+        value = await self._cache.get(key)
+        if value is not None:
+            self._stats.hits += 1
+            return value
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self._stats.coalesced += 1
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise
+                # The request doing the load was cancelled, not this one.
+                return await self.get_or_load(key, loader, tags, ttl)
+
+        self._stats.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        generation = self._generation
+        try:
+            tag_generation = await self._cache.generation(tags)
+            value = await loader()
+            if value is not None and generation == self._generation:
+                await self._cache.set(key, value, self._expiry(ttl), tags, tag_generation)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            return value
+        finally:
+            del self._inflight[key]
+
+    async def invalidate(self, *tags: str) -> None:
+        """Drop every entry stored under any of `tags`; call after the write commits.
+
+        Failures are logged rather than raised: the write is already committed,
+        and whatever is left behind still expires with its TTL.
+        """
+        try:
+            await self.invalidate_local(tags)
+        except Exception:
+            logger.exception("Failed to invalidate cache tags %s", tags)
+        if self._publisher is not None:
+            try:
+                await self._publisher.publish(tags)
+            except Exception:
+                logger.exception("Failed to publish invalidation of cache tags %s", tags)
+
+    async def invalidate_local(self, tags: Sequence[str]) -> None:
+        self._generation += 1
+        self._stats.invalidations += 1
+        await self._cache.invalidate_tags(tags)
+
+    async def flush(self) -> None:
+        """Drop everything, for when invalidations may have been missed."""
+        self._generation += 1
+        self._stats.flushes += 1
+        await self._cache.clear()
+
+    def _expiry(self, ttl: Optional[float]) -> float:
+        ttl = self._ttl if ttl is None else ttl
+        return ttl * (1 + random.uniform(-self._jitter, self._jitter))
@@ -0,0 +1,42 @@
+from typing import Any, Optional, Protocol, Sequence
+
+
+class Cache(Protocol):
+    async def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None on a miss or after expiry."""
+        ...
+
+    async def generation(self, tags: Sequence[str]) -> Any:
+        """An opaque token for how often `tags` have been invalidated, for `set`."""
+        ...
+
+    async def set(
+            self,
+            key: str,
+            value: Any,
+            ttl: float,
+            tags: Sequence[str] = (),
+            generation: Any = None
+    ) -> None:
+        """Store `value` for `ttl` seconds; invalidating any of `tags` drops it.
+
+        With a `generation` token, the write is skipped if any of `tags` has been
+        invalidated since the token was taken.
+        """
+        ...
+
+    async def invalidate_tags(self, tags: Sequence[str]) -> None:
+        ...
+
+    async def clear(self) -> None:
+        """Drop every entry."""
+        ...
+
+    async def close(self) -> None:
+        ...
+
+
+class InvalidationPublisher(Protocol):
+    async def publish(self, tags: Sequence[str]) -> None:
+        """Tell the other workers to drop their entries stored under `tags`."""
+        ...
@@ -0,0 +1,64 @@
+from typing import List, Optional, Protocol, Tuple
+
+from src.application.workout.dto import VersionedWorkoutDTO, WorkoutCardResponseDTO, WorkoutResponseStyleDTO, \
+    WorkoutSearchResponseDTO
+from src.domain.entities.workout import WorkoutFilter
+from src.domain.value_objects.pagination import KeysetCursor
+from src.domain.value_objects.workout import WorkoutSortEnum
+
+
+class WorkoutReader(Protocol):
+    async def list_cards(
+            self,
+            filters: WorkoutFilter,
+            page: int,
+            page_size: int
+    ) -> Tuple[List[WorkoutCardResponseDTO], int]:
+        ...
+
+    async def list_trending_cards(
+            self,
+            style_id: Optional[int],
+            page: int,
+            page_size: int
+    ) -> Tuple[List[WorkoutCardResponseDTO], int]:
+        ...
+
+    async def list_all(self) -> List[WorkoutResponseStyleDTO]:
+        ...
+
+    async def search(
+            self,
+            query: str,
+            page: int,
+            page_size: int
+    ) -> Tuple[List[WorkoutSearchResponseDTO], int]:
+        ...
+
+    async def get_detail(self, workout_id: int) -> Optional[VersionedWorkoutDTO]:
+        ...
+
+    async def get_detail_version(self, workout_id: int) -> Optional[str]:
+        ...
+
+
+class StyleReader(Protocol):
+    async def get_detail_document(
+            self,
+            style_id: int,
+            sort: WorkoutSortEnum,
+            limit: int,
+            after: Optional[KeysetCursor] = None
+    ) -> Optional[bytes]:
+        ...
+
+
+class TagReader(Protocol):
+    async def get_detail_document(
+            self,
+            tag_id: int,
+            sort: WorkoutSortEnum,
+            limit: int,
+            after: Optional[KeysetCursor] = None
+    ) -> Optional[bytes]:
+        ...
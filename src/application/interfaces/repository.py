@@ -1,11 +1,12 @@
-from typing import Protocol, TypeVar, List, Optional, Union, Tuple
+from typing import Protocol, TypeVar, Dict, List, Optional, Tuple
 
 from src.domain.entities.avatar import DBAvatar
 from src.domain.entities.staff import DBStaff
-from src.domain.entities.style import DBStyle, DBStyleWorkout
-from src.domain.entities.tag import DBTag, DBTagWorkout
+from src.domain.entities.style import DBStyle
+from src.domain.entities.tag import DBTag
 from src.domain.entities.user import DBUser
-from src.domain.entities.workout import DBWorkout
+from src.domain.entities.workout import DBWorkout, WorkoutViewBuckets, WorkoutTrendingScore, WorkoutCounters
+from src.domain.value_objects.pagination import CountStrategy
 
 T = TypeVar('T')
 
@@ -37,44 +38,47 @@ class RoleRepository(Repository[DBStaff], Protocol):
         ...
 
 
-class StyleRepository(Repository[Union[DBStyleWorkout, DBStyle]], Protocol):
-    async def get_with_workouts(self, style_id: int) -> DBStyleWorkout | None:
+class StyleRepository(Repository[DBStyle], Protocol):
+    async def get_by_name(self, name: str) -> DBStyle | None:
         ...
 
-    async def get_by_name(self, name: str) -> DBStyle | None:
+    async def get_collection_version(self) -> Optional[str]:
         ...
 
 
-class TagRepository(Repository[Union[DBTag, DBTagWorkout]], Protocol):
-    async def get_with_workouts(self, tag_id: int) -> DBTagWorkout | None:
+class TagRepository(Repository[DBTag], Protocol):
+    async def get_by_name(self, name: str) -> DBTag | None:
         ...
 
-    async def get_by_name(self, name: str) -> DBTag | None:
+    async def list_index_entries(self) -> List[DBTag]:
         ...
 
-    async def increment_usages(self, tag_id: int) -> int:
+    async def get_collection_version(self) -> Optional[str]:
+        """Bumped when tags are added, renamed or deleted, not when usages change."""
         ...
 
-    async def decrement_usages(self, tag_id: int) -> int:
+    async def reconcile_usages(self) -> int:
         ...
 
     async def search_by_constraints(self,
                                     name: Optional[str] = None,
-                                    with_workout: Optional[bool] = False
-                                    ):
+                                    limit: int = 20
+                                    ) -> List[DBTag]:
         ...
 
     async def list_paginated_popular_tags(
             self,
             page: int,
-            page_size: int
+            page_size: int,
+            count_strategy: CountStrategy = CountStrategy.EXACT
     ) -> Tuple[List[DBTag], int]:
         ...
 
     async def list_paginated_tags(
             self,
             page: int,
-            page_size: int
+            page_size: int,
+            count_strategy: CountStrategy = CountStrategy.EXACT
     ) -> Tuple[List[DBTag], int]:
         ...
 
@@ -86,12 +90,34 @@ class WorkoutRepository(Repository[DBWorkout], Protocol):
     async def get_by_name(self, name: str) -> DBWorkout | None:
         ...
 
-    async def update_workout_views(self, workout_id) -> DBWorkout | None:
+    async def get_counters(self, workout_id: int) -> WorkoutCounters | None:
+        ...
+
+    async def add_views(self, deltas: Dict[int, int]) -> None:
+        ...
+
+
+class TrendingRepository(Protocol):
+    async def add_view_events(self, deltas: Dict[int, int]) -> None:
+        ...
+
+    async def try_lock(self) -> bool:
+        ...
+
+    async def maintain_partitions(self, days_ahead: int, retention_days: int) -> int:
+        """Create and drop day partitions; returns rows moved out of the default partition."""
+        ...
+
+    async def view_buckets(self, window_hours: int) -> WorkoutViewBuckets:
+        ...
+
+    async def replace_scores(self, scores: List[WorkoutTrendingScore]) -> None:
         ...
 
 
 class AvatarRepository(Repository[DBAvatar], Protocol):
-    ...
+    async def get_collection_version(self) -> Optional[str]:
+        ...
 
 
 class WorkoutTagAssociationRepository(Protocol):
@@ -104,5 +130,11 @@ class WorkoutTagAssociationRepository(Protocol):
     async def get_workout_tag_association(self, workout_id: int, tag_id: int):
         ...
 
+    async def insert_workout_tag_associations(self, workout_id: int, tag_ids: List[int]) -> None:
+        ...
+
+    async def delete_by_workout_id(self, workout_id: int) -> None:
+        ...
+
     async def get_by_workout_id(self, workout_id: int):
         ...
@@ -0,0 +1,10 @@
+from typing import Protocol
+
+
+class ViewsCounter(Protocol):
+    def record(self, workout_id: int) -> int:
+        """Count one view and return the views not yet written for the workout."""
+        ...
+
+    def pending(self, workout_id: int) -> int:
+        ...
@@ -17,6 +17,13 @@ class ResponseStyleDTO:
     image_url: str
 
 
+@dataclass
+class VersionedStylesDTO:
+    """The style list with the collection version it was read at, cached together."""
+    version: Optional[str]
+    styles: List[ResponseStyleDTO]
+
+
 @dataclass
 class ResponseStyleWorkoutsDTO:
     id: int
@@ -1,26 +1,32 @@
-from typing import List, Union
+from typing import Optional
+from src.application.common.cache import ReadThroughCache
 from src.application.interfaces.uow import UoW
+from src.application.interfaces.reader import StyleReader
 from src.application.interfaces.repository import StyleRepository
-from src.application.style.dto import CreateStyleDTO, UpdateStyleDTO, ResponseStyleWorkoutsDTO, ResponseStyleDTO
-from src.application.tag.dto import ResponseWorkoutTagDTO
-from src.application.workout.dto import WorkoutResponseDTO
+from src.application.style.dto import CreateStyleDTO, UpdateStyleDTO, ResponseStyleDTO, VersionedStylesDTO
 from src.domain.entities.tag import DBTag
-from src.domain.entities.style import DBStyle, DBStyleWorkout
+from src.domain.entities.style import DBStyle
 from src.domain.exceptions.base import DataConflict, NotFound
 from src.domain.services.style import StyleService
 from src.domain.services.upload import UploadService
+from src.domain.value_objects.pagination import KeysetCursor
+from src.domain.value_objects.workout import WorkoutSortEnum
 
 
 class StyleInteractor:
     def __init__(self,
                  style_repository: StyleRepository,
+                 style_reader: StyleReader,
                  uow: UoW,
                  style_service: StyleService,
-                 upload_service: UploadService):
+                 upload_service: UploadService,
+                 cache: ReadThroughCache):
         self.style_repository = style_repository
+        self.style_reader = style_reader
         self.uow = uow
         self.style_service = style_service
         self._upload_service = upload_service
+        self._cache = cache
 
     async def create_style(self, dto: CreateStyleDTO) -> ResponseStyleDTO:
         async with self.uow:
@@ -35,30 +41,61 @@ class StyleInteractor:
                 style_entity = await self.style_service.create_style(dto.name, image_url.url)
                 db_style: DBStyle = await self.style_repository.add(style_entity)
                 await self.uow.commit()
-                return ResponseStyleDTO(
-                    id=db_style.id,
-                    name=db_style.name,
-                    image_url=db_style.image_url
-                )
             except Exception as e:
                 if image_url is not None:
                     await self._upload_service.delete_file(image_url.url)
                 await self.uow.rollback()
                 raise e
+        await self._cache.invalidate('styles')
+        return ResponseStyleDTO(
+            id=db_style.id,
+            name=db_style.name,
+            image_url=db_style.image_url
+        )
 
-    async def get_style(self, style_id: int, with_workouts: bool = False) -> Union[
-        ResponseStyleDTO, ResponseStyleWorkoutsDTO]:
-        if with_workouts:
-            style = await self.style_repository.get_with_workouts(style_id)
-        else:
-            style = await self.style_repository.get(style_id)
+    async def get_style(self, style_id: int) -> ResponseStyleDTO:
+        style = await self._cache.get_or_load(
+            f'style:{style_id}',
+            lambda: self.style_repository.get(style_id),
+            tags=[f'style:{style_id}']
+        )
         if not style:
             raise NotFound(f"Style with id {style_id} not found.")
-        return self._map_to_response_entity(style, with_workouts)
+        return self._map_to_response_entity(style)
+
+    async def get_style_document(
+            self,
+            style_id: int,
+            sort: WorkoutSortEnum = WorkoutSortEnum.NEWEST,
+            limit: int = 20,
+            cursor: Optional[str] = None
+    ) -> bytes:
+        """Style with one page of its workouts, as a JSON document built by the database."""
+        after = KeysetCursor.decode(cursor, sort.cursor_types) if cursor else None
+        document = await self._cache.get_or_load(
+            f'style:{style_id}:workouts:{sort.value}:{limit}:{cursor or ""}',
+            lambda: self.style_reader.get_detail_document(style_id, sort, limit, after),
+            tags=[f'style:{style_id}', 'workouts']
+        )
+        if document is None:
+            raise NotFound(f"Style with id {style_id} not found.")
+        return document
+
+    async def get_styles_version(self) -> Optional[str]:
+        return await self.style_repository.get_collection_version()
 
-    async def list_styles(self) -> List[ResponseStyleDTO]:
+    async def list_styles(self) -> VersionedStylesDTO:
+        # The version is cached with the list, so an ETag always names the body it is served with.
+        return await self._cache.get_or_load('styles-versioned', self._load_styles, tags=['styles'])
+
+    async def _load_styles(self) -> VersionedStylesDTO:
+        # Version first: a write landing in between leaves it behind the rows, never ahead of them.
+        version = await self.style_repository.get_collection_version()
         styles = await self.style_repository.list()
-        return [ResponseStyleDTO(id=style.id, name=style.name, image_url=style.image_url) for style in styles]
+        return VersionedStylesDTO(
+            version=version,
+            styles=[ResponseStyleDTO(id=style.id, name=style.name, image_url=style.image_url) for style in styles]
+        )
 
     async def update_style(self, style_id: int, dto: UpdateStyleDTO) -> ResponseStyleDTO:
         async with self.uow:
@@ -87,6 +124,8 @@ class StyleInteractor:
             )
             await self.style_repository.update(updated_style)
             await self.uow.commit()
+            # Workout cards carry the style name.
+            await self._cache.invalidate(f'style:{style_id}', 'styles', 'workouts')
             return ResponseStyleDTO(
                 id=updated_style.id,
                 name=updated_style.name,
@@ -100,35 +139,12 @@ class StyleInteractor:
                 raise NotFound(f"Style with id {style_id} not found.")
             await self.style_repository.delete(style_id)
             await self.uow.commit()
+            await self._cache.invalidate(f'style:{style_id}', 'styles', 'workouts')
 
     @staticmethod
-    def _map_to_response_entity(entity: Union[DBStyle, DBStyleWorkout], with_workouts: bool = False) -> Union[
-        ResponseStyleWorkoutsDTO, ResponseStyleDTO]:
-        if with_workouts:
-            return ResponseStyleWorkoutsDTO(
-                id=entity.id,
-                name=entity.name,
-                image_url=entity.image_url,
-                workouts=[
-                    WorkoutResponseDTO(
-                        id=db_workout.id,
-                        name=db_workout.name,
-                        calories=db_workout.calories,
-                        duration=db_workout.duration,
-                        level=db_workout.level,
-                        description=db_workout.description,
-                        dance_video=db_workout.dance_video,
-                        thumbnail_image=db_workout.thumbnail_image,
-                        author_name=db_workout.author_name,
-                        views_count=db_workout.views_count,
-                        style_id=db_workout.style_id,
-                        tags=[ResponseWorkoutTagDTO(id=tag.id, name=tag.name) for tag in db_workout.tags],
-                    ) for db_workout in entity.workouts
-                ]
-            )
-        else:
-            return ResponseStyleDTO(
-                id=entity.id,
-                name=entity.name,
-                image_url=entity.image_url
-            )
+    def _map_to_response_entity(entity: DBStyle) -> ResponseStyleDTO:
+        return ResponseStyleDTO(
+            id=entity.id,
+            name=entity.name,
+            image_url=entity.image_url
+        )
@@ -0,0 +1,217 @@
+import heapq
+import time
+from bisect import bisect_left, insort
+from collections import deque
+from itertools import chain, islice
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Protocol, Sequence, Tuple
+
+from src.domain.entities.tag import DBTag
+
+_PREFIX_END = chr(0x10FFFF)
+
+
+def index_key(name: str) -> str:
+    """Sort and match key of a tag name."""
+    return name.casefold()
+
+
+def rank_order(ids: Sequence[int], names: Sequence[str], usages: Sequence[int]) -> List[int]:
+    """Positions in autocomplete rank order: most used first, then by name and id."""
+    return sorted(range(len(ids)), key=lambda position: (-usages[position], names[position], ids[position]))
+
+
+class SortedTags(Protocol):
+    """Tags ordered by `index_key` of their names, addressed by position.
+
+    `by_rank` lists the same positions in `rank_order`.
+    """
+
+    keys: Sequence[str]
+    ids: Sequence[int]
+    names: Sequence[str]
+    usages: Sequence[int]
+    by_rank: Sequence[int]
+
+    def position(self, tag_id: int) -> Optional[int]:
+        ...
+
+
+class TagList:
+    """`SortedTags` held in ordinary lists."""
+
+    def __init__(self, tags: Iterable[DBTag]):
+        ordered = sorted(tags, key=lambda tag: (index_key(tag.name), tag.id))
+        self.keys = [index_key(tag.name) for tag in ordered]
+        self.ids = [tag.id for tag in ordered]
+        self.names = [tag.name for tag in ordered]
+        self.usages = [tag.usages or 0 for tag in ordered]
+        self.by_rank = rank_order(self.ids, self.names, self.usages)
+        self._positions = {tag_id: position for position, tag_id in enumerate(self.ids)}
+
+    def position(self, tag_id: int) -> Optional[int]:
+        return self._positions.get(tag_id)
+
+
+class TagAutocompleteIndex:
+    """Per-process prefix index over tag names.
+
+    Tags are kept sorted by casefolded name, so the tags sharing a prefix form
+    one contiguous slice found with bisect. A prefix whose slice is wide is
+    instead matched walking the base in rank order, which stops at the
+    `limit`th match. The bulk of the tags sit in a read-only base, which may
+    be the catalog snapshot mapped by every worker; changes made since the
+    base was loaded live in an overlay, folded into a new in-memory base once
+    it outgrows `compact_after` (or an eighth of the base). Results for wide
+    prefixes are memoized until the next change.
+
+    Changes are also logged with the time they were applied, so a base read
+    before some of them (a snapshot built a while ago) gets them again when
+    it is loaded instead of turning usage counts back.
+    """
+
+    def __init__(
+            self,
+            result_cache_size: int = 2048,
+            compact_after: int = 1024,
+            changes_kept: int = 100_000,
+            clock: Callable[[], float] = time.time
+    ):
+        self._base: SortedTags = TagList(())
+        self._overrides: Dict[int, Optional[DBTag]] = {}
+        self._extra: List[Tuple[str, int]] = []
+        self._size = 0
+        self._results: Dict[Tuple[str, int], List[DBTag]] = {}
+        self._result_cache_size = result_cache_size
+        self._compact_after = compact_after
+        self._changes: Deque[Tuple[float, int, Optional[DBTag]]] = deque(maxlen=changes_kept)
+        self._clock = clock
+
+    def __len__(self) -> int:
+        return self._size
+
+    def load(self, tags: Iterable[DBTag], as_of: Optional[float] = None) -> None:
+        self.load_sorted(TagList(tags), as_of)
+
+    def load_sorted(self, base: SortedTags, as_of: Optional[float] = None) -> None:
+        """Swap in `base`, read from the database at `as_of`.
+
+        Changes logged since `as_of` are applied on top of it; older ones are
+        forgotten. Without `as_of` the base is taken to be current.
+        """
+        self._set_base(base)
+        while self._changes and (as_of is None or self._changes[0][0] < as_of):
+            self._changes.popleft()
+        for _, tag_id, tag in self._changes:
+            self._apply(tag_id, tag)
+
+    def upsert(self, tag: DBTag) -> None:
+        self._log(tag.id, DBTag(id=tag.id, name=tag.name, usages=tag.usages or 0))
+
+    def set_usages(self, tag_id: int, usages: int) -> None:
+        tag = self._get(tag_id)
+        if tag is not None and tag.usages != usages:
+            self._log(tag_id, DBTag(id=tag_id, name=tag.name, usages=usages))
+
+    def remove(self, tag_id: int) -> None:
+        self._log(tag_id, None)
+
+    def complete(self, prefix: str, limit: int = 10) -> List[DBTag]:
+        key = index_key(prefix)
+        cached = self._results.get((key, limit))
+        if cached is not None:
+            return cached
+
+        overrides = self._overrides
+        extra_start = bisect_left(self._extra, (key,))
+        extra_end = bisect_left(self._extra, (key + _PREFIX_END,), extra_start)
+        candidates = chain(
+            self._base_candidates(key, limit),
+            (
+                (-tag.usages, tag.name, tag.id)
+                for tag in (overrides[tag_id] for _, tag_id in self._extra[extra_start:extra_end])
+            ),
+        )
+        result = [
+            DBTag(id=tag_id, name=name, usages=-usages)
+            for usages, name, tag_id in heapq.nsmallest(limit, candidates)
+        ]
+
+        if len(self._results) >= self._result_cache_size:
+            self._results.clear()
+        self._results[(key, limit)] = result
+        return result
+
+    def _base_candidates(self, key: str, limit: int) -> Iterable[Tuple[int, str, int]]:
+        """The best `limit` base tags matching `key`, or a superset of them, as rank tuples."""
+        base, overrides = self._base, self._overrides
+        start = bisect_left(base.keys, key)
+        end = bisect_left(base.keys, key + _PREFIX_END, start)
+        width = end - start
+        # Walking in rank order meets a match about every len / width tags; take
+        # that route only when it is expected to be much shorter than the slice.
+        budget = 4 * limit * len(base.ids) // max(width, 1)
+        if width > limit and budget < width:
+            matches = []
+            for position in islice(base.by_rank, budget):
+                if base.keys[position].startswith(key) and base.ids[position] not in overrides:
+                    matches.append((-base.usages[position], base.names[position], base.ids[position]))
+                    if len(matches) == limit:
+                        return matches
+        return (
+            (-base.usages[position], base.names[position], base.ids[position])
+            for position in range(start, end)
+            if base.ids[position] not in overrides
+        )
+
+    def _set_base(self, base: SortedTags) -> None:
+        self._base = base
+        self._overrides = {}
+        self._extra = []
+        self._size = len(base.ids)
+        self._results.clear()
+
+    def _log(self, tag_id: int, tag: Optional[DBTag]) -> None:
+        self._changes.append((self._clock(), tag_id, tag))
+        self._apply(tag_id, tag)
+
+    def _apply(self, tag_id: int, tag: Optional[DBTag]) -> None:
+        exists = self._get(tag_id) is not None
+        if tag is None and not exists:
+            return
+        if tag is None:
+            self._size -= 1
+        elif not exists:
+            self._size += 1
+        self._override(tag_id, tag)
+
+    def _get(self, tag_id: int) -> Optional[DBTag]:
+        if tag_id in self._overrides:
+            return self._overrides[tag_id]
+        position = self._base.position(tag_id)
+        if position is None:
+            return None
+        return DBTag(id=tag_id, name=self._base.names[position], usages=self._base.usages[position])
+
+    def _override(self, tag_id: int, tag: Optional[DBTag]) -> None:
+        previous = self._overrides.get(tag_id)
+        if previous is not None:
+            entry = (index_key(previous.name), tag_id)
+            position = bisect_left(self._extra, entry)
+            if position < len(self._extra) and self._extra[position] == entry:
+                del self._extra[position]
+        self._overrides[tag_id] = tag
+        if tag is not None:
+            insort(self._extra, (index_key(tag.name), tag_id))
+        self._results.clear()
+        if len(self._overrides) > max(self._compact_after, len(self._base.ids) // 8):
+            self._compact()
+
+    def _compact(self) -> None:
+        base, overrides = self._base, self._overrides
+        tags = [
+            DBTag(id=base.ids[position], name=base.names[position], usages=base.usages[position])
+            for position in range(len(base.ids))
+            if base.ids[position] not in overrides
+        ]
+        tags.extend(tag for tag in overrides.values() if tag is not None)
+        self._set_base(TagList(tags))
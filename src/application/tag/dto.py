@@ -16,6 +16,11 @@ class ResponseTagDTO:
     usages: int
 
 
+@dataclass
+class ResponsePopularTagsDTO(PaginatedResponseDTO[ResponseTagDTO]):
+    version: Optional[str] = None
+
+
 @dataclass
 class ResponseRecommendationTagDTO:
     tags: PaginatedResponseDTO[ResponseTagDTO]
@@ -1,42 +1,78 @@
 from dataclasses import asdict
-from typing import List, Union
+from typing import List, Optional
+from src.application.common.cache import ReadThroughCache
+from src.application.interfaces.reader import TagReader
 from src.application.interfaces.repository import TagRepository
 from src.application.interfaces.uow import UoW
-from src.application.tag.dto import CreateTagDTO, UpdateTagDTO, ResponseTagDTO, ResponseTagWorkoutDTO, \
-    ResponseRecommendationTagDTO
+from src.application.tag.autocomplete import TagAutocompleteIndex
+from src.application.tag.ranking import PopularTagsRanking
+from src.application.tag.dto import CreateTagDTO, UpdateTagDTO, ResponseTagDTO, \
+    ResponseRecommendationTagDTO, ResponsePopularTagsDTO
 from src.domain.entities.pagination import PaginatedResponseDTO
 from src.domain.entities.tag import DBTag
 from src.domain.exceptions.base import NotFound, AlreadyExists
 from src.domain.services.tag import TagService
+from src.domain.value_objects.pagination import CountStrategy, KeysetCursor
+from src.domain.value_objects.workout import WorkoutSortEnum
 
 
 class TagInteractor:
     def __init__(
             self,
             tag_repository: TagRepository,
+            tag_reader: TagReader,
             uow: UoW,
             tag_service: TagService,
+            tag_index: TagAutocompleteIndex,
+            popular_tags: PopularTagsRanking,
+            cache: ReadThroughCache,
     ):
         self._tag_repository = tag_repository
+        self._tag_reader = tag_reader
         self._uow = uow
         self._tag_service = tag_service
+        self._tag_index = tag_index
+        self._popular_tags = popular_tags
+        self._cache = cache
 
-    async def get_tag(self, tag_id: int, with_workout: bool = False) -> Union[ResponseTagDTO, ResponseTagWorkoutDTO]:
-        if with_workout:
-            tag = await self._tag_repository.get_with_workouts(tag_id)
-            if not tag:
-                raise NotFound(f"Tag with id {tag_id} not found.")
-            return ResponseTagWorkoutDTO(**asdict(tag))
-        else:
-            tag = await self._tag_repository.get(tag_id)
-            if not tag:
-                raise NotFound(f"Tag with id {tag_id} not found.")
-            return ResponseTagDTO(**asdict(tag))
+    async def get_tag(self, tag_id: int) -> ResponseTagDTO:
+        tag = await self._cache.get_or_load(
+            f'tag:{tag_id}',
+            lambda: self._tag_repository.get(tag_id),
+            tags=[f'tag:{tag_id}', 'tags']
+        )
+        if not tag:
+            raise NotFound(f"Tag with id {tag_id} not found.")
+        return ResponseTagDTO(**asdict(tag))
+
+    async def get_tag_document(
+            self,
+            tag_id: int,
+            sort: WorkoutSortEnum = WorkoutSortEnum.NEWEST,
+            limit: int = 20,
+            cursor: Optional[str] = None
+    ) -> bytes:
+        """Tag with one page of its workouts, as a JSON document built by the database."""
+        after = KeysetCursor.decode(cursor, sort.cursor_types) if cursor else None
+        document = await self._cache.get_or_load(
+            f'tag:{tag_id}:workouts:{sort.value}:{limit}:{cursor or ""}',
+            lambda: self._tag_reader.get_detail_document(tag_id, sort, limit, after),
+            tags=[f'tag:{tag_id}', 'tags', 'workouts']
+        )
+        if document is None:
+            raise NotFound(f"Tag with id {tag_id} not found.")
+        return document
 
-    async def get_filtered_tags(self, name: str) -> List[ResponseTagDTO]:
-        tags = await self._tag_repository.search_by_constraints(name=name)
+    async def get_filtered_tags(self, name: str, limit: int = 20) -> List[ResponseTagDTO]:
+        tags = await self._tag_repository.search_by_constraints(name=name, limit=limit)
         return [ResponseTagDTO(**asdict(tag)) for tag in tags]
 
+    async def autocomplete_tags(self, prefix: str, limit: int = 10) -> List[ResponseTagDTO]:
+        return [
+            ResponseTagDTO(id=tag.id, name=tag.name, usages=tag.usages)
+            for tag in self._tag_index.complete(prefix, limit)
+        ]
+
     async def create_tag(self, tag_dto: CreateTagDTO) -> ResponseTagDTO:
         async with self._uow:
             existing_tag = await self._tag_repository.get_by_name(tag_dto.name)
@@ -45,30 +81,52 @@ class TagInteractor:
             tag = self._tag_service.create_tag_entity(tag_dto)
             db_tag: DBTag = await self._tag_repository.add(tag)
             await self._uow.commit()
+            self._tag_index.upsert(db_tag)
+            await self._cache.invalidate('tags')
             return ResponseTagDTO(**asdict(db_tag))
 
     async def list_tags(self,
                         page: int = 1,
-                        limit: int = 10) -> PaginatedResponseDTO:
-        tags, total_count = await self._tag_repository.list_paginated_tags(page, limit)
-        return PaginatedResponseDTO(
-            items=[ResponseTagDTO(**asdict(r)) for r in tags],
-            total_count=total_count,
-            page=page,
-            page_size=limit
+                        limit: int = 10,
+                        count_strategy: CountStrategy = CountStrategy.EXACT) -> PaginatedResponseDTO:
+        async def load() -> PaginatedResponseDTO:
+            tags, total_count = await self._tag_repository.list_paginated_tags(page, limit, count_strategy)
+            return PaginatedResponseDTO(
+                items=[ResponseTagDTO(**asdict(r)) for r in tags],
+                total_count=total_count,
+                page=page,
+                page_size=limit
+            )
+
+        return await self._cache.get_or_load(
+            f'tags:{page}:{limit}:{count_strategy.value}', load, tags=['tags']
         )
 
     async def list_popular_tags(self,
                                 page: int = 1,
-                                limit: int = 10) -> PaginatedResponseDTO:
-        popular_tags, total_count = await self._tag_repository.list_paginated_popular_tags(page, limit)
-        return PaginatedResponseDTO(
+                                limit: int = 10,
+                                count_strategy: CountStrategy = CountStrategy.EXACT) -> ResponsePopularTagsDTO:
+        version = None
+        if self._popular_tags.covers(page, limit):
+            popular_tags, total_count, version = await self._popular_tags.page(page, limit)
+        else:
+            popular_tags, total_count = await self._tag_repository.list_paginated_popular_tags(
+                page, limit, count_strategy
+            )
+        return ResponsePopularTagsDTO(
             items=[ResponseTagDTO(**asdict(r)) for r in popular_tags],
             total_count=total_count,
             page=page,
-            page_size=limit
+            page_size=limit,
+            version=version
         )
 
+    async def get_popular_tags_version(self, page: int = 1, limit: int = 10) -> Optional[str]:
+        """Version of a popular tags page when it is served from the ranking, else None."""
+        if not self._popular_tags.covers(page, limit):
+            return None
+        return self._popular_tags.current_version()
+
     async def update_tag(
             self,
             tag_id: int,
@@ -84,8 +142,19 @@ class TagInteractor:
             updated_tag = self._tag_service.update_tag(existing_tag=db_tag, dto=tag_dto)
             await self._tag_repository.update(updated_tag)
             await self._uow.commit()
+            self._tag_index.upsert(updated_tag)
+            # Workout cards and details list tag names.
+            await self._cache.invalidate(f'tag:{tag_id}', 'tags', 'workouts')
             return ResponseTagDTO(**asdict(updated_tag))
 
+    async def reconcile_usages(self) -> int:
+        async with self._uow:
+            fixed = await self._tag_repository.reconcile_usages()
+            await self._uow.commit()
+        if fixed:
+            await self._cache.invalidate('tags')
+        return fixed
+
     async def delete_tag(self, tag_id: int) -> None:
         async with self._uow:
             tag = await self._tag_repository.get(tag_id)
@@ -93,3 +162,5 @@ class TagInteractor:
                 raise NotFound(f"Tag with id {tag_id} not found.")
             await self._tag_repository.delete(tag_id)
             await self._uow.commit()
+            self._tag_index.remove(tag_id)
+            await self._cache.invalidate(f'tag:{tag_id}', 'tags', 'workouts')
@@ -0,0 +1,101 @@
+import asyncio
+import logging
+import time
+from hashlib import blake2b
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+from src.domain.entities.tag import DBTag
+
+logger = logging.getLogger(__name__)
+
+RankingLoader = Callable[[int], Awaitable[Tuple[List[DBTag], int]]]
+
+
+class PopularTagsRanking:
+    """Per-process top-K of tags by usages, served without touching the database.
+
+    Tag change events only mark the ranking dirty; it is reloaded on the next
+    read once it is older than `max_staleness` seconds, so a burst of changes
+    costs one query. Readers never wait for a reload unless nothing is loaded.
+    Pages past the top K are not covered and fall back to the database.
+
+    `version` is a content hash of the ranking, so it is equal on every worker
+    holding the same data and can be used as an ETag.
+    """
+
+    def __init__(
+            self,
+            loader: RankingLoader,
+            size: int = 500,
+            max_staleness: float = 5.0,
+            clock: Callable[[], float] = time.monotonic
+    ):
+        self._loader = loader
+        self._size = size
+        self._max_staleness = max_staleness
+        self._clock = clock
+        self._tags: List[DBTag] = []
+        self._total_count = 0
+        self._version: Optional[str] = None
+        self._loaded_at = 0.0
+        self._dirty = True
+        self._refresh_lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    @property
+    def version(self) -> Optional[str]:
+        return self._version
+
+    def mark_dirty(self) -> None:
+        self._dirty = True
+
+    def covers(self, page: int, page_size: int) -> bool:
+        return page * page_size <= self._size
+
+    def current_version(self) -> Optional[str]:
+        """Version `page()` would serve right now; schedules a due reload the same way."""
+        if self._version is not None:
+            self._schedule_refresh()
+        return self._version
+
+    async def page(self, page: int, page_size: int) -> Tuple[List[DBTag], int, str]:
+        if self._version is None:
+            await self.refresh()
+        else:
+            self._schedule_refresh()
+        offset = (page - 1) * page_size
+        return self._tags[offset:offset + page_size], self._total_count, self._version
+
+    def replace(self, tags: List[DBTag], total_count: int) -> None:
+        digest = blake2b(digest_size=12)
+        digest.update(str(total_count).encode())
+        for tag in tags:
+            digest.update(f"\0{tag.id}\0{tag.name}\0{tag.usages}".encode())
+        self._tags = tags
+        self._total_count = total_count
+        self._version = digest.hexdigest()
+        self._loaded_at = self._clock()
+
+    async def refresh(self) -> None:
+        async with self._refresh_lock:
+            if self._version is not None and not self._dirty:
+                return
+            # Cleared before loading so events arriving meanwhile trigger another round.
+            self._dirty = False
+            try:
+                tags, total_count = await self._loader(self._size)
+            except Exception:
+                self._dirty = True
+                raise
+            self.replace(tags, total_count)
+
+    def _schedule_refresh(self) -> None:
+        if self._dirty and self._clock() - self._loaded_at >= self._max_staleness:
+            if self._refresh_task is None or self._refresh_task.done():
+                self._refresh_task = asyncio.create_task(self._refresh_in_background())
+
+    async def _refresh_in_background(self) -> None:
+        try:
+            await self.refresh()
+        except Exception:
+            logger.exception("Refreshing the popular tags ranking failed, serving the previous one")
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime, timedelta
 from typing import Optional
 
@@ -58,7 +59,8 @@ class UserInteractor:
 
     async def sign_up_client(self, data: CreateUserDTO) -> ResponseUserDTO:
         await self._ensure_user_does_not_exist(data.email)
-        user: User = self._user_service.create_user(data.email, data.password)
+        # bcrypt is slow on purpose; hash off the event loop.
+        user: User = await asyncio.to_thread(self._user_service.create_user, data.email, data.password)
         db_user = await self._user_repository.add(user)
         client = Client(user=db_user)
         await self._client_repository.add(client)
@@ -67,7 +69,7 @@ class UserInteractor:
 
     async def sign_up_staff(self, data: CreateStaffDTO) -> ResponseUserDTO:
         await self._ensure_user_does_not_exist(data.email)
-        user: User = self._user_service.create_user(data.email, data.password)
+        user: User = await asyncio.to_thread(self._user_service.create_user, data.email, data.password)
         db_user = await self._user_repository.add(user)
         staff = Staff(user=db_user, role=data.role)
         await self._staff_repository.add(staff)
@@ -76,21 +78,19 @@ class UserInteractor:
 
     async def sign_in(self, data: UserLoginDTO, staff_auth=False) -> TokenDTO:
         user = await self._get_user_by_email(data.email)
-        if not self._user_service.verify_password(data.password, user.password.value):
+        if not await asyncio.to_thread(self._user_service.verify_password, data.password, user.password.value):
             raise InvalidPasswordError("Invalid password.")
 
-        if staff_auth:
-            staff = await self._staff_repository.get_by_user_id(user_id=user.id)
-            if not staff or not staff.role.value:
-                raise IsNotAdminError("No such staff account.")
+        # get_by_email joins the staff row already; its role is the user's role.
+        if staff_auth and user.role == 'CLIENT':
+            raise IsNotAdminError("No such staff account.")
 
         tokens = self._create_tokens(user.id)
-        staff_member = await self._staff_repository.get_by_user_id(user.id)
 
         return TokenDTO(
             access_token=tokens.access_token,
             refresh_token=tokens.refresh_token,
-            role=staff_member.role.value if staff_member else 'CLIENT',
+            role=user.role,
         )
 
     async def refresh_token(self, refresh_token: str) -> TokenDTO:
@@ -121,7 +121,8 @@ class UserInteractor:
             avatar = await self._avatar_repository.get(data.avatar_id)
             if not avatar:
                 raise NotFound('Avatar does not exist.')
-        user: User = self._user_service.update_user(
+        user: User = await asyncio.to_thread(
+            self._user_service.update_user,
             user=user,
             password=data.password,
             username=data.username,
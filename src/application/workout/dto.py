@@ -22,6 +22,13 @@ class WorkoutResponseDTO:
     tags: List['ResponseWorkoutTagDTO']
 
 
+@dataclass
+class VersionedWorkoutDTO:
+    """A workout detail with the row versions it was read at, cached together."""
+    version: str
+    workout: WorkoutResponseDTO
+
+
 @dataclass
 class WorkoutResponseStyleDTO:
     id: int
@@ -39,6 +46,28 @@ class WorkoutResponseStyleDTO:
     tags: List['ResponseWorkoutTagDTO']
 
 
+@dataclass
+class WorkoutCardResponseDTO:
+    id: int
+    name: str
+    calories: int
+    duration: int
+    level: LevelsEnum
+    thumbnail_image: str
+    author_name: str
+    views_count: int
+    style_id: int
+    style: ResponseStyleDTO
+    tags: List['ResponseWorkoutTagDTO']
+
+
+@dataclass
+class WorkoutSearchResponseDTO(WorkoutResponseStyleDTO):
+    rank: float
+    name_highlight: str
+    description_highlight: str
+
+
 @dataclass
 class ViewsUpdateResponseDTO:
     id: int
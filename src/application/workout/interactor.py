@@ -1,38 +1,56 @@
+import asyncio
+import logging
 from dataclasses import asdict
-from typing import List
+from typing import List, Optional
 from src.application.interfaces.repository import (
     WorkoutRepository,
     StyleRepository,
     TagRepository,
     WorkoutTagAssociationRepository,
+    TrendingRepository,
 )
+from src.application.common.cache import ReadThroughCache
+from src.application.interfaces.reader import WorkoutReader
 from src.application.interfaces.uow import UoW
+from src.application.interfaces.views import ViewsCounter
 from src.application.workout.dto import (
     WorkoutCreateDTO,
     WorkoutUpdateDTO,
     WorkoutResponseStyleDTO,
     WorkoutResponseDTO, ViewsUpdateResponseDTO,
+    VersionedWorkoutDTO,
 )
-from src.domain.entities.workout import Workout
+from src.domain.entities.pagination import PaginatedResponseDTO
+from src.domain.entities.workout import Workout, WorkoutFilter
 from src.domain.services.tag import TagService
+from src.domain.services.trending import TrendingService
 from src.domain.services.upload import UploadService
 from src.domain.services.workout import WorkoutService
 from src.domain.exceptions.base import NotFound, AlreadyExists, InternalServerError, BadRequest
 
+logger = logging.getLogger(__name__)
+VIEW_EVENT_PARTITIONS_AHEAD_DAYS = 2
+
 
 class WorkoutInteractor:
     def __init__(
             self,
             workout_repository: WorkoutRepository,
+            workout_reader: WorkoutReader,
             style_repository: StyleRepository,
             tag_repository: TagRepository,
             workout_tag_association_repository: WorkoutTagAssociationRepository,
             uow: UoW,
             workout_service: WorkoutService,
             tag_service: TagService,
-            upload_service: UploadService
+            upload_service: UploadService,
+            views_counter: ViewsCounter,
+            trending_repository: TrendingRepository,
+            trending_service: TrendingService,
+            cache: ReadThroughCache
     ):
         self._workout_repository = workout_repository
+        self._workout_reader = workout_reader
         self._style_repository = style_repository
         self._tag_repository = tag_repository
         self._workout_tag_association_repository = workout_tag_association_repository
@@ -40,6 +58,10 @@ class WorkoutInteractor:
         self._workout_service = workout_service
         self._tag_service = tag_service
         self._upload_service = upload_service
+        self._views_counter = views_counter
+        self._trending_repository = trending_repository
+        self._trending_service = trending_service
+        self._cache = cache
 
     async def create_workout(self, dto: WorkoutCreateDTO) -> WorkoutResponseStyleDTO:
         async with self._uow:
@@ -71,32 +93,114 @@ class WorkoutInteractor:
                 if image_url:
                     await self._upload_service.delete_file(image_url.url)
                 raise e
+        await self._cache.invalidate('workouts', 'tags')
         return self._map_to_response_dto(created_workout)
 
-    async def get_workout(self, workout_id: int) -> WorkoutResponseStyleDTO:
-        workout = await self._workout_repository.get(workout_id)
+    async def get_workout(self, workout_id: int) -> VersionedWorkoutDTO:
+        # The version is cached with the body, so an ETag always names the body it is served with.
+        workout = await self._cache.get_or_load(
+            f'workout-detail:{workout_id}',
+            lambda: self._workout_reader.get_detail(workout_id),
+            tags=['workouts']
+        )
         if not workout:
             raise NotFound(f"Workout with id {workout_id} not found.")
-        return self._map_to_response_style_dto(workout)
+        return workout
+
+    async def get_workout_version(self, workout_id: int) -> Optional[str]:
+        return await self._workout_reader.get_detail_version(workout_id)
 
     async def list_workouts(self) -> List[WorkoutResponseStyleDTO]:
-        workouts = await self._workout_repository.list()
-        return [self._map_to_response_style_dto(workout) for workout in workouts]
+        return await self._workout_reader.list_all()
+
+    async def list_paginated_workouts(self,
+                                      filters: WorkoutFilter,
+                                      page: int = 1,
+                                      limit: int = 10) -> PaginatedResponseDTO:
+        async def load() -> PaginatedResponseDTO:
+            workouts, total_count = await self._workout_reader.list_cards(filters, page, limit)
+            return PaginatedResponseDTO(
+                items=workouts,
+                total_count=total_count,
+                page=page,
+                page_size=limit
+            )
+
+        return await self._cache.get_or_load(f'workouts:{filters!r}:{page}:{limit}', load, tags=['workouts'])
+
+    async def list_trending_workouts(self,
+                                     style_id: Optional[int] = None,
+                                     page: int = 1,
+                                     limit: int = 10) -> PaginatedResponseDTO:
+        async def load() -> PaginatedResponseDTO:
+            workouts, total_count = await self._workout_reader.list_trending_cards(style_id, page, limit)
+            return PaginatedResponseDTO(
+                items=workouts,
+                total_count=total_count,
+                page=page,
+                page_size=limit
+            )
+
+        return await self._cache.get_or_load(
+            f'workouts:trending:{style_id}:{page}:{limit}', load, tags=['workouts', 'trending']
+        )
+
+    async def recompute_trending_scores(self, window_hours: int, retention_days: int) -> int:
+        async with self._uow:
+            if not await self._trending_repository.try_lock():
+                return 0
+            await self._maintain_view_event_partitions(retention_days)
+            buckets = await self._trending_repository.view_buckets(window_hours)
+            # Scoring is numpy work over every bucket in the window; keep it off the event loop.
+            scores = await asyncio.to_thread(self._trending_service.score, buckets)
+            await self._trending_repository.replace_scores(scores)
+            await self._uow.commit()
+        await self._cache.invalidate('trending')
+        return len(scores)
+
+    async def maintain_view_event_partitions(self, retention_days: int) -> None:
+        """Run partition maintenance now, as at start-up, unless the trending job holds the lock."""
+        async with self._uow:
+            if not await self._trending_repository.try_lock():
+                return
+            await self._maintain_view_event_partitions(retention_days)
+            await self._uow.commit()
+
+    async def _maintain_view_event_partitions(self, retention_days: int) -> None:
+        rescued = await self._trending_repository.maintain_partitions(
+            days_ahead=VIEW_EVENT_PARTITIONS_AHEAD_DAYS, retention_days=retention_days
+        )
+        if rescued:
+            logger.warning("Moved %d view events out of the default partition; maintenance had fallen behind",
+                           rescued)
+
+    async def search_workouts(self,
+                              query: str,
+                              page: int = 1,
+                              limit: int = 10) -> PaginatedResponseDTO:
+        hits, total_count = await self._workout_reader.search(query, page, limit)
+        return PaginatedResponseDTO(
+            items=hits,
+            total_count=total_count,
+            page=page,
+            page_size=limit
+        )
 
     async def add_tag_for_workout(self, workout_id: int, tags: List[str]) -> bool:
         async with self._uow:
-            existing_workout = await self._workout_repository.get(workout_id)
+            existing_workout = await self._workout_repository.get_counters(workout_id)
             if not existing_workout:
                 raise NotFound(f"Workout with id {workout_id} not found.")
 
             await self._handle_tags_for_workout(workout_id, tags)
 
             await self._uow.commit()
+            await self._cache.invalidate('workouts', 'tags')
             return True
 
     async def delete_tag_from_workout(self, workout_id: int, tag_id: int) -> bool:
         async with self._uow:
-            existing_workout = await self._workout_repository.get(workout_id)
+            existing_workout = await self._workout_repository.get_counters(workout_id)
             if not existing_workout:
                 raise NotFound(f"Workout with id {workout_id} not found.")
 
@@ -113,8 +217,8 @@ class WorkoutInteractor:
             await self._workout_tag_association_repository.delete_workout_tag_association(
                 workout_id, tag_id
             )
-            await self._tag_repository.decrement_usages(tag_id)
             await self._uow.commit()
+            await self._cache.invalidate('workouts', 'tags')
 
             return True
 
@@ -146,59 +250,41 @@ class WorkoutInteractor:
                 updated_workout = await self._workout_repository.update(updated_entity)
                 await self._uow.commit()
 
-                return self._map_to_response_style_dto(updated_workout)
-
             except Exception as e:
                 await self._uow.rollback()
                 if image_url:
                     await self._upload_service.delete_file(image_url.url)
                 raise e
+        await self._cache.invalidate('workouts')
+        return self._map_to_response_style_dto(updated_workout)
 
     async def update_workout_views(self, workout_id: int) -> ViewsUpdateResponseDTO:
-        async with self._uow:
-            try:
-                existing_workout = await self._workout_repository.get(workout_id)
-                if not existing_workout:
-                    raise NotFound(f"Workout with id {workout_id} not found.")
-                updated_view_workout = await self._workout_repository.update_workout_views(workout_id)
-                return ViewsUpdateResponseDTO(id=updated_view_workout.id, views_count=updated_view_workout.views_count)
-            except Exception as e:
-                await self._uow.rollback()
-                raise e
+        counters = await self._workout_repository.get_counters(workout_id)
+        if not counters:
+            raise NotFound(f"Workout with id {workout_id} not found.")
+        pending = self._views_counter.record(workout_id)
+        return ViewsUpdateResponseDTO(id=workout_id, views_count=counters.views_count + pending)
 
     async def delete_workout(self, workout_id: int) -> None:
         async with self._uow:
-            workout = await self._workout_repository.get(workout_id)
+            workout = await self._workout_repository.get_counters(workout_id)
             if not workout:
                 raise NotFound(f"Workout with id {workout_id} not found.")
 
-            tag_ids = await self._workout_tag_association_repository.get_by_workout_id(workout_id)
-            for tag_id in tag_ids:
-                await self._workout_tag_association_repository.delete_workout_tag_association(
-                    workout_id, tag_id
-                )
-                await self._tag_repository.decrement_usages(tag_id)
-
+            await self._workout_tag_association_repository.delete_by_workout_id(workout_id)
             await self._workout_repository.delete(workout_id)
             await self._uow.commit()
+            await self._cache.invalidate('workouts', 'tags')
 
     async def _handle_tags_for_workout(self, workout_id: int, tags: List[str]) -> None:
+        tag_ids = []
         for tag_name in tags:
-            existing_tag = await self._tag_repository.get_by_name(tag_name)
-            if not existing_tag:
+            db_tag = await self._tag_repository.get_by_name(tag_name)
+            if not db_tag:
                 new_tag = self._tag_service.create_tag_entity(tag_name)
                 db_tag = await self._tag_repository.add(new_tag)
-                tag_id = db_tag.id
-            else:
-                tag_id = existing_tag.id
-            has_association = await self._workout_tag_association_repository.get_workout_tag_association(
-                workout_id, tag_id
-            )
-            if not has_association:
-                await self._workout_tag_association_repository.insert_workout_tag_association(
-                    workout_id=workout_id, tag_id=tag_id
-                )
-                await self._tag_repository.increment_usages(tag_id)
+            tag_ids.append(db_tag.id)
+        await self._workout_tag_association_repository.insert_workout_tag_associations(workout_id, tag_ids)
 
     @staticmethod
     def _map_to_response_style_dto(workout: Workout) -> WorkoutResponseStyleDTO:
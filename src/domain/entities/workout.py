@@ -1,8 +1,8 @@
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from typing import List, Optional
 
 from src.domain.entities.style import DBStyle
-from src.domain.value_objects.workout import LevelsEnum
+from src.domain.value_objects.workout import LevelsEnum, WorkoutSortEnum, TagMatchEnum
 from src.application.tag.dto import ResponseWorkoutTagDTO
 
 
@@ -29,3 +29,38 @@ class DBWorkout(Workout):
 @dataclass(kw_only=True)
 class DBWorkoutStyle(DBWorkout):
     style: DBStyle
+
+
+@dataclass
+class WorkoutCounters:
+    id: int
+    views_count: int
+
+
+@dataclass
+class WorkoutFilter:
+    style_id: Optional[int] = None
+    level: Optional[LevelsEnum] = None
+    min_duration: Optional[int] = None
+    max_duration: Optional[int] = None
+    min_calories: Optional[int] = None
+    max_calories: Optional[int] = None
+    tag_ids: List[int] = field(default_factory=list)
+    tags_match: TagMatchEnum = TagMatchEnum.ANY
+    sort: WorkoutSortEnum = WorkoutSortEnum.NEWEST
+
+
+@dataclass
+class WorkoutViewBuckets:
+    """Views aggregated per workout and hour, as parallel columns."""
+    workout_ids: List[int]
+    style_ids: List[int]
+    age_hours: List[float]
+    views: List[int]
+
+
+@dataclass
+class WorkoutTrendingScore:
+    workout_id: int
+    style_id: int
+    score: float
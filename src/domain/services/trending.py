@@ -0,0 +1,27 @@
+from typing import List
+
+from src.domain.entities.workout import WorkoutViewBuckets, WorkoutTrendingScore
+
+
+class TrendingService:
+    def __init__(self, half_life_hours: float = 24.0):
+        self._half_life_hours = half_life_hours
+
+    def score(self, buckets: WorkoutViewBuckets) -> List[WorkoutTrendingScore]:
+        """Sum each workout's views, every bucket weighted by 2^(-age / half-life)."""
+        if not buckets.workout_ids:
+            return []
+        # Only the periodic trending job needs numpy; importing it here keeps it out of worker start-up.
+        import numpy as np
+
+        workout_ids = np.asarray(buckets.workout_ids, dtype=np.int64)
+        weights = np.asarray(buckets.views, dtype=np.float64) * np.exp2(
+            -np.asarray(buckets.age_hours, dtype=np.float64) / self._half_life_hours
+        )
+        ids, first_index, inverse = np.unique(workout_ids, return_index=True, return_inverse=True)
+        scores = np.bincount(inverse, weights=weights, minlength=len(ids))
+        style_ids = np.asarray(buckets.style_ids, dtype=np.int64)[first_index]
+        return [
+            WorkoutTrendingScore(workout_id=workout_id, style_id=style_id, score=score)
+            for workout_id, style_id, score in zip(ids.tolist(), style_ids.tolist(), scores.tolist())
+        ]
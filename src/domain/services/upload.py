@@ -1,10 +1,14 @@
+import logging
 import uuid
 from pathlib import Path
 import aiofiles
+import aiofiles.os
 from src.domain.entities.upload import UploadResponse
 from src.domain.exceptions.base import InternalServerError
 from src.main.config import MEDIA_DIR, BASE_DIR, settings
 
+logger = logging.getLogger(__name__)
+
 
 class UploadService:
     def __init__(self):
@@ -13,7 +17,7 @@ class UploadService:
     async def upload_file(self, file: bytes, filename: str, file_dir: str = '') -> UploadResponse:
         try:
             save_dir = Path(MEDIA_DIR) / file_dir
-            save_dir.mkdir(parents=True, exist_ok=True)
+            await aiofiles.os.makedirs(save_dir, exist_ok=True)
 
             file_stem = Path(filename).stem
             file_ext = Path(filename).suffix
@@ -34,10 +38,10 @@ class UploadService:
             file_path_relative = file_path.replace(self._backend_url, "")
             path = BASE_DIR / file_path_relative.strip("/")
 
-            if path.exists():
-                path.unlink()
+            if await aiofiles.os.path.exists(path):
+                await aiofiles.os.remove(path)
             else:
-                print(f"File not found and cannot be deleted: {file_path_relative}")
+                logger.warning("File not found and cannot be deleted: %s", file_path_relative)
             return True
         except Exception as e:
             raise InternalServerError(f"Failed to delete file: {e}")
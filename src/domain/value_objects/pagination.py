@@ -0,0 +1,37 @@
+import json
+from dataclasses import dataclass
+from enum import Enum as PyEnum
+from typing import Sequence, Tuple, Union
+
+from src.domain.exceptions.base import BadRequest
+
+
+class CountStrategy(PyEnum):
+    EXACT = 'exact'
+    CACHED = 'cached'
+    ESTIMATED = 'estimated'
+
+
+@dataclass(frozen=True)
+class KeysetCursor:
+    """Sort-key values of the last row of a page; the next page starts after them.
+
+    The token is the hex of a JSON array, so it is URL-safe and the database
+    can produce it directly.
+    """
+    keys: Tuple[Union[int, str], ...]
+
+    def encode(self) -> str:
+        return json.dumps(list(self.keys), separators=(',', ':')).encode().hex()
+
+    @classmethod
+    def decode(cls, token: str, types: Sequence[type]) -> 'KeysetCursor':
+        try:
+            keys = json.loads(bytes.fromhex(token))
+        except ValueError:
+            raise BadRequest('Invalid cursor.')
+        if (not isinstance(keys, list)
+                or len(keys) != len(types)
+                or not all(type(key) is key_type for key, key_type in zip(keys, types))):
+            raise BadRequest('Invalid cursor.')
+        return cls(tuple(keys))
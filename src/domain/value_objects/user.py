@@ -2,13 +2,21 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass, field
-
-from passlib.context import CryptContext
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from src.domain.exceptions.user import InvalidPasswordError
 from src.domain.value_objects.base import ValueObject
 
-_pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+if TYPE_CHECKING:
+    from passlib.context import CryptContext
+
+
+@lru_cache(maxsize=None)
+def _pwd_context() -> CryptContext:
+    # Built on first use so workers that never hash a password skip loading passlib.
+    from passlib.context import CryptContext
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
 @dataclass(frozen=True)
@@ -31,7 +39,7 @@ class UserPassword:
     def __post_init__(self):
         if not self.is_hashed(self.value):
             self._validate()
-            hashed_password = _pwd_context.hash(self.value)
+            hashed_password = _pwd_context().hash(self.value)
             object.__setattr__(self, 'value', hashed_password)
 
     def _validate(self) -> None:
@@ -51,4 +59,4 @@ class UserPassword:
     def verify(self, plain_password: str) -> bool:
         if not plain_password:
             raise InvalidPasswordError("Пароль для проверки не может быть пустым.")
-        return _pwd_context.verify(plain_password, self.value)
+        return _pwd_context().verify(plain_password, self.value)
@@ -16,3 +16,23 @@ class LevelsEnum(PyEnum):
             except ValueError:
                 return None
         return None
+
+
+class WorkoutSortEnum(PyEnum):
+    VIEWS = 'views'
+    NEWEST = 'newest'
+    NAME = 'name'
+
+    @property
+    def cursor_types(self) -> tuple:
+        """Types of the sort-key values a keyset cursor carries for this order."""
+        if self is WorkoutSortEnum.VIEWS:
+            return int, int
+        if self is WorkoutSortEnum.NAME:
+            return str, int
+        return (int,)
+
+
+class TagMatchEnum(PyEnum):
+    ANY = 'any'
+    ALL = 'all'
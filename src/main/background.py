@@ -0,0 +1,35 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicTask:
+    """Runs `job` every `interval` seconds until stopped; failures are logged and retried next round."""
+
+    def __init__(self, name: str, job: Callable[[], Awaitable[object]], interval: float):
+        self._name = name
+        self._job = job
+        self._interval = interval
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run(), name=self._name)
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                result = await self._job()
+                logger.debug("%s finished: %s", self._name, result)
+            except Exception:
+                logger.exception("%s failed", self._name)
@@ -2,6 +2,7 @@ import os
 from dataclasses import dataclass
 from os import environ as env
 from pathlib import Path
+from typing import Optional
 
 from dotenv import load_dotenv
 
@@ -10,7 +11,6 @@ load_dotenv()
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 
 MEDIA_DIR = BASE_DIR / 'media_files'
-MEDIA_DIR.mkdir(parents=True, exist_ok=True)
 
 
 @dataclass
@@ -20,11 +20,18 @@ class DBSettings:
     password: str
     user: str
     port: int
+    # Per worker process: the server opens workers * (pool_size + max_overflow) connections at most.
+    pool_size: int = 5
+    max_overflow: int = 10
 
     @property
     def db_uri(self) -> str:
         return f"postgresql+asyncpg://{self.user}:{self.password}@{self.host}:{self.port}/{self.db_name}"
 
+    @property
+    def dsn(self) -> str:
+        return f"postgresql://{self.user}:{self.password}@{self.host}:{self.port}/{self.db_name}"
+
 
 @dataclass
 class CORSSettings:
@@ -36,11 +43,105 @@ class JWTSettings:
     jwt_secret_key: str
 
 
+@dataclass
+class ViewsBufferSettings:
+    flush_interval_ms: int
+    journal_path: Optional[str]
+
+
+@dataclass
+class PopularTagsSettings:
+    top_k: int
+    max_staleness_s: float
+
+
+@dataclass
+class TrendingSettings:
+    half_life_hours: float
+    window_hours: int
+    interval_s: int
+    events_retention_days: int
+
+
+@dataclass
+class JobsSettings:
+    tag_usages_reconcile_interval_s: int
+
+
+@dataclass
+class CacheSettings:
+    url: Optional[str]
+    ttl_s: float
+    max_entries: int
+
+
+@dataclass
+class CatalogSnapshotSettings:
+    directory: Optional[str]
+    max_age_s: float
+    refresh_interval_s: float
+
+
+@dataclass
+class MetricsSettings:
+    sync_interval_s: float
+
+
+@dataclass
+class QueryTracingSettings:
+    slow_query_ms: float
+    repeat_threshold: int
+
+
+@dataclass
+class ProfilingSettings:
+    directory: Optional[str]
+    max_profiles: int
+    interval_ms: float
+
+
+@dataclass
+class ServerTimingSettings:
+    sample_rate: float
+
+
+@dataclass
+class LoopMonitorSettings:
+    interval_ms: float
+    block_threshold_ms: float
+    capture_stacks: bool
+
+
+@dataclass
+class ServerSettings:
+    host: str
+    port: int
+    workers: Optional[int]
+    loop: str
+    http: str
+    backlog: int
+    keep_alive_s: int
+    graceful_shutdown_s: int
+    forwarded_allow_ips: Optional[str]
+
+
 @dataclass
 class Settings:
     db: DBSettings
     cors: CORSSettings
     jwt: JWTSettings
+    views: ViewsBufferSettings
+    jobs: JobsSettings
+    popular_tags: PopularTagsSettings
+    trending: TrendingSettings
+    cache: CacheSettings
+    catalog_snapshot: CatalogSnapshotSettings
+    server: ServerSettings
+    metrics: MetricsSettings
+    query_tracing: QueryTracingSettings
+    profiling: ProfilingSettings
+    server_timing: ServerTimingSettings
+    loop_monitor: LoopMonitorSettings
     backend_url: str
 
 
@@ -52,15 +153,87 @@ def load_settings() -> Settings:
         password=env["POSTGRES_PASSWORD"],
         user=env["POSTGRES_USER"],
         port=int(env["POSTGRES_PORT"]),
+        pool_size=int(env.get("DB_POOL_SIZE", 5)),
+        max_overflow=int(env.get("DB_MAX_OVERFLOW", 10)),
     )
 
     cors = CORSSettings(frontend_url=env.get("FRONTEND_URL", "localhost:3000"))
     jwt = JWTSettings(jwt_secret_key=env["JWT_SECRET_KEY"])
+    views = ViewsBufferSettings(
+        flush_interval_ms=int(env.get("VIEWS_FLUSH_INTERVAL_MS", 500)),
+        journal_path=env.get("VIEWS_JOURNAL_PATH") or None,
+    )
+    jobs = JobsSettings(
+        tag_usages_reconcile_interval_s=int(env.get("TAG_USAGES_RECONCILE_INTERVAL_S", 900)),
+    )
+    popular_tags = PopularTagsSettings(
+        top_k=int(env.get("POPULAR_TAGS_TOP_K", 500)),
+        max_staleness_s=float(env.get("POPULAR_TAGS_MAX_STALENESS_S", 5)),
+    )
+    trending = TrendingSettings(
+        half_life_hours=float(env.get("TRENDING_HALF_LIFE_HOURS", 24)),
+        window_hours=int(env.get("TRENDING_WINDOW_HOURS", 7 * 24)),
+        interval_s=int(env.get("TRENDING_INTERVAL_S", 300)),
+        events_retention_days=int(env.get("VIEW_EVENTS_RETENTION_DAYS", 30)),
+    )
+    cache = CacheSettings(
+        url=env.get("CACHE_URL") or None,
+        ttl_s=float(env.get("CACHE_TTL_S", 30)),
+        max_entries=int(env.get("CACHE_MAX_ENTRIES", 10_000)),
+    )
+    catalog_snapshot = CatalogSnapshotSettings(
+        directory=env.get("CATALOG_SNAPSHOT_DIR") or None,
+        max_age_s=float(env.get("CATALOG_SNAPSHOT_MAX_AGE_S", 600)),
+        refresh_interval_s=float(env.get("CATALOG_SNAPSHOT_REFRESH_INTERVAL_S", 60)),
+    )
+    server = ServerSettings(
+        host=env.get("SERVER_HOST", "0.0.0.0"),
+        port=int(env.get("SERVER_PORT", 8000)),
+        workers=int(env["SERVER_WORKERS"]) if env.get("SERVER_WORKERS") else None,
+        loop=env.get("SERVER_LOOP", "auto"),
+        http=env.get("SERVER_HTTP", "auto"),
+        backlog=int(env.get("SERVER_BACKLOG", 2048)),
+        keep_alive_s=int(env.get("SERVER_KEEP_ALIVE_S", 5)),
+        graceful_shutdown_s=int(env.get("SERVER_GRACEFUL_SHUTDOWN_S", 30)),
+        forwarded_allow_ips=env.get("FORWARDED_ALLOW_IPS") or None,
+    )
+    metrics = MetricsSettings(
+        sync_interval_s=float(env.get("METRICS_SYNC_INTERVAL_S", 5)),
+    )
+    query_tracing = QueryTracingSettings(
+        slow_query_ms=float(env.get("SLOW_QUERY_MS", 200)),
+        repeat_threshold=int(env.get("QUERY_REPEAT_THRESHOLD", 5)),
+    )
+    profiling = ProfilingSettings(
+        directory=env.get("PROFILING_DIR") or None,
+        max_profiles=int(env.get("PROFILING_MAX_PROFILES", 50)),
+        interval_ms=float(env.get("PROFILING_INTERVAL_MS", 1)),
+    )
+    server_timing = ServerTimingSettings(
+        sample_rate=float(env.get("SERVER_TIMING_SAMPLE_RATE", 0)),
+    )
+    loop_monitor = LoopMonitorSettings(
+        interval_ms=float(env.get("LOOP_MONITOR_INTERVAL_MS", 250)),
+        block_threshold_ms=float(env.get("LOOP_BLOCK_THRESHOLD_MS", 100)),
+        capture_stacks=env.get("LOOP_MONITOR_CAPTURE_STACKS", "false").lower() == "true",
+    )
     backend_url = env.get("BACKEND_URL", "http://localhost:8000")
     return Settings(
         db=db,
         cors=cors,
         jwt=jwt,
+        views=views,
+        jobs=jobs,
+        popular_tags=popular_tags,
+        trending=trending,
+        cache=cache,
+        catalog_snapshot=catalog_snapshot,
+        server=server,
+        metrics=metrics,
+        query_tracing=query_tracing,
+        profiling=profiling,
+        server_timing=server_timing,
+        loop_monitor=loop_monitor,
         backend_url=backend_url,
     )
 
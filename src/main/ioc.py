@@ -1,16 +1,30 @@
+import time
 from contextlib import asynccontextmanager
-from typing import Callable, AsyncContextManager
+from pathlib import Path
+from typing import Callable, AsyncContextManager, List, Optional, Tuple
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from src.adapters.cache.memory import MemoryCache
+from src.adapters.database.notifications import CacheInvalidationFeed, PgInvalidationPublisher
+from src.adapters.observability.metrics import CacheMetrics, MeteredUploadService, instrument_interactor
+from src.adapters.snapshot.catalog import CatalogSnapshotLoader
+from src.adapters.snapshot.store import SnapshotStore
 from src.application.avatar.interactor import AvatarInteractor
+from src.application.common.cache import ReadThroughCache
+from src.application.interfaces.cache import Cache
+from src.adapters.database.views_buffer import WorkoutViewsBuffer
 from src.application.interfaces.interactor import Interactor
+from src.application.tag.autocomplete import TagAutocompleteIndex
 from src.application.tag.interactor import TagInteractor
+from src.application.tag.ranking import PopularTagsRanking
 from src.application.workout.interactor import WorkoutInteractor
+from src.domain.entities.tag import DBTag
+from src.domain.value_objects.pagination import CountStrategy
 from src.domain.services.avatar import AvatarService
-from src.domain.services.upload import UploadService
+from src.domain.services.trending import TrendingService
 from src.domain.services.workout import WorkoutService
-from src.main.web import settings
+from src.main.config import settings
 from src.application.user.jwt import JWTService
 from src.adapters.database.provider import (
     get_uow,
@@ -19,7 +33,8 @@ from src.adapters.database.provider import (
     get_style_repository,
     get_staff_repository,
     get_client_repository,
-    get_workout_repository, get_workout_tag_repository, get_avatar_repository
+    get_workout_repository, get_workout_tag_repository, get_avatar_repository,
+    get_trending_repository, get_workout_reader, get_style_reader, get_tag_reader
 )
 from src.domain.services.tag import TagService
 from src.domain.services.user import UserService
@@ -48,7 +63,94 @@ class IoC(InteractorFactory):
         self._workout_service = WorkoutService()
         self._avatar_service = AvatarService()
         self._tag_service = TagService()
-        self._upload_service = UploadService()
+        self._upload_service = MeteredUploadService()
+        self._trending_service = TrendingService(settings.trending.half_life_hours)
+        self._tag_index = TagAutocompleteIndex()
+        self._popular_tags = PopularTagsRanking(
+            self._load_popular_tags,
+            size=settings.popular_tags.top_k,
+            max_staleness=settings.popular_tags.max_staleness_s
+        )
+        self._catalog_snapshot = CatalogSnapshotLoader(
+            SnapshotStore(Path(settings.catalog_snapshot.directory)),
+            session_factory,
+            self._tag_index,
+            max_age=settings.catalog_snapshot.max_age_s
+        ) if settings.catalog_snapshot.directory else None
+        self._cache_backend = self._create_cache_backend()
+        # A shared backend is invalidated directly; per-process ones hear about other workers' writes.
+        publisher = PgInvalidationPublisher(session_factory) if isinstance(self._cache_backend, MemoryCache) else None
+        self._cache = ReadThroughCache(self._cache_backend, ttl=settings.cache.ttl_s, publisher=publisher)
+        self._cache_invalidation_feed = CacheInvalidationFeed(self._cache, publisher.origin) if publisher else None
+        self._cache_metrics = CacheMetrics(self._cache, self._cache_invalidation_feed)
+        self._views_buffer = WorkoutViewsBuffer(
+            session_factory,
+            flush_interval=settings.views.flush_interval_ms / 1000,
+            journal_path=settings.views.journal_path
+        )
+
+    @property
+    def tag_index(self) -> TagAutocompleteIndex:
+        return self._tag_index
+
+    @property
+    def popular_tags(self) -> PopularTagsRanking:
+        return self._popular_tags
+
+    @property
+    def cache(self) -> ReadThroughCache:
+        return self._cache
+
+    @property
+    def cache_invalidation_feed(self) -> Optional[CacheInvalidationFeed]:
+        return self._cache_invalidation_feed
+
+    @property
+    def views_buffer(self) -> WorkoutViewsBuffer:
+        return self._views_buffer
+
+    async def sync_cache_metrics(self) -> None:
+        await self._cache_metrics.sync()
+
+    async def close_cache(self) -> None:
+        await self._cache_backend.close()
+
+    async def load_tag_index(self) -> None:
+        if self._catalog_snapshot is not None:
+            await self._catalog_snapshot.load_index()
+            return
+        read_at = time.time()
+        async with self._session_factory() as session:
+            tags = await get_tag_repository(session).list_index_entries()
+        self._tag_index.load(tags, as_of=read_at)
+
+    async def refresh_catalog_snapshot(self) -> None:
+        if self._catalog_snapshot is not None:
+            await self._catalog_snapshot.refresh()
+
+    async def _load_popular_tags(self, size: int) -> Tuple[List[DBTag], int]:
+        async with self._session_factory() as session:
+            return await get_tag_repository(session).list_paginated_popular_tags(1, size, CountStrategy.CACHED)
+
+    async def reconcile_tag_usages(self) -> int:
+        async with self.pick_tag_interactor(lambda i: i.reconcile_usages) as interactor:
+            return await interactor()
+
+    async def maintain_view_event_partitions(self) -> None:
+        async with self.pick_workout_interactor(lambda i: i.maintain_view_event_partitions) as interactor:
+            await interactor(settings.trending.events_retention_days)
+
+    async def recompute_trending_scores(self) -> int:
+        async with self.pick_workout_interactor(lambda i: i.recompute_trending_scores) as interactor:
+            return await interactor(settings.trending.window_hours, settings.trending.events_retention_days)
+
+    @staticmethod
+    def _create_cache_backend() -> Cache:
+        if settings.cache.url:
+            # Optional dependency, installed with the `redis` extra.
+            from src.adapters.cache.redis import RedisCache
+            return RedisCache.from_url(settings.cache.url)
+        return MemoryCache(settings.cache.max_entries)
 
     def _construct_user_interactor(
             self, session: AsyncSession
@@ -73,8 +175,10 @@ class IoC(InteractorFactory):
         return StyleInteractor(
             uow=uow,
             style_repository=style_repository,
+            style_reader=get_style_reader(session),
             style_service=self._style_service,
-            upload_service=self._upload_service
+            upload_service=self._upload_service,
+            cache=self._cache
         )
 
     def _construct_tag_interactor(self, session: AsyncSession) -> TagInteractor:
@@ -83,7 +187,11 @@ class IoC(InteractorFactory):
         return TagInteractor(
             uow=uow,
             tag_repository=tag_repository,
-            tag_service=self._tag_service
+            tag_reader=get_tag_reader(session),
+            tag_service=self._tag_service,
+            tag_index=self._tag_index,
+            popular_tags=self._popular_tags,
+            cache=self._cache
         )
 
     def _construct_workout_interactor(self, session: AsyncSession) -> WorkoutInteractor:
@@ -91,15 +199,21 @@ class IoC(InteractorFactory):
         style_repository = get_style_repository(session)
         workout_repository = get_workout_repository(session)
         workout_tag_repository = get_workout_tag_repository(session)
+        trending_repository = get_trending_repository(session)
         uow = self._uow_factory(session)
         return WorkoutInteractor(
             workout_repository=workout_repository,
+            workout_reader=get_workout_reader(session),
             workout_service=self._workout_service,
             workout_tag_association_repository=workout_tag_repository,
             tag_service=self._tag_service,
             tag_repository=tag_repository,
             style_repository=style_repository,
             upload_service=self._upload_service,
+            views_counter=self._views_buffer,
+            trending_repository=trending_repository,
+            trending_service=self._trending_service,
+            cache=self._cache,
             uow=uow
         )
 
@@ -110,7 +224,8 @@ class IoC(InteractorFactory):
             avatar_repository=avatar_repository,
             uow=uow,
             avatar_service=self._avatar_service,
-            upload_service=self._upload_service
+            upload_service=self._upload_service,
+            cache=self._cache
         )
 
     def _pick_interactor(
@@ -122,7 +237,7 @@ class IoC(InteractorFactory):
         async def manager():
             async with self._session_factory() as session:
                 interactor = constructor(session)
-                yield picker(interactor)
+                yield instrument_interactor(picker(interactor))
 
         return manager()
 
@@ -0,0 +1,84 @@
+"""Production entrypoint: `python -m src.main.server`.
+
+Runs uvicorn's process manager with one event loop per CPU. On SIGTERM each
+worker stops accepting connections, lets in-flight requests finish for up to
+`graceful_shutdown_s`, then runs the app lifespan shutdown.
+"""
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+import uvicorn
+
+from src.main.config import ServerSettings, settings
+
+CGROUP_CPU_MAX = Path('/sys/fs/cgroup/cpu.max')
+
+
+def available_cpus() -> int:
+    """CPUs this process may use: its affinity mask, capped by a cgroup v2 CPU quota."""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    quota = _cgroup_cpu_quota()
+    if quota is not None:
+        cpus = min(cpus, max(1, int(quota)))
+    return cpus
+
+
+def _cgroup_cpu_quota() -> Optional[float]:
+    try:
+        quota, period = CGROUP_CPU_MAX.read_text().split()
+    except (OSError, ValueError):
+        return None
+    if quota == 'max':
+        return None
+    return int(quota) / int(period)
+
+
+def prepare_metrics_dir() -> Path:
+    """Give the workers an empty directory for their metric files.
+
+    Metric files left by an earlier server would be summed into the new
+    totals, so they are deleted on every start. Only the `*.db` files go: the
+    directory may be a mount or hold other files, and is never removed. The
+    variable is set before the workers are spawned, which is before any of
+    them imports prometheus_client.
+    """
+    directory = os.environ.get('PROMETHEUS_MULTIPROC_DIR')
+    if directory is None:
+        directory = os.environ['PROMETHEUS_MULTIPROC_DIR'] = tempfile.mkdtemp(prefix='groover-metrics-')
+    path = Path(directory)
+    path.mkdir(parents=True, exist_ok=True)
+    for metric_file in path.glob('*.db'):
+        metric_file.unlink(missing_ok=True)
+    return path
+
+
+def run(server: ServerSettings) -> None:
+    prepare_metrics_dir()
+    uvicorn.run(
+        'src.main.web:app',
+        host=server.host,
+        port=server.port,
+        workers=server.workers or available_cpus(),
+        loop=server.loop,
+        http=server.http,
+        lifespan='on',
+        backlog=server.backlog,
+        timeout_keep_alive=server.keep_alive_s,
+        timeout_graceful_shutdown=server.graceful_shutdown_s,
+        proxy_headers=server.forwarded_allow_ips is not None,
+        forwarded_allow_ips=server.forwarded_allow_ips,
+        server_header=False,
+    )
+
+
+def main() -> None:
+    run(settings.server)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,6 @@
-import uvicorn
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession
@@ -6,6 +8,7 @@ from starlette.staticfiles import StaticFiles
 
 from src.main.config import settings, MEDIA_DIR
 from src.main.ioc import IoC
+from src.main.background import PeriodicTask
 
 from src.presentation.api.endpoints import include_routers
 from src.presentation.api.middlewares import include_middlewares
@@ -13,10 +16,98 @@ from src.presentation.interactor_factory import InteractorFactory
 from src.presentation.api.exception_handlers import include_exception_handlers
 
 from src.adapters.database.session import get_async_sessionmaker, get_engine
+from src.adapters.database.tracing import QueryTracer
+from src.adapters.observability.loop_monitor import LoopLagMonitor
+from src.adapters.observability.metrics import mark_worker_stopped, metrics_endpoint
+from src.adapters.database.notifications import PgListener, TagChangeFeed, TAG_CHANGES_CHANNEL, \
+    CACHE_INVALIDATION_CHANNEL
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Owns everything a worker process runs besides requests.
+
+    Resources are released in reverse order on shutdown, which uvicorn starts
+    only after in-flight requests drained: periodic jobs stop first, the
+    views buffer flushes while the pool is still open, and the engine is
+    disposed last.
+    """
+    MEDIA_DIR.mkdir(parents=True, exist_ok=True)
+    async with AsyncExitStack() as stack:
+        stack.callback(mark_worker_stopped)
+        loop_monitor = LoopLagMonitor(
+            settings.loop_monitor.interval_ms / 1000,
+            settings.loop_monitor.block_threshold_ms / 1000,
+            settings.loop_monitor.capture_stacks
+        )
+        loop_monitor.start()
+        stack.push_async_callback(loop_monitor.stop)
+        engine = await stack.enter_async_context(get_engine(settings.db))
+        query_tracer.install(engine)
+        session_factory: async_sessionmaker[AsyncSession] = await get_async_sessionmaker(engine)
+        ioc = IoC(session_factory=session_factory)
+        stack.push_async_callback(ioc.close_cache)
+
+        listener = PgListener(settings.db)
+        listener.subscribe(TAG_CHANGES_CHANNEL, TagChangeFeed(ioc.tag_index))
+        listener.subscribe(TAG_CHANGES_CHANNEL, lambda _payload: ioc.popular_tags.mark_dirty())
+        listener.on_reconnect(ioc.load_tag_index)
+        listener.on_reconnect(lambda: ioc.popular_tags.mark_dirty())
+        if ioc.cache_invalidation_feed is not None:
+            listener.subscribe(CACHE_INVALIDATION_CHANNEL, ioc.cache_invalidation_feed)
+            listener.on_reconnect(ioc.cache_invalidation_feed.resync)
+        await listener.start()
+        stack.push_async_callback(listener.stop)
+        # Loaded only once listening, so no change committed in between is missed.
+        await ioc.load_tag_index()
+
+        # The trending job maintains partitions only after its first interval.
+        await ioc.maintain_view_event_partitions()
+        await ioc.views_buffer.start()
+        stack.push_async_callback(ioc.views_buffer.stop)
+
+        periodic_tasks = [
+            PeriodicTask(
+                'tag usages reconciliation',
+                ioc.reconcile_tag_usages,
+                settings.jobs.tag_usages_reconcile_interval_s
+            ),
+            PeriodicTask(
+                'trending scores',
+                ioc.recompute_trending_scores,
+                settings.trending.interval_s
+            ),
+            PeriodicTask(
+                'cache metrics sync',
+                ioc.sync_cache_metrics,
+                settings.metrics.sync_interval_s
+            ),
+        ]
+        if settings.catalog_snapshot.directory:
+            periodic_tasks.append(PeriodicTask(
+                'catalog snapshot refresh',
+                ioc.refresh_catalog_snapshot,
+                settings.catalog_snapshot.refresh_interval_s
+            ))
+        for task in periodic_tasks:
+            task.start()
+            stack.push_async_callback(task.stop)
+
+        app.state.ioc = ioc
+        app.state.loop_monitor = loop_monitor
+        app.dependency_overrides[InteractorFactory] = lambda: ioc
+        yield
+
+
+query_tracer = QueryTracer(
+    settings.query_tracing.slow_query_ms / 1000,
+    settings.query_tracing.repeat_threshold
+)
 
 app = FastAPI(
     docs_url='/api/docs',
-    redoc_url='/api/redoc'
+    redoc_url='/api/redoc',
+    lifespan=lifespan
 )
 
 origins = [
@@ -30,21 +121,14 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
-app.mount("/media_files", StaticFiles(directory=MEDIA_DIR), name="media")
-include_middlewares(app)
+app.mount("/media_files", StaticFiles(directory=MEDIA_DIR, check_dir=False), name="media")
+app.state.query_tracer = query_tracer
+include_middlewares(app, query_tracer)
 include_exception_handlers(app)
-
-
-@app.on_event("startup")
-async def on_startup() -> None:
-    engine_factory = get_engine(settings.db)
-    engine = await anext(engine_factory)
-    session_factory: async_sessionmaker[AsyncSession] = await get_async_sessionmaker(engine)
-    ioc: InteractorFactory = IoC(session_factory=session_factory)
-
-    app.dependency_overrides = {InteractorFactory: lambda: ioc}
-    include_routers(app)
+include_routers(app)
+app.add_route('/metrics', metrics_endpoint, include_in_schema=False)
 
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="localhost", workers=1, port=8000)
+    from src.main.server import main
+    main()
@@ -10,6 +10,7 @@ from src.main.config import settings
 from src.domain.entities.user import DBUser
 from src.application.user.jwt import JWTService
 from src.adapters.database.provider import get_user_repository
+from src.adapters.observability.timing import timed
 from src.presentation.api.dependencies.db import get_db_session
 
 from src.domain.exceptions.jwt import (
@@ -34,34 +35,35 @@ async def get_current_user(
         token: str = Depends(get_token),
         session: AsyncSession = Depends(get_db_session),
 ) -> DBUser:
-    jwt_service = JWTService(settings.jwt.jwt_secret_key)
-    user_repository = get_user_repository(session)
-    try:
-        payload = jwt_service.decode(token)
-        user_id = payload.sub
-        if not user_id:
-            raise JWTError("Invalid token payload")
-        user = await user_repository.get(user_id)
-        if not user:
-            raise JWTError("User not found")
-        return user
-    except JWTExpiredError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Token has expired",
-        )
-    except JWTSignatureError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token signature",
-        )
-    except JWTDecodeError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not decode token",
-        )
-    except JWTError as e:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=str(e),
-        )
+    with timed('auth'):
+        jwt_service = JWTService(settings.jwt.jwt_secret_key)
+        user_repository = get_user_repository(session)
+        try:
+            payload = jwt_service.decode(token)
+            user_id = payload.sub
+            if not user_id:
+                raise JWTError("Invalid token payload")
+            user = await user_repository.get(user_id)
+            if not user:
+                raise JWTError("User not found")
+            return user
+        except JWTExpiredError:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Token has expired",
+            )
+        except JWTSignatureError:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid token signature",
+            )
+        except JWTDecodeError:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Could not decode token",
+            )
+        except JWTError as e:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail=str(e),
+            )
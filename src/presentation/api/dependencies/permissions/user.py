@@ -3,10 +3,12 @@ from fastapi import Depends
 from src.domain.entities.user import DBUser
 from src.presentation.api.dependencies.auth import get_current_user
 
+ADMIN_ROLES = ('ADMIN', 'MANAGER')
+
 
 class IsAdminUser:
     def __call__(self, user: DBUser = Depends(get_current_user)) -> bool:
-        if user and user.role in ['ADMIN', 'MANAGER']:
+        if user and user.role in ADMIN_ROLES:
             return True
         return False
 
@@ -1,10 +1,12 @@
-from typing import List
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, status, UploadFile, File
+from fastapi import APIRouter, Depends, Header, status, UploadFile, File
 from starlette.responses import JSONResponse, Response
 
 from src.domain.entities.upload import CreateUpload
 from src.presentation.api.dependencies.permissions.user import IsAdminUser, IsAuthenticatedUser
+from src.presentation.api.etag import etag_headers, etag_matches, not_modified, weak_etag
+from src.presentation.api.responses import DTOResponse
 from src.presentation.api.schemas.avatar import Avatar
 from src.presentation.interactor_factory import InteractorFactory
 from src.application.avatar.dto import CreateAvatarDTO, UpdateAvatarDTO
@@ -34,6 +36,7 @@ async def create_avatar(upload: UploadFile = File(...), ioc: InteractorFactory =
 @router.get('/list',
             dependencies=[Depends(IsAuthenticatedUser())],
             response_model=List[Avatar],
+            response_class=DTOResponse,
             responses={
                 status.HTTP_200_OK: {
                     "content": {
@@ -64,10 +67,18 @@ async def create_avatar(upload: UploadFile = File(...), ioc: InteractorFactory =
                 }
             },
             summary='List all avatars')
-async def get_all_avatars(ioc: InteractorFactory = Depends()):
+async def get_all_avatars(if_none_match: Optional[str] = Header(None), ioc: InteractorFactory = Depends()):
+    async with ioc.pick_avatar_interactor(lambda i: i.get_avatars_version) as interactor:
+        version = await interactor()
+    etag = weak_etag(version) if version is not None else None
+    if etag is not None and etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
     async with ioc.pick_avatar_interactor(lambda i: i.get_all_avatars) as interactor:
         response = await interactor()
-    return response
+    # Tagged with the version cached with the body, which may trail the live one.
+    etag = weak_etag(response.version) if response.version is not None else None
+    return DTOResponse(response.avatars, headers=etag_headers(etag) if etag else None)
 
 
 @router.get('/{avatar_id}',
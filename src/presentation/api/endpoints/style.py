@@ -1,11 +1,14 @@
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, status, UploadFile, File
+from fastapi import APIRouter, Depends, Header, status, UploadFile, File, Query
 from starlette.responses import JSONResponse, Response
 
 from src.domain.entities.upload import CreateUpload
+from src.domain.value_objects.workout import WorkoutSortEnum
 from src.presentation.api.dependencies.permissions.user import IsAdminUser
 from src.presentation.api.dependencies.permissions.user import IsAuthenticatedUser
+from src.presentation.api.etag import etag_headers, etag_matches, not_modified, weak_etag
+from src.presentation.api.responses import DTOResponse, RawJSONResponse
 
 from src.presentation.api.schemas.style import StyleCreate
 from src.presentation.api.schemas.style import StyleUpdate
@@ -62,7 +65,7 @@ async def create_style(style: StyleCreate = Depends(StyleCreate.as_form()),
         response = await interactor(CreateStyleDTO(
             name=style.name,
             image_file=CreateUpload(
-                file=image_file.file.read(),
+                file=await image_file.read(),
                 filename=image_file.filename,
                 filedir="styles"
             )
@@ -77,6 +80,7 @@ async def create_style(style: StyleCreate = Depends(StyleCreate.as_form()),
 @router.get('/list',
             dependencies=[Depends(IsAuthenticatedUser())],
             response_model=List[Style],
+            response_class=DTOResponse,
             responses={
                 status.HTTP_200_OK: {
                     "content": {
@@ -111,10 +115,18 @@ async def create_style(style: StyleCreate = Depends(StyleCreate.as_form()),
                 }
             },
             summary='List all styles')
-async def get_all_styles(ioc: InteractorFactory = Depends()):
+async def get_all_styles(if_none_match: Optional[str] = Header(None), ioc: InteractorFactory = Depends()):
+    async with ioc.pick_style_interactor(lambda i: i.get_styles_version) as interactor:
+        version = await interactor()
+    etag = weak_etag(version) if version is not None else None
+    if etag is not None and etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
     async with ioc.pick_style_interactor(lambda i: i.list_styles) as interactor:
         response = await interactor()
-    return response
+    # Tagged with the version cached with the body, which may trail the live one.
+    etag = weak_etag(response.version) if response.version is not None else None
+    return DTOResponse(response.styles, headers=etag_headers(etag) if etag else None)
 
 
 @router.get('/{style_id}',
@@ -146,6 +158,7 @@ async def get_style(style_id: int, ioc: InteractorFactory = Depends()):
 @router.get('/{style_id}/detail',
             status_code=status.HTTP_200_OK,
             response_model=StyleWithWorkouts,
+            response_class=RawJSONResponse,
             dependencies=[Depends(IsAuthenticatedUser())],
             responses={
                 status.HTTP_200_OK: {
@@ -162,12 +175,17 @@ async def get_style(style_id: int, ioc: InteractorFactory = Depends()):
                     "description": "Style not found"
                 }
             },
-            summary='Get a style with workout details, for authenticated users')
-async def get_style_detail(style_id: int, ioc: InteractorFactory = Depends()):
-    async with ioc.pick_style_interactor(lambda i: i.get_style) as interactor:
-        response = await interactor(style_id, True)
-    print(response)
-    return response
+            summary='Get a style with one page of its workouts, for authenticated users')
+async def get_style_detail(
+        style_id: int,
+        sort: WorkoutSortEnum = Query(WorkoutSortEnum.NEWEST),
+        limit: int = Query(20, ge=1, le=100),
+        cursor: Optional[str] = Query(None, max_length=512, description='`next_cursor` of the previous page'),
+        ioc: InteractorFactory = Depends()
+):
+    async with ioc.pick_style_interactor(lambda i: i.get_style_document) as interactor:
+        document = await interactor(style_id, sort, limit, cursor)
+    return RawJSONResponse(document)
 
 
 @router.put('/{style_id}/update',
@@ -200,7 +218,7 @@ async def update_style(style_id: int,
             UpdateStyleDTO(
                 name=style.name,
                 image_file=CreateUpload(
-                    file=image_file.file.read(),
+                    file=await image_file.read(),
                     filename=image_file.filename,
                     filedir="styles"
                 ) if image_file else None,
@@ -1,14 +1,18 @@
-from typing import List, Union
+from typing import List, Optional, Union
 
-from fastapi import APIRouter, Depends, status, Query
+from fastapi import APIRouter, Depends, Header, status, Query
 from starlette.responses import JSONResponse, Response
 
 from src.application.tag.interactor import TagInteractor
 from src.domain.entities.pagination import PaginatedResponseDTO
+from src.domain.value_objects.pagination import CountStrategy
+from src.domain.value_objects.workout import WorkoutSortEnum
 from src.presentation.api.dependencies.permissions.user import IsAdminUser, IsAuthenticatedUser
 from src.presentation.interactor_factory import InteractorFactory
 from src.application.tag.dto import CreateTagDTO, UpdateTagDTO
-from src.presentation.api.schemas.tag import TagCreate, TagUpdate, Tag, TagWorkouts, PaginatedTag
+from src.presentation.api.etag import etag_headers, etag_matches, not_modified, weak_etag
+from src.presentation.api.responses import DTOResponse, RawJSONResponse
+from src.presentation.api.schemas.tag import TagCreate, TagUpdate, Tag, TagWorkouts, PaginatedTag, PaginatedPopularTag
 
 router = APIRouter(prefix='/tags', tags=['tags'])
 
@@ -74,18 +78,50 @@ async def get_all_tags(ioc: InteractorFactory = Depends()):
     return response
 
 
+@router.get('/autocomplete',
+            dependencies=[Depends(IsAuthenticatedUser())],
+            response_model=List[Tag],
+            response_class=DTOResponse,
+            summary='Complete a tag name prefix, most used tags first')
+async def autocomplete_tags(
+        prefix: str = Query(..., min_length=1, max_length=100),
+        limit: int = Query(10, ge=1, le=50),
+        ioc: InteractorFactory = Depends()
+):
+    async with ioc.pick_tag_interactor(lambda i: i.autocomplete_tags) as interactor:
+        response = await interactor(prefix, limit)
+    return DTOResponse(response)
+
+
+@router.get('/search',
+            dependencies=[Depends(IsAuthenticatedUser())],
+            response_model=List[Tag],
+            response_class=DTOResponse,
+            summary='Search tags by substring, ranked by similarity')
+async def search_tags(
+        q: str = Query(..., min_length=1, max_length=100),
+        limit: int = Query(20, ge=1, le=100),
+        ioc: InteractorFactory = Depends()
+):
+    async with ioc.pick_tag_interactor(lambda i: i.get_filtered_tags) as interactor:
+        response = await interactor(name=q, limit=limit)
+    return DTOResponse(response)
+
+
 @router.get('/search/by-name',
             dependencies=[Depends(IsAuthenticatedUser())],
             response_model=List[Tag],
+            response_class=DTOResponse,
             summary='Search tags by name, with option to include workouts')
 async def get_tags_by_name(name: str, ioc: InteractorFactory = Depends()):
     async with ioc.pick_tag_interactor(lambda i: i.get_filtered_tags) as interactor:
         response = await interactor(name=name)
-    return response
+    return DTOResponse(response)
 
 
 @router.get('/{tag_id}',
             response_model=Tag,
+            response_class=DTOResponse,
             status_code=status.HTTP_200_OK,
             dependencies=[Depends(IsAdminUser())],
             responses={
@@ -106,13 +142,14 @@ async def get_tags_by_name(name: str, ioc: InteractorFactory = Depends()):
             summary='Get a tag, only admins or managers')
 async def get_tag(tag_id: int, ioc: InteractorFactory = Depends()):
     async with ioc.pick_tag_interactor(lambda i: i.get_tag) as interactor:
-        response = await interactor(tag_id, False)
-    return response
+        response = await interactor(tag_id)
+    return DTOResponse(response)
 
 
 @router.get('/list/paginated',
             dependencies=[Depends(IsAuthenticatedUser())],
             response_model=PaginatedTag,
+            response_class=DTOResponse,
             summary='List paginated tags')
 async def get_tags_paginated(
         page: int = Query(1, ge=1),
@@ -120,26 +157,39 @@ async def get_tags_paginated(
         ioc: InteractorFactory = Depends()
 ):
     async with ioc.pick_tag_interactor(lambda i: i.list_tags) as interactor:
-        response = await interactor(page, limit)
-    return response
+        response = await interactor(page, limit, CountStrategy.CACHED)
+    return DTOResponse(response)
 
 
 @router.get('/list/popular',
             dependencies=[Depends(IsAuthenticatedUser())],
-            response_model=PaginatedTag,
+            response_model=PaginatedPopularTag,
+            response_class=DTOResponse,
             summary='List popular tags with pagination')
 async def get_popular_tags_paginated(
         page: int = Query(1, ge=1),
         limit: int = Query(10, ge=1),
+        if_none_match: Optional[str] = Header(None),
         ioc: InteractorFactory = Depends()
 ):
+    async with ioc.pick_tag_interactor(lambda i: i.get_popular_tags_version) as interactor:
+        version = await interactor(page, limit)
+    if version is not None:
+        etag = weak_etag(version, page, limit)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
     async with ioc.pick_tag_interactor(lambda i: i.list_popular_tags) as interactor:
-        response = await interactor(page, limit)
-    return response
+        popular_tags = await interactor(page, limit, CountStrategy.CACHED)
+    if popular_tags.version is None:
+        return DTOResponse(popular_tags)
+    # Tagged with the version actually served, which a reload may have just changed.
+    return DTOResponse(popular_tags, headers=etag_headers(weak_etag(popular_tags.version, page, limit)))
 
 
 @router.get('/{tag_id}/detial',
             response_model=TagWorkouts,
+            response_class=RawJSONResponse,
             status_code=status.HTTP_200_OK,
             dependencies=[Depends(IsAdminUser())],
             responses={
@@ -157,11 +207,17 @@ async def get_popular_tags_paginated(
                     "description": "Tag not found"
                 }
             },
-            summary='Get a tag with detail')
-async def get_tag(tag_id: int, ioc: InteractorFactory = Depends()):
-    async with ioc.pick_tag_interactor(lambda i: i.get_tag) as interactor:
-        response = await interactor(tag_id, True)
-    return response
+            summary='Get a tag with one page of its workouts')
+async def get_tag(
+        tag_id: int,
+        sort: WorkoutSortEnum = Query(WorkoutSortEnum.NEWEST),
+        limit: int = Query(20, ge=1, le=100),
+        cursor: Optional[str] = Query(None, max_length=512, description='`next_cursor` of the previous page'),
+        ioc: InteractorFactory = Depends()
+):
+    async with ioc.pick_tag_interactor(lambda i: i.get_tag_document) as interactor:
+        document = await interactor(tag_id, sort, limit, cursor)
+    return RawJSONResponse(document)
 
 
 @router.put('/{tag_id}/update',
@@ -1,8 +1,10 @@
 from typing import List, Optional
 from starlette.responses import JSONResponse, Response
-from fastapi import APIRouter, Depends, status, UploadFile, File, Form
+from fastapi import APIRouter, Depends, Header, status, UploadFile, File, Form, Query
 
 from src.domain.entities.upload import CreateUpload
+from src.domain.entities.workout import WorkoutFilter
+from src.domain.value_objects.workout import LevelsEnum, WorkoutSortEnum, TagMatchEnum
 from src.presentation.api.dependencies.permissions.user import IsAdminUser, IsAuthenticatedUser
 from src.presentation.interactor_factory import InteractorFactory
 
@@ -13,8 +15,11 @@ from src.application.workout.dto import (
 from src.presentation.api.schemas.workout import (
     WorkoutCreate,
     WorkoutUpdate,
-    Workout, WorkoutViewResponse, WorkoutWithStyle
+    Workout, WorkoutViewResponse, WorkoutWithStyle, PaginatedWorkout,
+    PaginatedWorkoutSearch, WorkoutDetail
 )
+from src.presentation.api.etag import etag_headers, etag_matches, not_modified, weak_etag
+from src.presentation.api.responses import DTOResponse
 
 router = APIRouter(prefix='/workouts', tags=['workouts'])
 
@@ -68,7 +73,7 @@ async def create_workout(workout: WorkoutCreate = Depends(WorkoutCreate.as_form(
             description=workout.description,
             dance_video=workout.dance_video,
             thumbnail_image=CreateUpload(
-                file=thumbnail_image.file.read(),
+                file=await thumbnail_image.read(),
                 filename=thumbnail_image.filename,
                 filedir='workouts/images'
             ),
@@ -85,6 +90,7 @@ async def create_workout(workout: WorkoutCreate = Depends(WorkoutCreate.as_form(
 @router.get('/list',
             dependencies=[Depends(IsAuthenticatedUser())],
             response_model=List[WorkoutWithStyle],
+            deprecated=True,
             responses={
                 status.HTTP_200_OK: {
                     "description": "List of all workouts"
@@ -100,15 +106,83 @@ async def create_workout(workout: WorkoutCreate = Depends(WorkoutCreate.as_form(
                     "description": "No workouts found"
                 }
             },
-            summary='List all workouts')
+            summary='List all workouts, use /workouts/list/paginated instead')
 async def list_workouts(ioc: InteractorFactory = Depends()):
     async with ioc.pick_workout_interactor(lambda i: i.list_workouts) as interactor:
         workouts = await interactor()
     return workouts
 
 
+@router.get('/trending',
+            dependencies=[Depends(IsAuthenticatedUser())],
+            response_model=PaginatedWorkout,
+            response_class=DTOResponse,
+            summary='List trending workouts, optionally within one style')
+async def list_trending_workouts(
+        style_id: Optional[int] = Query(None),
+        page: int = Query(1, ge=1),
+        limit: int = Query(10, ge=1, le=100),
+        ioc: InteractorFactory = Depends()
+):
+    async with ioc.pick_workout_interactor(lambda i: i.list_trending_workouts) as interactor:
+        response = await interactor(style_id, page, limit)
+    return DTOResponse(response)
+
+
+@router.get('/list/paginated',
+            dependencies=[Depends(IsAuthenticatedUser())],
+            response_model=PaginatedWorkout,
+            response_class=DTOResponse,
+            summary='List workouts with filters, sorting and pagination')
+async def list_workouts_paginated(
+        page: int = Query(1, ge=1),
+        limit: int = Query(10, ge=1, le=100),
+        style_id: Optional[int] = Query(None),
+        level: Optional[LevelsEnum] = Query(None),
+        min_duration: Optional[int] = Query(None, ge=0),
+        max_duration: Optional[int] = Query(None, ge=0),
+        min_calories: Optional[int] = Query(None, ge=0),
+        max_calories: Optional[int] = Query(None, ge=0),
+        tag_ids: List[int] = Query([]),
+        tags_match: TagMatchEnum = Query(TagMatchEnum.ANY),
+        sort: WorkoutSortEnum = Query(WorkoutSortEnum.NEWEST),
+        ioc: InteractorFactory = Depends()
+):
+    filters = WorkoutFilter(
+        style_id=style_id,
+        level=level,
+        min_duration=min_duration,
+        max_duration=max_duration,
+        min_calories=min_calories,
+        max_calories=max_calories,
+        tag_ids=tag_ids,
+        tags_match=tags_match,
+        sort=sort
+    )
+    async with ioc.pick_workout_interactor(lambda i: i.list_paginated_workouts) as interactor:
+        response = await interactor(filters, page, limit)
+    return DTOResponse(response)
+
+
+@router.get('/search',
+            dependencies=[Depends(IsAuthenticatedUser())],
+            response_model=PaginatedWorkoutSearch,
+            response_class=DTOResponse,
+            summary='Full-text search over workouts, tags and authors')
+async def search_workouts(
+        q: str = Query(..., min_length=1, max_length=200),
+        page: int = Query(1, ge=1),
+        limit: int = Query(10, ge=1, le=100),
+        ioc: InteractorFactory = Depends()
+):
+    async with ioc.pick_workout_interactor(lambda i: i.search_workouts) as interactor:
+        response = await interactor(q, page, limit)
+    return DTOResponse(response)
+
+
 @router.get('/{workout_id}',
-            response_model=Workout,
+            response_model=WorkoutDetail,
+            response_class=DTOResponse,
             status_code=status.HTTP_200_OK,
             dependencies=[Depends(IsAuthenticatedUser())],
             responses={
@@ -127,10 +201,22 @@ async def list_workouts(ioc: InteractorFactory = Depends()):
                 }
             },
             summary='Get a workout, accessible to authenticated users')
-async def get_workout(workout_id: int, ioc: InteractorFactory = Depends()):
+async def get_workout(
+        workout_id: int,
+        if_none_match: Optional[str] = Header(None),
+        ioc: InteractorFactory = Depends()
+):
+    if if_none_match:
+        async with ioc.pick_workout_interactor(lambda i: i.get_workout_version) as interactor:
+            version = await interactor(workout_id)
+        etag = weak_etag(version) if version is not None else None
+        if etag is not None and etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
     async with ioc.pick_workout_interactor(lambda i: i.get_workout) as interactor:
-        workout = await interactor(workout_id)
-    return workout
+        detail = await interactor(workout_id)
+    # Tagged with the version cached with the body, which may trail the live one.
+    return DTOResponse(detail.workout, headers=etag_headers(weak_etag(detail.version)))
 
 
 @router.put('/{workout_id}/update',
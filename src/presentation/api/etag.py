@@ -0,0 +1,34 @@
+from hashlib import blake2b
+from typing import Dict, Optional
+
+from starlette import status
+from starlette.responses import Response
+
+# Clients may keep a copy but must revalidate it on every use.
+CACHE_CONTROL = 'private, no-cache'
+
+
+def weak_etag(version: str, *params: object) -> str:
+    """Weak ETag for a resource version as seen through the given query parameters."""
+    digest = blake2b(version.encode(), digest_size=12)
+    for param in params:
+        digest.update(b'\0' + str(param).encode())
+    return f'W/"{digest.hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison, as If-None-Match requires."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    opaque = etag.removeprefix('W/')
+    return any(candidate.strip().removeprefix('W/') == opaque for candidate in if_none_match.split(','))
+
+
+def etag_headers(etag: str) -> Dict[str, str]:
+    return {'ETag': etag, 'Cache-Control': CACHE_CONTROL}
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=etag_headers(etag))
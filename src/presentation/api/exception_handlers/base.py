@@ -1,3 +1,5 @@
+import logging
+
 from fastapi import Request, responses
 from fastapi.exceptions import RequestValidationError
 
@@ -8,11 +10,15 @@ from src.domain.exceptions.base import (
     NotFound, BadRequest
 )
 
+logger = logging.getLogger(__name__)
+
 
 async def unprocessable_entity_exception_handler(
         _request: Request, _exc: RequestValidationError
 ) -> responses.JSONResponse:
-    print(_exc)
+    # Only where and why: `input` and `ctx` carry the submitted values, passwords included.
+    errors = [{key: error[key] for key in ('loc', 'type', 'msg') if key in error} for error in _exc.errors()]
+    logger.info("Invalid request to %s %s: %s", _request.method, _request.url.path, errors)
     return responses.JSONResponse(
         status_code=422,
         content={"detail": "The provided data is invalid. Please check your input."},
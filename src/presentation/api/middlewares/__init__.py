@@ -1,8 +1,31 @@
 from fastapi import FastAPI
 
+from src.adapters.database.tracing import QueryTracer
+from src.main.config import settings
+from src.presentation.api.middlewares.metrics_middleware import MetricsMiddleware
+from src.presentation.api.middlewares.query_tracing_middleware import QueryTracingMiddleware
+from src.presentation.api.middlewares.server_timing_middleware import ServerTimingMiddleware
 from src.presentation.api.middlewares.upload_file_middleware import MaxFileSizeMiddleware
 
 
-def include_middlewares(app: FastAPI) -> None:
+def include_middlewares(app: FastAPI, query_tracer: QueryTracer) -> None:
     """Include middlewares main app"""
     app.add_middleware(MaxFileSizeMiddleware)
+    if settings.server_timing.sample_rate > 0:
+        # Inside the query tracing middleware, which provides the DB time.
+        app.add_middleware(
+            ServerTimingMiddleware,
+            sample_rate=settings.server_timing.sample_rate,
+            timing_allow_origin=settings.cors.frontend_url
+        )
+    app.add_middleware(QueryTracingMiddleware, tracer=query_tracer)
+    if settings.profiling.directory:
+        # Optional dependency, installed with the `profiling` extra.
+        from src.presentation.api.middlewares.profiling_middleware import ProfilingMiddleware
+        app.add_middleware(
+            ProfilingMiddleware,
+            settings=settings.profiling,
+            jwt_secret_key=settings.jwt.jwt_secret_key
+        )
+    # Added last so it is outermost and times the whole stack.
+    app.add_middleware(MetricsMiddleware)
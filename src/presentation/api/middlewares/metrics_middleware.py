@@ -0,0 +1,63 @@
+import time
+from typing import Dict
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.adapters.observability.metrics import HTTP_REQUEST_DURATION, HTTP_REQUESTS_IN_PROGRESS
+
+
+class MetricsMiddleware:
+    """Records latency per route template and the number of requests in flight.
+
+    A plain ASGI middleware rather than BaseHTTPMiddleware, so it adds no task
+    or body buffering per request. The route is read after the call, when
+    routing has put the matched route (or, for plain Starlette routes and
+    mounts, its endpoint) into the scope. Paths that match nothing share one
+    label to keep the series count bounded.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self._templates: Dict[object, str] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message['type'] == 'http.response.start':
+                status = message['status']
+            await send(message)
+
+        HTTP_REQUESTS_IN_PROGRESS.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            HTTP_REQUESTS_IN_PROGRESS.dec()
+            HTTP_REQUEST_DURATION.labels(
+                scope['method'], self._route_template(scope), str(status)
+            ).observe(time.perf_counter() - started)
+
+    def _route_template(self, scope: Scope) -> str:
+        route = scope.get('route')
+        if route is not None:
+            return route.path
+        endpoint = scope.get('endpoint')
+        if endpoint is None:
+            return 'unmatched'
+        template = self._templates.get(endpoint)
+        if template is None:
+            template = next(
+                (
+                    route.path for route in scope['app'].routes
+                    if getattr(route, 'endpoint', None) is endpoint or getattr(route, 'app', None) is endpoint
+                ),
+                'unmatched'
+            )
+            self._templates[endpoint] = template
+        return template
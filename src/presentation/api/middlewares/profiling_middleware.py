@@ -0,0 +1,86 @@
+import logging
+from pathlib import Path
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.adapters.database.provider import get_user_repository
+from src.adapters.observability.profiling import ProfileStore
+from src.application.user.jwt import JWTService
+from src.domain.exceptions.jwt import JWTError
+from src.main.config import ProfilingSettings
+from src.presentation.api.dependencies.permissions.user import ADMIN_ROLES
+
+PROFILE_HEADER = 'x-profile'
+PROFILE_ID_HEADER = 'x-profile-id'
+
+logger = logging.getLogger(__name__)
+
+
+class ProfilingMiddleware:
+    """Profiles a request sent with `X-Profile: 1` by an admin or manager.
+
+    The profile id comes back in `X-Profile-Id`; the file is written to the
+    profiles directory once the response is sent. Requests without the header
+    only pay for the header lookup. One profiled request per worker runs at a
+    time, further ones are served unprofiled.
+    """
+
+    def __init__(self, app: ASGIApp, settings: ProfilingSettings, jwt_secret_key: str):
+        self.app = app
+        self._store = ProfileStore(Path(settings.directory), settings.max_profiles, settings.interval_ms / 1000)
+        self._jwt_service = JWTService(jwt_secret_key)
+        self._active = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        headers = Headers(scope=scope)
+        if headers.get(PROFILE_HEADER) != '1' or self._active:
+            await self.app(scope, receive, send)
+            return
+        # Claim the slot before the admin check awaits, or two requests could both pass it.
+        self._active = True
+        try:
+            is_admin = await self._is_admin(scope, headers)
+        except BaseException:
+            self._active = False
+            raise
+        if not is_admin:
+            self._active = False
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = self._store.new_id()
+
+        async def send_with_id(message: Message) -> None:
+            if message['type'] == 'http.response.start':
+                MutableHeaders(scope=message).append(PROFILE_ID_HEADER, profile_id)
+            await send(message)
+
+        try:
+            profiler = self._store.start(f"{scope['method']} {scope['path']}")
+        except BaseException:
+            self._active = False
+            raise
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            profiler.stop()
+            self._active = False
+            path = await run_in_threadpool(self._store.save, profile_id, profiler)
+            logger.info("Profiled %s %s into %s", scope['method'], scope['path'], path)
+
+    async def _is_admin(self, scope: Scope, headers: Headers) -> bool:
+        scheme, _, token = headers.get('authorization', '').partition(' ')
+        if scheme.lower() != 'bearer' or not token:
+            return False
+        try:
+            user_id = self._jwt_service.decode(token).sub
+        except JWTError:
+            return False
+        async with scope['app'].state.ioc.get_session_factory()() as session:
+            user = await get_user_repository(session).get(user_id)
+        return user is not None and user.role in ADMIN_ROLES
@@ -0,0 +1,19 @@
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.adapters.database.tracing import QueryTracer
+
+
+class QueryTracingMiddleware:
+    """Runs each HTTP request inside its own query trace."""
+
+    def __init__(self, app: ASGIApp, tracer: QueryTracer):
+        self.app = app
+        self.tracer = tracer
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        with self.tracer.trace(f"{scope['method']} {scope['path']}"):
+            await self.app(scope, receive, send)
@@ -0,0 +1,44 @@
+import random
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.adapters.database.tracing import current_trace
+from src.adapters.observability.timing import RequestTimings, collect_timings
+
+
+class ServerTimingMiddleware:
+    """Adds a `Server-Timing` breakdown to a sampled share of responses.
+
+    Must run inside QueryTracingMiddleware, whose trace supplies the DB time.
+    `Timing-Allow-Origin` lets the frontend read the header through the
+    Resource Timing API as well as in devtools.
+    """
+
+    def __init__(self, app: ASGIApp, sample_rate: float, timing_allow_origin: str):
+        self.app = app
+        self._sample_rate = sample_rate
+        self._timing_allow_origin = timing_allow_origin
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope['type'] != 'http' or random.random() >= self._sample_rate:
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        trace = current_trace()
+        started = time.perf_counter()
+
+        async def send_with_timing(message: Message) -> None:
+            if message['type'] == 'http.response.start':
+                if trace is not None and trace.queries:
+                    timings.add('db', trace.duration)
+                timings.add('total', time.perf_counter() - started)
+                headers = MutableHeaders(scope=message)
+                headers.append('Server-Timing', timings.header())
+                headers.append('Timing-Allow-Origin', self._timing_allow_origin)
+            await send(message)
+
+        with collect_timings(timings):
+            await self.app(scope, receive, send_with_timing)
@@ -0,0 +1,30 @@
+from typing import Any
+
+import orjson
+from starlette.responses import Response
+
+from src.adapters.observability.timing import timed
+
+
+class DTOResponse(Response):
+    """JSON response for DTOs the application layer already built and trusts.
+
+    Dataclasses, enums and datetimes are encoded by orjson directly, without
+    `jsonable_encoder` or validation against `response_model`. Endpoints still
+    declare `response_model` for the OpenAPI schema, so the declared model must
+    list exactly the fields the DTO carries.
+    """
+    media_type = 'application/json'
+
+    def render(self, content: Any) -> bytes:
+        with timed('serialize'):
+            return orjson.dumps(content)
+
+
+class RawJSONResponse(Response):
+    """JSON document that is already encoded, e.g. built by the database.
+
+    The bytes are sent as-is. As with `DTOResponse`, the declared
+    `response_model` only documents the shape.
+    """
+    media_type = 'application/json'
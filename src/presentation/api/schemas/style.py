@@ -27,7 +27,9 @@ class StyleWorkout(BaseModel):
 
 
 class StyleWithWorkouts(Style):
+    workouts_count: int
     workouts: List[StyleWorkout]
+    next_cursor: Optional[str] = None
 
     class Config:
         populate_by_name = True
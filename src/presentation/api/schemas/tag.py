@@ -25,7 +25,9 @@ class TagWorkout(BaseModel):
 
 
 class TagWorkouts(Tag):
+    workouts_count: int
     workouts: List[TagWorkout]
+    next_cursor: Optional[str] = None
 
 
 class PaginatedTag(BaseModel):
@@ -35,5 +37,9 @@ class PaginatedTag(BaseModel):
     page_size: int
 
 
+class PaginatedPopularTag(PaginatedTag):
+    version: Optional[str] = None
+
+
 class TagList(BaseModel):
     tags: List[Tag]
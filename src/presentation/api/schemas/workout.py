@@ -32,10 +32,16 @@ class WorkoutViewResponse(BaseModel):
     views_count: int
 
 
+class WorkoutDetail(Workout):
+    author_name: str
+    style_id: int
+    views_count: int
+
+
 class WorkoutStyle(BaseModel):
     id: int
     name: str
-    image_url: str
+    image_url: Optional[str]
 
 
 class WorkoutWithStyle(Workout):
@@ -45,6 +51,46 @@ class WorkoutWithStyle(Workout):
         from_attributes = True
 
 
+class WorkoutCard(BaseModel):
+    id: int
+    name: str
+    calories: int
+    duration: int
+    level: LevelsEnum
+    thumbnail_image: str
+    author_name: str
+    views_count: int
+    style_id: int
+    style: WorkoutStyle
+    tags: List[WorkoutTag]
+
+
+class PaginatedWorkout(BaseModel):
+    items: List[WorkoutCard]
+    total_count: int
+    page: int
+    page_size: int
+
+
+class WorkoutSearchHit(WorkoutDetail):
+    style: WorkoutStyle
+    rank: float
+    name_highlight: str = Field(
+        ..., description="HTML-escaped name with matched words wrapped in <mark>; safe to render as HTML"
+    )
+    description_highlight: str = Field(
+        ..., description="HTML-escaped description fragments with matched words wrapped in <mark>; "
+                         "safe to render as HTML"
+    )
+
+
+class PaginatedWorkoutSearch(BaseModel):
+    items: List[WorkoutSearchHit]
+    total_count: int
+    page: int
+    page_size: int
+
+
 class WorkoutCreate(AsForm):
     name: str = Field(...)
     calories: int = Field(...)
@@ -0,0 +1,77 @@
+"""Shared fixtures.
+
+Settings are read from the environment when `src.main.config` is imported;
+`.env.example` fills in whatever the environment leaves unset, so the suite
+runs without a .env file. Fixtures that need Postgres skip the test when the
+configured server cannot be reached.
+"""
+import os
+import uuid
+from pathlib import Path
+
+
+def _load_env_defaults(path: Path) -> None:
+    for line in path.read_text().splitlines():
+        line = line.strip()
+        if line and not line.startswith('#') and '=' in line:
+            key, value = line.split('=', 1)
+            os.environ.setdefault(key, value)
+
+
+_load_env_defaults(Path(__file__).resolve().parent.parent / '.env.example')
+
+import pytest  # noqa: E402
+from sqlalchemy import delete  # noqa: E402
+from sqlalchemy.ext.asyncio import create_async_engine  # noqa: E402
+
+from src.adapters.database.models import UserOrm  # noqa: E402
+from src.adapters.database.session import get_async_sessionmaker  # noqa: E402
+from src.adapters.database.tracing import QueryTracer  # noqa: E402
+from src.adapters.observability.loop_monitor import LoopLagMonitor  # noqa: E402
+from src.main.config import settings  # noqa: E402
+from src.main.ioc import IoC  # noqa: E402
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return 'asyncio'
+
+
+@pytest.fixture
+def query_tracer() -> QueryTracer:
+    return QueryTracer(slow_query_s=settings.query_tracing.slow_query_ms / 1000, repeat_threshold=2)
+
+
+@pytest.fixture
+async def loop_monitor():
+    """A monitor on the test's loop, with stacks, for `assert_loop_not_blocked`."""
+    monitor = LoopLagMonitor(interval=0.01, block_threshold=0.1, capture_stacks=True)
+    monitor.start()
+    yield monitor
+    await monitor.stop()
+
+
+@pytest.fixture
+async def ioc(query_tracer: QueryTracer):
+    engine = create_async_engine(settings.db.db_uri)
+    try:
+        async with engine.connect():
+            pass
+    except OSError as e:
+        await engine.dispose()
+        pytest.skip(f"Postgres is not reachable: {e}")
+    query_tracer.install(engine)
+    ioc = IoC(session_factory=await get_async_sessionmaker(engine))
+    yield ioc
+    await ioc.close_cache()
+    await engine.dispose()
+
+
+@pytest.fixture
+async def user_email(ioc: IoC):
+    """A fresh address; the user signed up with it is deleted afterwards."""
+    email = f'test-{uuid.uuid4().hex[:12]}@example.com'
+    yield email
+    async with ioc.get_session_factory()() as session:
+        await session.execute(delete(UserOrm).where(UserOrm.email == email))
+        await session.commit()
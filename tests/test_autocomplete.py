@@ -0,0 +1,70 @@
+import random
+
+import pytest
+
+from src.application.tag.autocomplete import TagAutocompleteIndex, index_key
+from src.domain.entities.tag import DBTag
+
+
+def ranked(tags, prefix, limit):
+    matches = [tag for tag in tags.values() if index_key(tag.name).startswith(index_key(prefix))]
+    matches.sort(key=lambda tag: (-tag.usages, tag.name, tag.id))
+    return [(tag.id, tag.usages) for tag in matches[:limit]]
+
+
+@pytest.mark.parametrize('compact_after', [10, 100_000])
+def test_complete_matches_a_full_ranking_through_changes(compact_after):
+    rng = random.Random(7)
+
+    def name(tag_id):
+        return rng.choice('aab') + ''.join(rng.choice('bcX') for _ in range(rng.randint(0, 3))) + str(tag_id)
+
+    tags = {tag_id: DBTag(id=tag_id, name=name(tag_id), usages=rng.randint(0, 30)) for tag_id in range(1, 600)}
+    index = TagAutocompleteIndex(compact_after=compact_after)
+    index.load(tags.values())
+
+    for _ in range(80):
+        tag_id = rng.randint(1, 700)
+        roll = rng.random()
+        if roll < 0.4:
+            tags[tag_id] = DBTag(id=tag_id, name=name(tag_id), usages=rng.randint(0, 40))
+            index.upsert(tags[tag_id])
+        elif roll < 0.8 and tag_id in tags:
+            tags[tag_id] = DBTag(id=tag_id, name=tags[tag_id].name, usages=rng.randint(0, 40))
+            index.set_usages(tag_id, tags[tag_id].usages)
+        elif tag_id in tags:
+            del tags[tag_id]
+            index.remove(tag_id)
+
+        for prefix in ('', 'a', 'B', 'ab', 'aX'):
+            for limit in (1, 10):
+                assert [(tag.id, tag.usages) for tag in index.complete(prefix, limit)] == \
+                    ranked(tags, prefix, limit)
+        assert len(index) == len(tags)
+
+
+def test_overlay_is_folded_into_the_base_past_the_threshold():
+    index = TagAutocompleteIndex(compact_after=10)
+    index.load(DBTag(id=tag_id, name=f'base{tag_id}', usages=tag_id) for tag_id in range(40))
+    for tag_id in range(40, 60):
+        index.upsert(DBTag(id=tag_id, name=f'new{tag_id}', usages=1))
+
+    assert len(index) == 60
+    assert len(index._overrides) <= 10
+    assert [tag.name for tag in index.complete('new', 2)] == ['new40', 'new41']
+    assert [tag.name for tag in index.complete('base', 2)] == ['base39', 'base38']
+
+
+def test_reload_keeps_changes_made_after_the_base_was_read():
+    now = [100.0]
+    index = TagAutocompleteIndex(clock=lambda: now[0])
+    snapshot = [DBTag(id=1, name='salsa', usages=3), DBTag(id=2, name='samba', usages=5)]
+    index.load(snapshot, as_of=90.0)
+
+    now[0] = 110.0
+    index.upsert(DBTag(id=1, name='salsa', usages=9))
+    index.load(snapshot, as_of=105.0)
+    assert [(tag.id, tag.usages) for tag in index.complete('s')] == [(1, 9), (2, 5)]
+
+    index.load(snapshot, as_of=120.0)
+    assert [(tag.id, tag.usages) for tag in index.complete('s')] == [(2, 5), (1, 3)]
@@ -0,0 +1,199 @@
+import asyncio
+
+import pytest
+
+from src.adapters.cache.memory import MemoryCache
+from src.application.common.cache import ReadThroughCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def redis_client():
+    fakeredis = pytest.importorskip('fakeredis')
+    pytest.importorskip('lupa')
+    return fakeredis.FakeAsyncRedis()
+
+
+@pytest.fixture
+def redis_cache(redis_client):
+    from src.adapters.cache.redis import RedisCache
+    return RedisCache(redis_client)
+
+
+@pytest.mark.anyio
+async def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryCache(max_entries=2)
+    await cache.set('a', 1, 60)
+    await cache.set('b', 2, 60)
+    assert await cache.get('a') == 1
+    await cache.set('c', 3, 60)
+
+    assert await cache.get('b') is None
+    assert await cache.get('a') == 1
+    assert await cache.get('c') == 3
+    assert cache.evictions == 1
+    assert len(cache) == 2
+
+
+@pytest.mark.anyio
+async def test_memory_cache_expires_entries_after_ttl():
+    clock = FakeClock()
+    cache = MemoryCache(clock=clock)
+    await cache.set('a', 1, 10, tags=['t'])
+
+    clock.now += 9.9
+    assert await cache.get('a') == 1
+    clock.now += 0.1
+    assert await cache.get('a') is None
+    assert len(cache) == 0
+
+
+@pytest.mark.anyio
+async def test_memory_cache_invalidates_by_tag():
+    cache = MemoryCache()
+    await cache.set('a', 1, 60, tags=['x'])
+    await cache.set('b', 2, 60, tags=['x', 'y'])
+    await cache.set('c', 3, 60, tags=['y'])
+
+    await cache.invalidate_tags(['x'])
+    assert await cache.get('a') is None
+    assert await cache.get('b') is None
+    assert await cache.get('c') == 3
+
+
+@pytest.mark.anyio
+async def test_memory_cache_skips_writes_behind_an_invalidation():
+    cache = MemoryCache()
+    generation = await cache.generation(['x'])
+    await cache.invalidate_tags(['x'])
+    await cache.set('a', 1, 60, tags=['x'], generation=generation)
+    assert await cache.get('a') is None
+
+    generation = await cache.generation(['x'])
+    await cache.clear()
+    await cache.set('a', 1, 60, tags=['x'], generation=generation)
+    assert await cache.get('a') is None
+
+
+@pytest.mark.anyio
+async def test_read_through_coalesces_concurrent_misses():
+    cache = ReadThroughCache(MemoryCache(), ttl=60)
+    calls = 0
+    release = asyncio.Event()
+
+    async def load():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return 'value'
+
+    tasks = [asyncio.create_task(cache.get_or_load('k', load)) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*tasks) == ['value'] * 5
+    assert calls == 1
+    assert (cache.stats.misses, cache.stats.coalesced) == (1, 4)
+    assert await cache.get_or_load('k', load) == 'value'
+    assert cache.stats.hits == 1
+
+
+@pytest.mark.anyio
+async def test_read_through_does_not_store_a_load_that_overlaps_an_invalidation():
+    cache = ReadThroughCache(MemoryCache(), ttl=60)
+
+    async def stale_load():
+        await cache.invalidate('t')
+        return 'stale'
+
+    assert await cache.get_or_load('k', stale_load, tags=['t']) == 'stale'
+
+    async def fresh_load():
+        return 'fresh'
+
+    assert await cache.get_or_load('k', fresh_load, tags=['t']) == 'fresh'
+    assert cache.stats.misses == 2
+
+
+@pytest.mark.anyio
+async def test_read_through_does_not_cache_not_found():
+    cache = ReadThroughCache(MemoryCache(), ttl=60)
+    calls = 0
+
+    async def load():
+        nonlocal calls
+        calls += 1
+        return None
+
+    assert await cache.get_or_load('k', load) is None
+    assert await cache.get_or_load('k', load) is None
+    assert calls == 2
+
+
+@pytest.mark.anyio
+async def test_read_through_invalidate_drops_tagged_entries():
+    cache = ReadThroughCache(MemoryCache(), ttl=60)
+
+    async def load():
+        return 'value'
+
+    await cache.get_or_load('a', load, tags=['x'])
+    await cache.get_or_load('b', load, tags=['y'])
+    await cache.invalidate('x')
+
+    await cache.get_or_load('a', load, tags=['x'])
+    await cache.get_or_load('b', load, tags=['y'])
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.invalidations) == (1, 3, 1)
+
+
+@pytest.mark.anyio
+async def test_read_through_invalidate_logs_backend_failures(caplog):
+    class BrokenCache(MemoryCache):
+        async def invalidate_tags(self, tags):
+            raise ConnectionError('cache is down')
+
+    cache = ReadThroughCache(BrokenCache(), ttl=60)
+    await cache.invalidate('x')
+    assert 'Failed to invalidate cache tags' in caplog.text
+
+
+@pytest.mark.anyio
+async def test_redis_cache_round_trips_and_invalidates_by_tag(redis_cache):
+    await redis_cache.set('a', {'id': 1}, 60, tags=['x'])
+    await redis_cache.set('b', [2], 60, tags=['x', 'y'])
+    await redis_cache.set('c', 3, 60, tags=['y'])
+    assert await redis_cache.get('a') == {'id': 1}
+
+    await redis_cache.invalidate_tags(['x'])
+    assert await redis_cache.get('a') is None
+    assert await redis_cache.get('b') is None
+    assert await redis_cache.get('c') == 3
+
+
+@pytest.mark.anyio
+async def test_redis_cache_skips_writes_behind_another_workers_invalidation(redis_client, redis_cache):
+    from src.adapters.cache.redis import RedisCache
+    other_worker = RedisCache(redis_client)
+    generation = await redis_cache.generation(['x'])
+    await other_worker.invalidate_tags(['x'])
+
+    await redis_cache.set('a', 1, 60, tags=['x'], generation=generation)
+    assert await redis_cache.get('a') is None
+
+    await redis_cache.set('a', 2, 60, tags=['x'], generation=await redis_cache.generation(['x']))
+    assert await redis_cache.get('a') == 2
+
+
+@pytest.mark.anyio
+async def test_redis_cache_expires_entries_with_their_ttl(redis_cache):
+    await redis_cache.set('a', 1, 0.05, tags=['x'])
+    assert await redis_cache.get('a') == 1
+    await asyncio.sleep(0.1)
+    assert await redis_cache.get('a') is None
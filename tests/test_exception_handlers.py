@@ -0,0 +1,26 @@
+import logging
+
+import pytest
+from fastapi.exceptions import RequestValidationError
+from starlette.requests import Request
+
+from src.presentation.api.exception_handlers.base import unprocessable_entity_exception_handler
+
+
+@pytest.mark.anyio
+async def test_validation_errors_are_logged_without_the_submitted_values(caplog):
+    request = Request({'type': 'http', 'method': 'POST', 'path': '/api/v1/users/sign-in', 'headers': []})
+    exc = RequestValidationError([{
+        'type': 'string_too_short',
+        'loc': ('body', 'password'),
+        'msg': 'String should have at least 8 characters',
+        'input': 'hunter2',
+        'ctx': {'min_length': 8},
+    }])
+
+    with caplog.at_level(logging.INFO, logger='src.presentation.api.exception_handlers.base'):
+        response = await unprocessable_entity_exception_handler(request, exc)
+
+    assert response.status_code == 422
+    assert 'password' in caplog.text
+    assert 'hunter2' not in caplog.text
@@ -0,0 +1,47 @@
+import asyncio
+import time
+
+import pytest
+
+from src.adapters.observability.loop_monitor import LoopBlocked, LoopLagMonitor, assert_loop_not_blocked
+from src.application.user.dto import CreateUserDTO, UserLoginDTO
+from src.main.ioc import IoC
+
+pytestmark = pytest.mark.anyio
+
+PASSWORD = 'correct horse battery staple 42'
+
+
+def _block(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+async def test_awaiting_does_not_count_as_blocking(loop_monitor: LoopLagMonitor):
+    with assert_loop_not_blocked(loop_monitor):
+        await asyncio.sleep(0.3)
+        await asyncio.to_thread(_block, 0.3)
+
+
+async def test_blocking_call_fails_and_is_named(loop_monitor: LoopLagMonitor):
+    with pytest.raises(LoopBlocked) as blocked:
+        with assert_loop_not_blocked(loop_monitor):
+            _block(0.3)
+            # Give the monitor a tick to wake up late and report.
+            await asyncio.sleep(0.05)
+    assert 'in _block' in str(blocked.value)
+    assert 'time.sleep(seconds)' in str(blocked.value)
+
+
+async def test_stall_outside_the_block_is_not_reported(loop_monitor: LoopLagMonitor):
+    _block(0.3)
+    await asyncio.sleep(0.05)
+    with assert_loop_not_blocked(loop_monitor):
+        await asyncio.sleep(0.1)
+
+
+async def test_password_hashing_stays_off_the_loop(ioc: IoC, loop_monitor: LoopLagMonitor, user_email: str):
+    with assert_loop_not_blocked(loop_monitor):
+        async with ioc.pick_user_interactor(lambda i: i.sign_up_client) as sign_up:
+            await sign_up(CreateUserDTO(email=user_email, password=PASSWORD))
+        async with ioc.pick_user_interactor(lambda i: i.sign_in) as sign_in:
+            await sign_in(UserLoginDTO(email=user_email, password=PASSWORD))
@@ -0,0 +1,61 @@
+import pytest
+
+from src.adapters.database.tracing import QueryTracer, assert_query_budget, fingerprint
+from src.application.user.dto import CreateStaffDTO, CreateUserDTO, UserLoginDTO
+from src.domain.value_objects.staff import StaffRole
+from src.main.ioc import IoC
+
+PASSWORD = 'correct horse battery staple 42'
+
+
+@pytest.mark.parametrize('statement, expected', [
+    (
+        'SELECT tags.id FROM tags WHERE tags.id IN ($1::INTEGER, $2::INTEGER, $3::INTEGER)',
+        'SELECT tags.id FROM tags WHERE tags.id IN (...)',
+    ),
+    (
+        'SELECT tags.id FROM tags WHERE tags.id IN ($1::INTEGER)',
+        'SELECT tags.id FROM tags WHERE tags.id IN (...)',
+    ),
+    (
+        'SELECT * FROM workout_view_events WHERE viewed_at >= $1::TIMESTAMP WITH TIME ZONE LIMIT $2::INTEGER',
+        'SELECT * FROM workout_view_events WHERE viewed_at >= ? LIMIT ?',
+    ),
+    (
+        "SELECT 'a''b'::VARCHAR, 10 FROM tags WHERE tags.name = ANY ($1::VARCHAR(50)[])",
+        'SELECT ?, ? FROM tags WHERE tags.name = ANY (...)',
+    ),
+    (
+        'SELECT tags.id FROM tags WHERE tags.id IN (%(id_1_1)s, %(id_1_2)s)',
+        'SELECT tags.id FROM tags WHERE tags.id IN (...)',
+    ),
+])
+def test_fingerprint_folds_placeholders_and_casts(statement, expected):
+    assert fingerprint(statement) == expected
+
+
+def test_fingerprint_is_the_same_for_any_list_length():
+    assert fingerprint('SELECT 1 FROM t WHERE id IN ($1::INTEGER)') == \
+        fingerprint('SELECT 1 FROM t WHERE id IN ($1::INTEGER, $2::INTEGER, $3::INTEGER, $4::INTEGER)')
+
+
+@pytest.mark.anyio
+async def test_sign_in_stays_within_query_budget(ioc: IoC, query_tracer: QueryTracer, user_email: str):
+    async with ioc.pick_user_interactor(lambda i: i.sign_up_client) as sign_up:
+        await sign_up(CreateUserDTO(email=user_email, password=PASSWORD))
+
+    with assert_query_budget(query_tracer, 6, max_repeats=1):
+        async with ioc.pick_user_interactor(lambda i: i.sign_in) as sign_in:
+            token = await sign_in(UserLoginDTO(email=user_email, password=PASSWORD))
+    assert token.role == 'CLIENT'
+
+
+@pytest.mark.anyio
+async def test_staff_sign_in_stays_within_query_budget(ioc: IoC, query_tracer: QueryTracer, user_email: str):
+    async with ioc.pick_user_interactor(lambda i: i.sign_up_staff) as sign_up:
+        await sign_up(CreateStaffDTO(email=user_email, password=PASSWORD, role=StaffRole.ADMIN))
+
+    with assert_query_budget(query_tracer, 6, max_repeats=1):
+        async with ioc.pick_user_interactor(lambda i: i.sign_in) as sign_in:
+            token = await sign_in(UserLoginDTO(email=user_email, password=PASSWORD), staff_auth=True)
+    assert token.role == StaffRole.ADMIN.value